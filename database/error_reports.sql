@@ -22,6 +22,14 @@ CREATE INDEX IF NOT EXISTS idx_error_reports_error_type ON error_reports(error_t
 CREATE INDEX IF NOT EXISTS idx_error_reports_user_id ON error_reports(user_id);
 CREATE INDEX IF NOT EXISTS idx_error_reports_question_id ON error_reports(question_id);
 
+-- Keyset pagination of the dashboard error list on (timestamp, id), newest first
+CREATE INDEX IF NOT EXISTS idx_error_reports_timestamp_id ON error_reports(timestamp DESC, id DESC);
+
+-- Trigram indexes so the dashboard's substring search (ILIKE '%term%') on the messages does not scan the table
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_error_reports_error_message_trgm ON error_reports USING GIN (error_message gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_error_reports_user_message_trgm ON error_reports USING GIN (user_message gin_trgm_ops);
+
 -- RLS (Row Level Security) setup - you might want to adjust this based on your security needs
 ALTER TABLE error_reports ENABLE ROW LEVEL SECURITY;
 
@@ -31,4 +39,278 @@ CREATE POLICY "Allow anon users to insert error reports" ON error_reports
 
 -- Example policy to allow service role to access all records
 CREATE POLICY "Allow service role access to error reports" ON error_reports
-    FOR ALL USING ((select auth.role()) = 'service_role');
\ No newline at end of file
+    FOR ALL USING ((select auth.role()) = 'service_role');
+-- ============================================
+-- Error fingerprinting and grouping
+-- Reports of the same crash get the same fingerprint, and error_groups keeps one aggregate row
+-- per fingerprint, so the dashboard can list a few hundred groups instead of every report.
+-- normalize_error_text/error_report_fingerprint are mirrored by ErrorFingerprinter in
+-- scripts/admin_analytics.py; keep both in sync.
+-- ============================================
+ALTER TABLE error_reports ADD COLUMN IF NOT EXISTS fingerprint TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_error_reports_fingerprint_timestamp ON error_reports(fingerprint, timestamp);
+
+-- Set when a report or group is resolved in the dashboard; resolved reports and groups are hidden there
+ALTER TABLE error_reports ADD COLUMN IF NOT EXISTS resolved_at TIMESTAMP WITH TIME ZONE;
+
+CREATE TABLE IF NOT EXISTS error_groups (
+    fingerprint TEXT PRIMARY KEY,
+    error_type TEXT NOT NULL,
+    error_message TEXT NOT NULL, -- Message of the most recent report in the group
+    report_count BIGINT NOT NULL DEFAULT 0,
+    affected_users BIGINT NOT NULL DEFAULT 0,
+    app_versions TEXT[] NOT NULL DEFAULT '{}',
+    first_seen TIMESTAMP WITH TIME ZONE NOT NULL,
+    last_seen TIMESTAMP WITH TIME ZONE NOT NULL,
+    resolved_at TIMESTAMP WITH TIME ZONE -- Set once every report of the group is resolved
+);
+
+CREATE INDEX IF NOT EXISTS idx_error_groups_last_seen ON error_groups(last_seen);
+
+-- Users seen per group, so affected_users can be counted incrementally
+CREATE TABLE IF NOT EXISTS error_group_users (
+    fingerprint TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    
+    PRIMARY KEY (fingerprint, user_id)
+);
+
+ALTER TABLE error_groups ENABLE ROW LEVEL SECURITY;
+ALTER TABLE error_group_users ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow service role access to error groups" ON error_groups
+    FOR ALL USING ((select auth.role()) = 'service_role');
+
+CREATE POLICY "Allow service role access to error group users" ON error_group_users
+    FOR ALL USING ((select auth.role()) = 'service_role');
+
+-- Function: Strip the parts of an error text that differ between devices and runs
+-- (ids, memory addresses, file system paths, line:column numbers and long numbers)
+CREATE OR REPLACE FUNCTION normalize_error_text(p_text TEXT)
+RETURNS TEXT AS $$
+    SELECT btrim(
+        regexp_replace(
+        regexp_replace(
+        regexp_replace(
+        regexp_replace(
+        regexp_replace(
+        regexp_replace(COALESCE(p_text, ''),
+            '[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}', '<id>', 'g'),
+            '0x[0-9a-fA-F]+', '<addr>', 'g'),
+            '(file://)?(/[^/\s:()]+)+/', '<path>/', 'g'),
+            '(\.[A-Za-z]+):[0-9]+(:[0-9]+)?', '\1', 'g'),
+            '[0-9]{5,}', '<n>', 'g'),
+            '\s+', ' ', 'g'));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Function: Signature of an error report; only the top 10 lines of the stack trace are used
+CREATE OR REPLACE FUNCTION error_report_fingerprint(p_error_type TEXT, p_error_message TEXT, p_stack_trace TEXT)
+RETURNS TEXT AS $$
+    SELECT md5(
+        COALESCE(p_error_type, '') || E'\n' ||
+        normalize_error_text(p_error_message) || E'\n' ||
+        normalize_error_text(array_to_string((string_to_array(COALESCE(p_stack_trace, ''), E'\n'))[1:10], E'\n'))
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Trigger: Fingerprint every new report and fold it into its group
+CREATE OR REPLACE FUNCTION error_reports_assign_group()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_new_users INTEGER := 0;
+BEGIN
+    NEW.fingerprint := error_report_fingerprint(NEW.error_type, NEW.error_message, NEW.stack_trace);
+    
+    IF NEW.user_id IS NOT NULL THEN
+        INSERT INTO error_group_users (fingerprint, user_id)
+        VALUES (NEW.fingerprint, NEW.user_id)
+        ON CONFLICT DO NOTHING;
+        GET DIAGNOSTICS v_new_users = ROW_COUNT;
+    END IF;
+    
+    INSERT INTO error_groups AS g (fingerprint, error_type, error_message, report_count, affected_users, app_versions, first_seen, last_seen)
+    VALUES (
+        NEW.fingerprint, NEW.error_type, NEW.error_message, 1, v_new_users,
+        CASE WHEN NEW.app_version IS NULL THEN '{}'::TEXT[] ELSE ARRAY[NEW.app_version] END,
+        NEW.timestamp, NEW.timestamp
+    )
+    ON CONFLICT (fingerprint) DO UPDATE SET
+        report_count = g.report_count + 1,
+        affected_users = g.affected_users + EXCLUDED.affected_users,
+        app_versions = CASE
+            WHEN NEW.app_version IS NULL OR NEW.app_version = ANY(g.app_versions) THEN g.app_versions
+            ELSE g.app_versions || NEW.app_version
+        END,
+        error_message = CASE WHEN EXCLUDED.last_seen >= g.last_seen THEN EXCLUDED.error_message ELSE g.error_message END,
+        first_seen = LEAST(g.first_seen, EXCLUDED.first_seen),
+        last_seen = GREATEST(g.last_seen, EXCLUDED.last_seen),
+        resolved_at = NULL; -- A new report reopens a resolved group
+    
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+DROP TRIGGER IF EXISTS error_reports_assign_group ON error_reports;
+CREATE TRIGGER error_reports_assign_group
+    BEFORE INSERT ON error_reports
+    FOR EACH ROW EXECUTE FUNCTION error_reports_assign_group();
+
+-- Function: Fingerprint existing reports and rebuild all groups from scratch
+-- Run once after installing the trigger or after changing the normalization. Returns the number of groups.
+CREATE OR REPLACE FUNCTION rebuild_error_groups()
+RETURNS INTEGER AS $$
+DECLARE
+    v_groups INTEGER;
+BEGIN
+    UPDATE error_reports r
+    SET fingerprint = error_report_fingerprint(r.error_type, r.error_message, r.stack_trace)
+    WHERE r.fingerprint IS DISTINCT FROM error_report_fingerprint(r.error_type, r.error_message, r.stack_trace);
+    
+    DELETE FROM error_group_users;
+    DELETE FROM error_groups;
+    
+    INSERT INTO error_group_users (fingerprint, user_id)
+    SELECT DISTINCT r.fingerprint, r.user_id
+    FROM error_reports r
+    WHERE r.user_id IS NOT NULL;
+    
+    INSERT INTO error_groups (fingerprint, error_type, error_message, report_count, affected_users, app_versions, first_seen, last_seen, resolved_at)
+    SELECT
+        r.fingerprint,
+        MIN(r.error_type),
+        (ARRAY_AGG(r.error_message ORDER BY r.timestamp DESC))[1],
+        COUNT(*),
+        COUNT(DISTINCT r.user_id),
+        COALESCE(ARRAY_AGG(DISTINCT r.app_version) FILTER (WHERE r.app_version IS NOT NULL), '{}'),
+        MIN(r.timestamp),
+        MAX(r.timestamp),
+        CASE WHEN BOOL_AND(r.resolved_at IS NOT NULL) THEN MAX(r.resolved_at) END
+    FROM error_reports r
+    GROUP BY r.fingerprint;
+    
+    GET DIAGNOSTICS v_groups = ROW_COUNT;
+    RETURN v_groups;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+-- Only the service role may rebuild the groups; PostgREST would otherwise expose it to anon clients
+REVOKE EXECUTE ON FUNCTION rebuild_error_groups() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION rebuild_error_groups() TO service_role;
+
+-- Function: Recount the given groups from their remaining reports; groups without reports are removed
+CREATE OR REPLACE FUNCTION refresh_error_groups(p_fingerprints TEXT[])
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM error_group_users u
+    WHERE u.fingerprint = ANY(p_fingerprints)
+      AND NOT EXISTS (SELECT 1 FROM error_reports r WHERE r.fingerprint = u.fingerprint AND r.user_id = u.user_id);
+    
+    DELETE FROM error_groups g
+    WHERE g.fingerprint = ANY(p_fingerprints)
+      AND NOT EXISTS (SELECT 1 FROM error_reports r WHERE r.fingerprint = g.fingerprint);
+    
+    UPDATE error_groups g
+    SET report_count = s.report_count,
+        affected_users = s.affected_users,
+        app_versions = s.app_versions,
+        first_seen = s.first_seen,
+        last_seen = s.last_seen
+    FROM (
+        SELECT
+            r.fingerprint,
+            COUNT(*) AS report_count,
+            COUNT(DISTINCT r.user_id) AS affected_users,
+            COALESCE(ARRAY_AGG(DISTINCT r.app_version) FILTER (WHERE r.app_version IS NOT NULL), '{}') AS app_versions,
+            MIN(r.timestamp) AS first_seen,
+            MAX(r.timestamp) AS last_seen
+        FROM error_reports r
+        WHERE r.fingerprint = ANY(p_fingerprints)
+        GROUP BY r.fingerprint
+    ) s
+    WHERE g.fingerprint = s.fingerprint;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+-- Only called by the delete trigger below and the service role
+REVOKE EXECUTE ON FUNCTION refresh_error_groups(TEXT[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_error_groups(TEXT[]) TO service_role;
+
+-- Trigger: Keep the groups of deleted reports accurate, however the reports were deleted
+CREATE OR REPLACE FUNCTION error_reports_refresh_deleted_groups()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_error_groups(ARRAY(
+        SELECT DISTINCT d.fingerprint FROM deleted_reports d WHERE d.fingerprint IS NOT NULL
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+DROP TRIGGER IF EXISTS error_reports_refresh_deleted_groups ON error_reports;
+CREATE TRIGGER error_reports_refresh_deleted_groups
+    AFTER DELETE ON error_reports
+    REFERENCING OLD TABLE AS deleted_reports
+    FOR EACH STATEMENT EXECUTE FUNCTION error_reports_refresh_deleted_groups();
+
+-- ============================================
+-- Bulk triage for the admin dashboard
+-- ============================================
+CREATE INDEX IF NOT EXISTS idx_error_reports_app_version ON error_reports(app_version);
+
+-- Function: Delete or resolve every report matching all given conditions in one statement
+-- p_action is 'delete' or 'resolve'; at least one condition is required. Resolving marks a group as
+-- resolved once none of its reports are open. Returns the number of reports affected.
+CREATE OR REPLACE FUNCTION triage_error_reports(
+    p_action TEXT,
+    p_ids TEXT[] DEFAULT NULL,
+    p_fingerprint TEXT DEFAULT NULL,
+    p_app_version TEXT DEFAULT NULL,
+    p_before TIMESTAMP WITH TIME ZONE DEFAULT NULL
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_rows INTEGER;
+    v_fingerprints TEXT[];
+BEGIN
+    IF p_ids IS NULL AND p_fingerprint IS NULL AND p_app_version IS NULL AND p_before IS NULL THEN
+        RAISE EXCEPTION 'triage_error_reports needs at least one of p_ids, p_fingerprint, p_app_version or p_before';
+    END IF;
+    
+    IF p_action = 'delete' THEN
+        DELETE FROM error_reports r
+        WHERE (p_ids IS NULL OR r.id = ANY(p_ids))
+          AND (p_fingerprint IS NULL OR r.fingerprint = p_fingerprint)
+          AND (p_app_version IS NULL OR r.app_version = p_app_version)
+          AND (p_before IS NULL OR r.timestamp < p_before);
+        GET DIAGNOSTICS v_rows = ROW_COUNT;
+    ELSIF p_action = 'resolve' THEN
+        WITH resolved AS (
+            UPDATE error_reports r
+            SET resolved_at = NOW()
+            WHERE r.resolved_at IS NULL
+              AND (p_ids IS NULL OR r.id = ANY(p_ids))
+              AND (p_fingerprint IS NULL OR r.fingerprint = p_fingerprint)
+              AND (p_app_version IS NULL OR r.app_version = p_app_version)
+              AND (p_before IS NULL OR r.timestamp < p_before)
+            RETURNING r.fingerprint
+        )
+        SELECT COUNT(*), ARRAY_AGG(DISTINCT resolved.fingerprint) INTO v_rows, v_fingerprints FROM resolved;
+        
+        UPDATE error_groups g
+        SET resolved_at = NOW()
+        WHERE g.fingerprint = ANY(v_fingerprints)
+          AND g.resolved_at IS NULL
+          AND NOT EXISTS (SELECT 1 FROM error_reports r WHERE r.fingerprint = g.fingerprint AND r.resolved_at IS NULL);
+    ELSE
+        RAISE EXCEPTION 'Unknown triage action: %', p_action;
+    END IF;
+    
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+-- Only the service role (the admin dashboard) may triage; PostgREST would otherwise expose it to anon clients
+REVOKE EXECUTE ON FUNCTION triage_error_reports(TEXT, TEXT[], TEXT, TEXT, TIMESTAMP WITH TIME ZONE)
+    FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION triage_error_reports(TEXT, TEXT[], TEXT, TEXT, TIMESTAMP WITH TIME ZONE) TO service_role;
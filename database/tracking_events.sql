@@ -31,4 +31,220 @@ WITH CHECK (true);
 -- Policy to allow service role access to tracking events
 CREATE POLICY "Allow service role access to tracking events" ON tracking_events
 FOR ALL TO service_role
-USING (true);
\ No newline at end of file
+USING (true);
+
+-- ============================================
+-- Daily rollup of tracking events
+-- One row per (day, event_name, event_type, platform, app_version) so dashboard charts
+-- do not have to scan the raw events. Kept up to date by refresh_tracking_events_daily().
+-- ============================================
+CREATE TABLE IF NOT EXISTS tracking_events_daily (
+    day DATE NOT NULL, -- UTC day of the events
+    event_name TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    platform TEXT NOT NULL DEFAULT '', -- '' when unknown, so the column can be part of the key
+    app_version TEXT NOT NULL DEFAULT '', -- '' when unknown
+    event_count BIGINT NOT NULL,
+    unique_users BIGINT NOT NULL, -- Distinct users within this row only; not additive across rows
+    refreshed_at TIMESTAMP WITH TIME ZONE DEFAULT NOW() NOT NULL,
+    
+    PRIMARY KEY (day, event_name, event_type, platform, app_version)
+);
+
+CREATE INDEX IF NOT EXISTS idx_tracking_events_daily_event_name_day ON tracking_events_daily(event_name, day);
+
+ALTER TABLE tracking_events_daily ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Allow service role access to tracking events daily" ON tracking_events_daily
+FOR ALL TO service_role
+USING (true);
+
+-- Function: Recompute the rollup from p_since (a UTC day) up to yesterday
+-- Only complete UTC days are rolled up: tracking_feature_daily() reads the raw events after the newest
+-- rolled-up day, so today's events stay visible between refreshes. Without p_since it starts one day
+-- before the newest rolled-up day, so late-arriving events of the previous day are picked up too.
+-- Only the affected days of tracking_events are scanned. Returns the number of rollup rows written.
+CREATE OR REPLACE FUNCTION refresh_tracking_events_daily(p_since DATE DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    v_since DATE;
+    v_today DATE := (NOW() AT TIME ZONE 'UTC')::DATE;
+    v_rows INTEGER;
+BEGIN
+    v_since := COALESCE(
+        p_since,
+        (SELECT MAX(d.day) - 1 FROM tracking_events_daily d),
+        (SELECT (MIN(e.timestamp) AT TIME ZONE 'UTC')::DATE FROM tracking_events e)
+    );
+    
+    IF v_since IS NULL OR v_since >= v_today THEN
+        RETURN 0; -- No complete days to roll up yet
+    END IF;
+    
+    DELETE FROM tracking_events_daily WHERE day >= v_since;
+    
+    INSERT INTO tracking_events_daily (day, event_name, event_type, platform, app_version, event_count, unique_users, refreshed_at)
+    SELECT
+        (e.timestamp AT TIME ZONE 'UTC')::DATE,
+        e.event_name,
+        e.event_type,
+        COALESCE(e.platform, ''),
+        COALESCE(e.app_version, ''),
+        COUNT(*),
+        COUNT(DISTINCT e.user_id),
+        NOW()
+    FROM tracking_events e
+    WHERE e.timestamp >= (v_since::TIMESTAMP AT TIME ZONE 'UTC')
+      AND e.timestamp < (v_today::TIMESTAMP AT TIME ZONE 'UTC')
+    GROUP BY 1, 2, 3, 4, 5;
+    
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    RETURN v_rows;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public, pg_temp;
+
+-- Only the service role (the admin dashboard and pg_cron) may refresh; it rescans tracking_events
+REVOKE EXECUTE ON FUNCTION refresh_tracking_events_daily(DATE) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION refresh_tracking_events_daily(DATE) TO service_role;
+
+-- Optional: keep the rollup fresh with pg_cron (enable the extension in Supabase first)
+-- SELECT cron.schedule('refresh-tracking-events-daily', '*/15 * * * *', 'SELECT refresh_tracking_events_daily()');
+
+-- ============================================
+-- Aggregation functions for the admin dashboard
+-- These let the dashboard fetch per-feature summaries instead of the raw event stream
+-- ============================================
+
+-- Function: Usage per feature (event_name), optionally filtered by event type and time range
+CREATE OR REPLACE FUNCTION tracking_feature_overview(
+    p_event_type TEXT DEFAULT NULL,
+    p_from TIMESTAMP WITH TIME ZONE DEFAULT NULL,
+    p_to TIMESTAMP WITH TIME ZONE DEFAULT NULL
+)
+RETURNS TABLE (
+    event_name TEXT,
+    usage_count BIGINT,
+    unique_users BIGINT,
+    last_used TIMESTAMP WITH TIME ZONE
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        e.event_name,
+        COUNT(*) AS usage_count,
+        COUNT(DISTINCT e.user_id) AS unique_users,
+        MAX(e.timestamp) AS last_used
+    FROM tracking_events e
+    WHERE (p_event_type IS NULL OR e.event_type = p_event_type)
+      AND (p_from IS NULL OR e.timestamp >= p_from)
+      AND (p_to IS NULL OR e.timestamp <= p_to)
+    GROUP BY e.event_name
+    ORDER BY e.event_name;
+END;
+$$ LANGUAGE plpgsql STABLE SET search_path = public, pg_temp;
+
+-- Function: Totals for a single feature
+CREATE OR REPLACE FUNCTION tracking_feature_summary(p_event_name TEXT)
+RETURNS TABLE (
+    total_events BIGINT,
+    unique_users BIGINT,
+    first_used TIMESTAMP WITH TIME ZONE,
+    last_used TIMESTAMP WITH TIME ZONE
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        COUNT(*) AS total_events,
+        COUNT(DISTINCT e.user_id) AS unique_users,
+        MIN(e.timestamp) AS first_used,
+        MAX(e.timestamp) AS last_used
+    FROM tracking_events e
+    WHERE e.event_name = p_event_name;
+END;
+$$ LANGUAGE plpgsql STABLE SET search_path = public, pg_temp;
+
+-- Function: Daily event counts for a single feature per event type, platform and app version
+-- Reads finished days from tracking_events_daily and only aggregates the raw events after the last rolled-up day
+CREATE OR REPLACE FUNCTION tracking_feature_daily(p_event_name TEXT)
+RETURNS TABLE (
+    day DATE,
+    event_type TEXT,
+    platform TEXT,
+    app_version TEXT,
+    event_count BIGINT
+) AS $$
+DECLARE
+    v_last_rolled_up_day DATE;
+BEGIN
+    SELECT MAX(d.day) INTO v_last_rolled_up_day FROM tracking_events_daily d;
+    
+    RETURN QUERY
+    SELECT d.day, d.event_type, NULLIF(d.platform, ''), NULLIF(d.app_version, ''), d.event_count
+    FROM tracking_events_daily d
+    WHERE d.event_name = p_event_name
+    UNION ALL
+    SELECT
+        (e.timestamp AT TIME ZONE 'UTC')::DATE,
+        e.event_type,
+        e.platform,
+        e.app_version,
+        COUNT(*)
+    FROM tracking_events e
+    WHERE e.event_name = p_event_name
+      AND (v_last_rolled_up_day IS NULL
+           OR e.timestamp >= ((v_last_rolled_up_day + 1)::TIMESTAMP AT TIME ZONE 'UTC'))
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4;
+END;
+$$ LANGUAGE plpgsql STABLE SET search_path = public, pg_temp;
+
+-- Function: Event counts for a single feature broken down by event type, platform, app version and day
+-- Returns one row per (dimension, value); `day` is only set for the 'day' dimension
+CREATE OR REPLACE FUNCTION tracking_feature_breakdown(p_event_name TEXT)
+RETURNS TABLE (
+    dimension TEXT,
+    value TEXT,
+    day DATE,
+    event_count BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    WITH feature_days AS (
+        SELECT f.day AS event_day, f.event_type, f.platform, f.app_version, f.event_count AS day_count
+        FROM tracking_feature_daily(p_event_name) f
+    )
+    SELECT 'event_type'::TEXT, f.event_type, NULL::DATE, SUM(f.day_count)::BIGINT FROM feature_days f GROUP BY f.event_type
+    UNION ALL
+    SELECT 'platform'::TEXT, f.platform, NULL::DATE, SUM(f.day_count)::BIGINT FROM feature_days f WHERE f.platform IS NOT NULL GROUP BY f.platform
+    UNION ALL
+    SELECT 'app_version'::TEXT, f.app_version, NULL::DATE, SUM(f.day_count)::BIGINT FROM feature_days f WHERE f.app_version IS NOT NULL GROUP BY f.app_version
+    UNION ALL
+    SELECT 'day'::TEXT, NULL::TEXT, f.event_day, SUM(f.day_count)::BIGINT FROM feature_days f GROUP BY f.event_day
+    ORDER BY 1, 4 DESC;
+END;
+$$ LANGUAGE plpgsql STABLE SET search_path = public, pg_temp;
+
+-- Index used by the per-feature functions above
+CREATE INDEX IF NOT EXISTS idx_tracking_events_event_name_timestamp ON tracking_events(event_name, timestamp);
+
+-- Function: Distinct sessions per hour and app version since p_from
+-- Denominator of the admin dashboard's error rates. A session active in several hours counts in each of them.
+CREATE OR REPLACE FUNCTION tracking_sessions_hourly(p_from TIMESTAMP WITH TIME ZONE)
+RETURNS TABLE (
+    hour TIMESTAMP WITH TIME ZONE,
+    app_version TEXT,
+    sessions BIGINT
+) AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        date_trunc('hour', e.timestamp, 'UTC') AS hour,
+        e.app_version,
+        COUNT(DISTINCT e.session_id) AS sessions
+    FROM tracking_events e
+    WHERE e.timestamp >= p_from
+      AND e.session_id IS NOT NULL
+    GROUP BY 1, 2
+    ORDER BY 1, 2;
+END;
+$$ LANGUAGE plpgsql STABLE SET search_path = public, pg_temp;
@@ -0,0 +1,1055 @@
+#!/usr/bin/env python3
+"""
+Analytics core of the BijbelQuiz admin dashboard
+Loading, filtering and aggregating tracking events and error reports, without any UI.
+admin_dashboard.py is a Tk client over this module; the command line interface below runs
+the same reports headless (e.g. from cron) and writes them as JSON, CSV or Parquet.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from admin_backends import create_client, is_missing_function, local_database
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # The local tracking cache is optional
+    pq = None
+
+# Number of tracking events requested per keyset page (matches the Supabase max-rows default)
+TRACKING_PAGE_SIZE = 1000
+
+# Number of error groups listed, most recently seen first
+ERROR_GROUPS_LIMIT = 500
+
+# How far back error rates are analyzed
+ERROR_RATE_WINDOW = timedelta(days=7)
+
+# Columns of the error_groups table
+ERROR_GROUP_COLUMNS = ['fingerprint', 'error_type', 'error_message', 'report_count', 'affected_users',
+                       'app_versions', 'first_seen', 'last_seen']
+
+# Where the local copy of tracking_events is kept between dashboard sessions
+TRACKING_CACHE_DIR = Path(
+    os.getenv('ADMIN_DASHBOARD_CACHE_DIR', Path.home() / '.cache' / 'bijbelquiz-admin')
+) / 'tracking_events'
+
+
+class TrackingCache:
+    """Persistent local copy of tracking_events, partitioned into one Parquet file per day.
+    
+    meta.json keeps the (timestamp, id) watermark of the newest cached event, so a sync only
+    has to fetch the rows that arrived after it. Requires pyarrow; without it the cache is
+    simply disabled.
+    """
+    
+    def __init__(self, directory=TRACKING_CACHE_DIR):
+        self.directory = Path(directory)
+        self.meta_path = self.directory / 'meta.json'
+    
+    @classmethod
+    def for_database(cls, database=None):
+        """Cache of the configured backend; a local database gets its own cache next to its file"""
+        database = local_database(database)
+        return cls(Path(f'{database}.cache') / 'tracking_events') if database else cls()
+    
+    @property
+    def available(self):
+        return pq is not None
+    
+    def partitions(self):
+        """Day partition files, oldest first"""
+        return sorted(self.directory.glob('day=*.parquet'))
+    
+    def watermark(self):
+        """(timestamp, id) of the newest cached event, or None when the cache is empty"""
+        if not self.available or not self.meta_path.exists():
+            return None
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            return tuple(meta['watermark'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def load(self):
+        """Read all cached partitions into one DataFrame, or None when nothing is cached"""
+        if not self.available or self.watermark() is None:
+            return None
+        
+        files = self.partitions()
+        if not files:
+            return None
+        
+        frames = [pq.read_table(path, memory_map=True).to_pandas() for path in files]
+        return pd.concat(frames, ignore_index=True)
+    
+    def append(self, new_df, watermark):
+        """Add freshly synced events to their day partitions and move the watermark forward"""
+        if not self.available or new_df is None or new_df.empty:
+            return
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        
+        new_df = new_df.copy()
+        # JSONB properties arrive as dicts; store them as JSON text so every partition has the same schema
+        if 'properties' in new_df.columns:
+            new_df['properties'] = new_df['properties'].map(
+                lambda value: value if value is None or isinstance(value, str) else json.dumps(value)
+            )
+        
+        days = new_df['timestamp'].dt.tz_convert('UTC').dt.strftime('%Y-%m-%d')
+        for day, part in new_df.groupby(days):
+            path = self.directory / f'day={day}.parquet'
+            if path.exists():
+                existing = pq.read_table(path).to_pandas()
+                part = pd.concat([existing, part], ignore_index=True)
+            # A sync interrupted before the watermark was saved may fetch a few rows twice
+            part = part.drop_duplicates('id', keep='last')
+            
+            tmp_path = path.with_suffix('.tmp')
+            part.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'watermark': list(watermark), 'updated_at': datetime.now().isoformat()}, f)
+    
+    def clear(self):
+        """Remove all cached partitions and the watermark"""
+        for path in self.partitions():
+            path.unlink()
+        if self.meta_path.exists():
+            self.meta_path.unlink()
+
+
+class PropertiesStore:
+    """Columnar view of the tracking events' properties payloads.
+    
+    Payloads arrive as dicts from Supabase and as JSON text from the local cache. They are
+    decoded once, the first time a property is needed, and flattened into one column per
+    dotted key ('quiz.score'). The most common keys are typed up front (numeric, boolean or
+    text); the others are typed the first time they are used.
+    """
+    
+    FILTER_PATTERN = re.compile(r'^\s*([\w.\-]+)\s*(==|!=|>=|<=|=|>|<)\s*(.*?)\s*$')
+    SCALAR_KINDS = ('string', 'integer', 'floating', 'mixed-integer-float', 'boolean', 'empty')
+    
+    def __init__(self, payloads, top_keys=32):
+        self.payloads = payloads
+        self.top_keys = top_keys
+        self.raw = None
+        self.key_counts = None
+        self.typed_columns = {}
+    
+    @staticmethod
+    def decode(payload):
+        """A single properties payload as a dict (empty when missing or malformed)"""
+        if isinstance(payload, dict):
+            return payload
+        if not payload or not isinstance(payload, str):
+            return {}
+        try:
+            value = json.loads(payload)
+        except ValueError:
+            return {}
+        return value if isinstance(value, dict) else {}
+    
+    @classmethod
+    def decode_all(cls, payloads):
+        """Decode all payloads, parsing the JSON text ones in a single json.loads call"""
+        decoded = [payload if isinstance(payload, dict) else {} for payload in payloads]
+        texts = [(i, payload) for i, payload in enumerate(payloads) if isinstance(payload, str) and payload]
+        if not texts:
+            return decoded
+        
+        try:
+            values = json.loads('[' + ','.join(text for _, text in texts) + ']')
+        except ValueError:
+            # A malformed payload spoils the batch; fall back to one at a time
+            values = [cls.decode(text) for _, text in texts]
+        if len(values) != len(texts):
+            values = [cls.decode(text) for _, text in texts]
+        
+        for (i, _), value in zip(texts, values):
+            if isinstance(value, dict):
+                decoded[i] = value
+        return decoded
+    
+    @classmethod
+    def flatten(cls, frame, prefix=''):
+        """Expand columns holding nested objects into dotted columns; lists are kept as JSON text"""
+        parts = []
+        for name in frame.columns:
+            values = frame[name]
+            kind = pd.api.types.infer_dtype(values, skipna=True)
+            if kind not in cls.SCALAR_KINDS and values.map(lambda value: isinstance(value, dict)).any():
+                nested = pd.DataFrame.from_records(
+                    [value if isinstance(value, dict) else {} for value in values], index=frame.index)
+                parts.append(cls.flatten(nested, f"{prefix}{name}."))
+                continue
+            if kind not in cls.SCALAR_KINDS:
+                values = values.map(lambda value: json.dumps(value) if isinstance(value, list) else value)
+            parts.append(values.rename(f"{prefix}{name}").to_frame())
+        return pd.concat(parts, axis=1) if parts else pd.DataFrame(index=frame.index)
+    
+    @staticmethod
+    def typed(values):
+        """Give a column of raw property values the narrowest type that fits all of them"""
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind == 'boolean':
+            return values.astype('boolean')
+        if kind in ('integer', 'floating', 'mixed-integer-float'):
+            return pd.to_numeric(values)
+        if kind in ('string', 'empty'):
+            return values
+        return values.map(lambda value: value if value is None or pd.isna(value) else str(value))
+    
+    def build(self):
+        """Decode and flatten every payload once"""
+        if self.raw is not None:
+            return
+        
+        records = self.decode_all(self.payloads.tolist())
+        self.raw = self.flatten(pd.DataFrame.from_records(records, index=self.payloads.index))
+        self.key_counts = self.raw.notna().sum().sort_values(ascending=False, kind='stable')
+        for key in self.key_counts.index[:self.top_keys]:
+            self.column(key)
+    
+    def column(self, key):
+        """Typed values of one property for every event (missing where the event lacks it)"""
+        self.build()
+        if key not in self.typed_columns:
+            if key in self.raw.columns:
+                self.typed_columns[key] = self.typed(self.raw[key])
+            else:
+                self.typed_columns[key] = pd.Series(None, index=self.payloads.index, dtype=object)
+        return self.typed_columns[key]
+    
+    def keys(self):
+        """Property keys ordered by how many events carry them"""
+        self.build()
+        return list(self.key_counts.index)
+    
+    def parse_filter(self, expression):
+        """Split 'key=value', 'key>=3', ... into (key, operator, value); None when malformed"""
+        match = self.FILTER_PATTERN.match(expression or '')
+        if not match:
+            return None
+        key, operator, value = match.groups()
+        return key, '==' if operator == '=' else operator, value
+    
+    def mask(self, expression):
+        """Boolean array of the events whose properties satisfy a filter expression"""
+        parsed = self.parse_filter(expression)
+        if parsed is None:
+            raise ValueError(f"Invalid property filter: {expression!r} (expected e.g. score>=5 or mode=daily)")
+        key, operator, text = parsed
+        
+        values = self.column(key)
+        if pd.api.types.is_bool_dtype(values):
+            value = text.lower() in ('1', 'true', 'yes')
+        elif pd.api.types.is_numeric_dtype(values):
+            try:
+                value = float(text)
+            except ValueError:
+                raise ValueError(f"Property {key!r} is numeric, cannot compare it with {text!r}")
+        else:
+            value = text
+        
+        compare = {
+            '==': values.__eq__, '!=': values.__ne__, '>': values.__gt__,
+            '<': values.__lt__, '>=': values.__ge__, '<=': values.__le__,
+        }[operator]
+        result = compare(value)
+        if isinstance(result.dtype, pd.BooleanDtype):
+            result = result.fillna(False)
+        return result.to_numpy(dtype=bool) & values.notna().to_numpy()
+    
+    def describe(self, rows, limit=10):
+        """Per property: how many of the given rows carry it and a short summary of its values"""
+        self.build()
+        lines = []
+        for key in self.keys()[:limit]:
+            values = self.column(key).iloc[rows].dropna()
+            if values.empty:
+                continue
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                summary = f"min {values.min():g}, mean {values.mean():.2f}, max {values.max():g}"
+            else:
+                top = values.astype(str).value_counts().head(3)
+                summary = ", ".join(f"{value} ({count})" for value, count in top.items())
+            lines.append((key, len(values), summary))
+        return lines
+
+
+class TrackingFilterEngine:
+    """Answers the tracking filters from indexes built once per load instead of masking a copy each time.
+    
+    event_name, event_type and platform are encoded as categorical codes, so matching a
+    value is an integer comparison. Timestamps are kept as a sorted int64 array, so a date
+    range is two binary searches. Property filters go through a lazily decoded PropertiesStore.
+    Results are row positions into the loaded DataFrame and are cached per filter tuple; a
+    filter that selects a contiguous block returns a slice.
+    """
+    
+    CATEGORICAL_COLUMNS = ('event_name', 'event_type', 'platform')
+    
+    def __init__(self, df, cache_size=64):
+        self.df = df
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        
+        self.codes = {}
+        self.categories = {}
+        for column in self.CATEGORICAL_COLUMNS:
+            values = df[column] if column in df.columns else pd.Series(None, index=df.index, dtype=object)
+            categorical = pd.Categorical(values)
+            self.codes[column] = categorical.codes
+            self.categories[column] = categorical.categories
+        
+        # Sorted timestamps (as UTC nanoseconds) and the row position of each
+        timestamps = self.to_utc_nanoseconds(df['timestamp'])
+        self.time_order = np.argsort(timestamps, kind='stable')
+        self.sorted_times = timestamps[self.time_order]
+        self.all_rows = np.arange(len(df))
+        
+        payloads = df['properties'] if 'properties' in df.columns else pd.Series(None, index=df.index, dtype=object)
+        self.properties = PropertiesStore(payloads)
+    
+    @staticmethod
+    def to_utc_nanoseconds(timestamps):
+        index = pd.DatetimeIndex(timestamps)
+        if index.tz is None:
+            index = index.tz_localize('UTC')
+        return index.tz_convert('UTC').as_unit('ns').asi8
+    
+    @staticmethod
+    def parse_date(value):
+        """A YYYY-MM-DD filter value as UTC nanoseconds, or None when empty or malformed"""
+        if not value:
+            return None
+        try:
+            day = datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            return None
+        return pd.Timestamp(day, tz='UTC').as_unit('ns').value
+    
+    def positions(self, feature=None, action=None, platform=None, date_from=None, date_to=None, properties=None):
+        """Sorted row positions matching the filters; None or 'All' means no filter on that field"""
+        key = (feature, action, platform, date_from, date_to, properties)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        
+        rows = self.all_rows
+        
+        start = self.parse_date(date_from)
+        end = self.parse_date(date_to)
+        if start is not None or end is not None:
+            low = 0 if start is None else np.searchsorted(self.sorted_times, start, side='left')
+            high = len(self.sorted_times) if end is None else np.searchsorted(self.sorted_times, end, side='right')
+            rows = np.sort(self.time_order[low:max(low, high)])
+        
+        for column, value in (('event_name', feature), ('event_type', action), ('platform', platform)):
+            if not value or value == 'All':
+                continue
+            categories = self.categories[column]
+            if value not in categories:
+                rows = rows[:0]
+                break
+            rows = rows[self.codes[column][rows] == categories.get_loc(value)]
+        
+        if properties and len(rows):
+            rows = rows[self.properties.mask(properties)[rows]]
+        
+        self.cache[key] = rows
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return rows
+    
+    def filter(self, **filters):
+        """Rows of the loaded DataFrame matching the filters, sliced rather than copied when possible"""
+        rows = self.positions(**filters)
+        if len(rows) == len(self.df):
+            return self.df
+        if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+            return self.df.iloc[rows[0]:rows[-1] + 1]
+        return self.df.take(rows)
+
+
+class ErrorFingerprinter:
+    """Signatures that put reports of the same crash into one error group.
+    
+    Mirrors normalize_error_text() and error_report_fingerprint() in database/error_reports.sql:
+    ids, memory addresses, device paths, line numbers and long numbers are stripped from the
+    message and the top of the stack trace before hashing, so identical crashes from different
+    devices get the same fingerprint. Used to group reports locally when the error_groups table
+    is not installed.
+    """
+    
+    STACK_LINES = 10  # Only the top of the stack trace is part of the signature
+    PATTERNS = [
+        (re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'), '<id>'),
+        (re.compile(r'0x[0-9a-fA-F]+'), '<addr>'),
+        (re.compile(r'(?:file://)?(?:/[^/\s:()]+)+/', re.ASCII), '<path>/'),
+        (re.compile(r'(\.[A-Za-z]+):[0-9]+(?::[0-9]+)?'), r'\1'),
+        (re.compile(r'[0-9]{5,}'), '<n>'),
+        (re.compile(r'\s+', re.ASCII), ' '),
+    ]
+    
+    @classmethod
+    def normalize(cls, text):
+        """Error text with the run and device specific parts replaced by placeholders"""
+        text = text or ''
+        for pattern, replacement in cls.PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text.strip(' ')
+    
+    @classmethod
+    def fingerprint(cls, error_type, error_message, stack_trace):
+        """md5 signature of an error report, as computed by error_report_fingerprint()"""
+        stack_top = '\n'.join((stack_trace or '').split('\n')[:cls.STACK_LINES])
+        signature = '\n'.join([error_type or '', cls.normalize(error_message), cls.normalize(stack_top)])
+        return hashlib.md5(signature.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def group(cls, reports):
+        """Aggregate error reports into rows shaped like the error_groups table"""
+        if reports.empty:
+            return pd.DataFrame(columns=ERROR_GROUP_COLUMNS)
+        
+        texts = reports[['error_type', 'error_message', 'stack_trace']].fillna('')
+        reports = reports.assign(fingerprint=[
+            cls.fingerprint(error_type, message, stack)
+            for error_type, message, stack in texts.itertuples(index=False, name=None)
+        ])
+        grouped = reports.sort_values('timestamp', kind='stable').groupby('fingerprint')
+        groups = grouped.agg(
+            error_type=('error_type', 'first'),
+            error_message=('error_message', 'last'),  # Most recent report
+            report_count=('id', 'count'),
+            affected_users=('user_id', 'nunique'),
+            first_seen=('timestamp', 'min'),
+            last_seen=('timestamp', 'max'),
+        )
+        groups['app_versions'] = grouped['app_version'].agg(lambda versions: sorted(versions.dropna().unique()))
+        return groups.reset_index()[ERROR_GROUP_COLUMNS]
+
+
+class ErrorRateAnalyzer:
+    """Hourly error counts per app version and error type, normalized by session-hours.
+    
+    Error reports are counted into hourly buckets as they arrive, so each refresh only has to
+    fetch the reports after error_high_water. Active sessions per hour and version come from
+    tracking_sessions_hourly() (or the loaded tracking events); the hours from sessions_high_water
+    on are replaced on every refresh because the current hour is still filling up. Buckets older
+    than the window are dropped. A session active in several hours counts once in each of them,
+    so summed over hours the denominator is session-hours, not distinct sessions; hourly counts
+    are what lets a refresh add to the totals instead of recounting the whole window.
+    
+    regressions() compares the error rate of each version over the window with the pooled rate
+    of all other versions and flags the versions that are significantly higher (one-sided
+    Poisson z-test).
+    """
+    
+    UNKNOWN = 'unknown'  # Bucket for reports and sessions without app version or error type
+    
+    def __init__(self, window=ERROR_RATE_WINDOW, z_threshold=3.0, min_errors=5):
+        self.window = window
+        self.z_threshold = z_threshold
+        self.min_errors = min_errors  # Fewer errors than this are never flagged
+        self.errors = self.empty_counts(['hour', 'app_version', 'error_type'])
+        self.sessions = self.empty_counts(['hour', 'app_version'])
+        self.error_high_water = None  # (timestamp, id) of the newest counted error report
+        self.sessions_high_water = None  # Hour from which the session counts are refetched
+    
+    @staticmethod
+    def empty_counts(names):
+        index = pd.MultiIndex.from_arrays([pd.DatetimeIndex([], tz='UTC')] + [[]] * (len(names) - 1), names=names)
+        return pd.Series([], index=index, dtype='int64')
+    
+    def window_start(self):
+        return (pd.Timestamp.now(tz='UTC') - self.window).floor('h')
+    
+    def sessions_refresh_start(self):
+        """First hour whose session counts the next refresh has to fetch"""
+        return self.sessions_high_water or self.window_start()
+    
+    def add_errors(self, reports):
+        """Count new error reports (timestamp, app_version, error_type) into their hourly buckets"""
+        if reports.empty:
+            return
+        
+        buckets = pd.DataFrame({
+            'hour': pd.to_datetime(reports['timestamp'], utc=True).dt.floor('h'),
+            'app_version': reports['app_version'].fillna(self.UNKNOWN),
+            'error_type': reports['error_type'].fillna(self.UNKNOWN),
+        })
+        counts = buckets.groupby(['hour', 'app_version', 'error_type']).size()
+        self.errors = self.errors.add(counts, fill_value=0).astype('int64')
+        self.prune()
+    
+    def set_sessions(self, hourly, since):
+        """Replace the session counts from hour `since` on with hourly rows (hour, app_version, sessions)"""
+        hours = self.sessions.index.get_level_values('hour')
+        kept = self.sessions[hours < since]
+        
+        fresh = pd.DataFrame({
+            'hour': pd.to_datetime(hourly['hour'], utc=True),
+            'app_version': hourly['app_version'].fillna(self.UNKNOWN),
+            'sessions': hourly['sessions'].astype('int64'),
+        }).groupby(['hour', 'app_version'])['sessions'].sum()
+        
+        self.sessions = pd.concat([kept, fresh]).sort_index()
+        self.prune()
+    
+    @staticmethod
+    def sessions_from_events(events):
+        """Hourly distinct sessions per app version from raw tracking events, shaped like tracking_sessions_hourly()"""
+        events = events.dropna(subset=['session_id'])
+        return (events
+                .assign(hour=pd.to_datetime(events['timestamp'], utc=True).dt.floor('h'))
+                .groupby(['hour', events['app_version'].fillna(ErrorRateAnalyzer.UNKNOWN)])['session_id']
+                .nunique()
+                .rename('sessions')
+                .reset_index())
+    
+    def prune(self):
+        """Drop the buckets that fell out of the analysis window"""
+        start = self.window_start()
+        self.errors = self.errors[self.errors.index.get_level_values('hour') >= start]
+        self.sessions = self.sessions[self.sessions.index.get_level_values('hour') >= start]
+    
+    def hourly_rates(self, app_version=None):
+        """Errors, sessions and errors per 1000 sessions for every hour of the window, empty hours included"""
+        errors, sessions = self.errors, self.sessions
+        if app_version is not None:
+            errors = errors[errors.index.get_level_values('app_version') == app_version]
+            sessions = sessions[sessions.index.get_level_values('app_version') == app_version]
+        
+        frame = pd.DataFrame({
+            'errors': errors.groupby(level='hour').sum(),
+            'sessions': sessions.groupby(level='hour').sum(),
+        }).fillna(0)
+        if frame.empty:
+            return frame.assign(rate=pd.Series(dtype='float64'))
+        
+        frame = frame.resample('h').sum()
+        frame['rate'] = frame['errors'] / frame['sessions'].where(frame['sessions'] > 0) * 1000
+        return frame
+    
+    def regressions(self, by_error_type=False):
+        """Error rate per version (or per version and error type) against the other versions over the window.
+        
+        Rates are errors per 1000 session-hours. z_score is (errors - expected) / sqrt(expected), where expected
+        is the number of errors the version would have had at the baseline rate.
+        """
+        keys = ['app_version', 'error_type'] if by_error_type else ['app_version']
+        sessions = self.sessions.groupby(level='app_version').sum()
+        errors = self.errors.groupby(level=keys).sum()
+        if not by_error_type:
+            # Versions that had sessions but no errors are part of the comparison too
+            errors = errors.reindex(errors.index.union(sessions.index), fill_value=0)
+            errors.index.name = 'app_version'
+        
+        frame = errors.rename('errors').reset_index()
+        frame['sessions'] = frame['app_version'].map(sessions).fillna(0)
+        
+        # Baseline: the same errors in every other version
+        if by_error_type:
+            baseline_errors = frame.groupby('error_type')['errors'].transform('sum') - frame['errors']
+        else:
+            baseline_errors = frame['errors'].sum() - frame['errors']
+        baseline_sessions = (sessions.sum() - frame['sessions']).where(lambda total: total > 0)
+        baseline_rate = baseline_errors / baseline_sessions
+        
+        with_sessions = frame['sessions'].where(frame['sessions'] > 0)
+        expected = with_sessions * baseline_rate
+        frame['rate'] = frame['errors'] / with_sessions * 1000
+        frame['baseline_rate'] = baseline_rate * 1000
+        frame['z_score'] = (frame['errors'] - expected) / np.sqrt(expected.clip(lower=1))
+        frame['regression'] = (frame['z_score'] > self.z_threshold) & (frame['errors'] >= self.min_errors)
+        return frame.sort_values('z_score', ascending=False, na_position='last').reset_index(drop=True)
+
+
+def never_cancelled():
+    return False
+
+
+def fetch_rpc_rows(client, function, params, cancelled=never_cancelled):
+    """All rows returned by a set-returning Postgres function, fetched one page at a time"""
+    rows = []
+    while not cancelled():
+        page = (client.rpc(function, params)
+                .range(len(rows), len(rows) + TRACKING_PAGE_SIZE - 1)
+                .execute().data)
+        if not page:
+            break
+        rows.extend(page)
+    return rows
+
+
+def fetch_tracking_page(client, after=None, page_size=TRACKING_PAGE_SIZE):
+    """Fetch one page of tracking events ordered by (timestamp, id), starting after the given key"""
+    query = client.table('tracking_events').select('*').order('timestamp').order('id')
+    
+    if after:
+        # Keyset condition: (timestamp, id) > (last_timestamp, last_id)
+        last_timestamp, last_id = after
+        query = query.or_(
+            f'timestamp.gt."{last_timestamp}",'
+            f'and(timestamp.eq."{last_timestamp}",id.gt."{last_id}")'
+        )
+    
+    response = query.limit(page_size).execute()
+    return response.data
+
+
+def sync_tracking_events(client, cache, after=None, read_cache=True, progress=None, cancelled=never_cancelled):
+    """Read the local cache and fetch the events after its watermark (or `after`).
+    
+    Returns (cached_df, new_df, high_water); new events are added to the cache.
+    """
+    cached_df = None
+    high_water = after
+    if read_cache and cache.available:
+        if progress:
+            progress("Reading local tracking cache...")
+        cached_df = cache.load()
+        if cached_df is not None:
+            high_water = cache.watermark()
+    
+    # Page through the table on (timestamp, id), starting at the high-water mark
+    pages = []
+    fetched = 0
+    while client and not cancelled():
+        page = fetch_tracking_page(client, high_water)
+        if not page:
+            break
+        
+        pages.append(pd.DataFrame(page))
+        fetched += len(page)
+        high_water = (page[-1]['timestamp'], page[-1]['id'])
+        if progress:
+            progress(f"Loading tracking data... {fetched} new records")
+    
+    new_df = None
+    if pages:
+        new_df = pd.concat(pages, ignore_index=True)
+        
+        # Format timestamp
+        new_df['timestamp'] = pd.to_datetime(new_df['timestamp'])
+        
+        if not cancelled():
+            cache.append(new_df, high_water)
+    
+    return cached_df, new_df, high_water
+
+
+def merge_tracking_events(frames):
+    """Concatenate loaded tracking event frames, newest first; None when there are none"""
+    frames = [frame for frame in frames if frame is not None]
+    if not frames:
+        return None
+    return (pd.concat(frames, ignore_index=True)
+            .sort_values('timestamp', ascending=False, kind='stable')
+            .reset_index(drop=True))
+
+
+def load_tracking_events(client=None, cache=None):
+    """Every tracking event: the local cache brought up to date, or just the cache without a client"""
+    cache = cache or TrackingCache()
+    cached_df, new_df, _ = sync_tracking_events(client, cache)
+    return merge_tracking_events([cached_df, new_df])
+
+
+def feature_overview_params(action=None, date_from=None, date_to=None):
+    """Parameters for tracking_feature_overview from an action and YYYY-MM-DD dates"""
+    params = {'p_event_type': None, 'p_from': None, 'p_to': None}
+    
+    if action and action != 'All':
+        params['p_event_type'] = action
+    
+    for key, value in (('p_from', date_from), ('p_to', date_to)):
+        if value:
+            try:
+                params[key] = datetime.strptime(value, '%Y-%m-%d').isoformat()
+            except ValueError:
+                pass
+    
+    return params
+
+
+def local_feature_overview(events):
+    """Usage count, unique users and last use per feature, like tracking_feature_overview()"""
+    feature_stats = events.groupby('event_name').agg(
+        usage_count=('id', 'count'),  # Total usage count
+        unique_users=('user_id', 'nunique'),  # Unique users
+        last_used=('timestamp', 'max')  # Last used
+    ).reset_index()
+    return feature_stats.to_dict('records')
+
+
+def fetch_feature_aggregates(client, feature_name):
+    """(summary, breakdown) of a feature from tracking_feature_summary/breakdown"""
+    params = {'p_event_name': feature_name}
+    summary_rows = client.rpc('tracking_feature_summary', params).execute().data
+    breakdown_rows = client.rpc('tracking_feature_breakdown', params).execute().data
+    return server_feature_aggregates(summary_rows, breakdown_rows)
+
+
+def server_feature_aggregates(summary_rows, breakdown_rows):
+    """Convert the results of tracking_feature_summary/breakdown into (summary, breakdown)"""
+    summary = summary_rows[0] if summary_rows else {'total_events': 0}
+    summary = {
+        'total_events': summary.get('total_events') or 0,
+        'unique_users': summary.get('unique_users') or 0,
+        'first_used': pd.to_datetime(summary.get('first_used')),
+        'last_used': pd.to_datetime(summary.get('last_used')),
+    }
+    
+    breakdown = {'event_type': [], 'platform': [], 'app_version': [], 'day': []}
+    for row in breakdown_rows:
+        value = row['day'] if row['dimension'] == 'day' else row['value']
+        breakdown[row['dimension']].append((value, row['event_count']))
+    
+    return summary, breakdown
+
+
+def local_feature_aggregates(feature_df):
+    """Compute (summary, breakdown) for the events of a single feature from the loaded data"""
+    summary = {
+        'total_events': len(feature_df),
+        'unique_users': feature_df['user_id'].nunique(),
+        'first_used': feature_df['timestamp'].min(),
+        'last_used': feature_df['timestamp'].max(),
+    }
+    
+    # value_counts skips NaN platforms and versions, like the server-side breakdown
+    breakdown = {
+        'event_type': list(feature_df['event_type'].value_counts().items()),
+        'platform': list(feature_df['platform'].value_counts().items()),
+        'app_version': list(feature_df['app_version'].value_counts().items()),
+        'day': list(feature_df.groupby(feature_df['timestamp'].dt.date).size().items()),
+    }
+    
+    return summary, breakdown
+
+
+def format_feature_stats(feature_name, summary, breakdown):
+    """Format the statistics of a feature as lines of text"""
+    stats = []
+    stats.append(f"Feature: {feature_name}")
+    stats.append(f"Total Events: {summary['total_events']}")
+    stats.append(f"Unique Users: {summary['unique_users']}")
+    stats.append(f"Date Range: {summary['first_used']} to {summary['last_used']}")
+    
+    # Actions breakdown
+    stats.append("\nEvent Type Breakdown:")
+    for action, count in breakdown['event_type']:
+        stats.append(f"  {action}: {count}")
+    
+    # Daily usage pattern
+    daily_usage = breakdown['day']
+    if len(daily_usage) > 1:
+        peak_day, peak_count = max(daily_usage, key=lambda day_count: day_count[1])
+        daily_average = sum(count for _, count in daily_usage) / len(daily_usage)
+        stats.append(f"\nDaily Average: {daily_average:.2f} events per day")
+        stats.append(f"Peak Day: {peak_day} with {peak_count} events")
+    
+    # Platform breakdown
+    stats.append("\nPlatform Breakdown:")
+    for platform, count in breakdown['platform']:
+        stats.append(f"  {platform}: {count}")
+    
+    # App version breakdown
+    stats.append("\nApp Version Breakdown:")
+    for version, count in breakdown['app_version']:
+        stats.append(f"  {version}: {count}")
+    
+    return stats
+
+
+def breakdown_frame(breakdown):
+    """A feature breakdown as rows of (dimension, value, event_count)"""
+    return pd.DataFrame(
+        [(dimension, str(value), count) for dimension, counts in breakdown.items() for value, count in counts],
+        columns=['dimension', 'value', 'event_count'],
+    )
+
+
+def fetch_feature_daily(client, feature_name, cancelled=never_cancelled):
+    """Daily event counts of a feature per event type, platform and version from tracking_feature_daily()"""
+    rows = fetch_rpc_rows(client, 'tracking_feature_daily', {'p_event_name': feature_name}, cancelled)
+    daily_df = pd.DataFrame(rows, columns=['day', 'event_type', 'platform', 'app_version', 'event_count'])
+    daily_df['day'] = pd.to_datetime(daily_df['day']).dt.date
+    return daily_df
+
+
+def local_feature_daily(feature_df):
+    """Daily event counts of a feature's loaded events, shaped like the tracking_events_daily rollup"""
+    return (feature_df
+            .groupby([feature_df['timestamp'].dt.date.rename('day'), 'event_type', 'platform', 'app_version'], dropna=False)
+            .size()
+            .reset_index(name='event_count'))
+
+
+def fetch_error_groups(client, error_type=None, since=None, show_resolved=False, limit=ERROR_GROUPS_LIMIT):
+    """Most recently seen rows of error_groups, optionally filtered by error type and last_seen >= since"""
+    query = client.table('error_groups').select('*').order('last_seen', desc=True).limit(limit)
+    if error_type:
+        query = query.eq('error_type', error_type)
+    if since:
+        query = query.gte('last_seen', since)
+    if not show_resolved:
+        query = query.is_('resolved_at', 'null')
+    return query.execute().data
+
+
+def group_error_reports(client, error_type=None, since=None, limit=ERROR_GROUPS_LIMIT):
+    """Error groups computed from the reports themselves, for when error_groups is not installed"""
+    columns = ['id', 'timestamp', 'error_type', 'user_id', 'error_message', 'stack_trace', 'app_version']
+    query = client.table('error_reports').select(', '.join(columns))
+    if error_type:
+        query = query.eq('error_type', error_type)
+    if since:
+        query = query.gte('timestamp', since)
+    
+    reports = pd.DataFrame(query.execute().data, columns=columns)
+    groups = ErrorFingerprinter.group(reports)
+    return groups.sort_values('last_seen', ascending=False).head(limit).to_dict('records')
+
+
+def fetch_error_rate_page(client, after=None, since=None, page_size=TRACKING_PAGE_SIZE):
+    """Fetch one page of error reports ordered by (timestamp, id), starting after the given key"""
+    query = (client.table('error_reports').select('id, timestamp, app_version, error_type')
+             .order('timestamp').order('id'))
+    
+    if after:
+        # Keyset condition: (timestamp, id) > (last_timestamp, last_id)
+        last_timestamp, last_id = after
+        query = query.or_(
+            f'timestamp.gt."{last_timestamp}",'
+            f'and(timestamp.eq."{last_timestamp}",id.gt."{last_id}")'
+        )
+    elif since:
+        query = query.gte('timestamp', since)
+    
+    return query.limit(page_size).execute().data
+
+
+def fetch_new_error_reports(client, after=None, since=None, progress=None, cancelled=never_cancelled):
+    """Error reports (id, timestamp, app_version, error_type) after a (timestamp, id) key, and the new key"""
+    pages = []
+    high_water = after
+    while not cancelled():
+        page = fetch_error_rate_page(client, high_water, since)
+        if not page:
+            break
+        pages.append(pd.DataFrame(page))
+        high_water = (page[-1]['timestamp'], page[-1]['id'])
+        if progress:
+            progress(f"Loading error reports... {sum(len(page) for page in pages)} new")
+    
+    errors = pd.concat(pages, ignore_index=True) if pages else pd.DataFrame(
+        columns=['id', 'timestamp', 'app_version', 'error_type'])
+    return errors, high_water
+
+
+def fetch_sessions_hourly(client, since, cancelled=never_cancelled):
+    """Active sessions per hour and app version since a timestamp, from tracking_sessions_hourly()"""
+    rows = fetch_rpc_rows(client, 'tracking_sessions_hourly', {'p_from': since.isoformat()}, cancelled)
+    return pd.DataFrame(rows, columns=['hour', 'app_version', 'sessions'])
+
+
+def write_report(report, output_format='json', output=None):
+    """Write a DataFrame (or, for JSON only, any JSON-serializable value) to a file or stdout"""
+    if output_format == 'parquet':
+        if output is None:
+            raise ValueError("Parquet output needs --output")
+        report.to_parquet(output, index=False)
+        return
+    
+    if output_format == 'csv':
+        text = report.to_csv(index=False)
+    elif isinstance(report, pd.DataFrame):
+        text = report.to_json(orient='records', date_format='iso', indent=2)
+    else:
+        text = json.dumps(report, indent=2, default=str)
+    
+    if output is None:
+        sys.stdout.write(text + ('' if text.endswith('\n') else '\n'))
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+def features_report(client, args):
+    """Usage per feature, from Postgres unless --local is given"""
+    if client is not None and not args.local:
+        params = feature_overview_params(args.action, args.date_from, args.date_to)
+        try:
+            rows = client.rpc('tracking_feature_overview', params).execute().data
+            return pd.DataFrame(rows, columns=['event_name', 'usage_count', 'unique_users', 'last_used'])
+        except Exception as e:
+            # Only a missing function is worth downloading the whole tracking_events table for
+            if not is_missing_function(e):
+                raise
+            print(f"Server-side aggregation unavailable, aggregating locally: {e}", file=sys.stderr)
+    
+    events = load_tracking_events(client, TrackingCache.for_database(args.database))
+    if events is None:
+        return pd.DataFrame(columns=['event_name', 'usage_count', 'unique_users', 'last_used'])
+    
+    engine = TrackingFilterEngine(events)
+    return pd.DataFrame(local_feature_overview(engine.filter(
+        action=args.action, date_from=args.date_from, date_to=args.date_to)))
+
+
+def feature_report(client, args):
+    """Summary and breakdown of one feature"""
+    aggregates = None
+    if client is not None and not args.local:
+        try:
+            aggregates = fetch_feature_aggregates(client, args.feature)
+        except Exception as e:
+            if not is_missing_function(e):
+                raise
+            print(f"Server-side aggregation unavailable, aggregating locally: {e}", file=sys.stderr)
+    
+    if aggregates is not None:
+        summary, breakdown = aggregates
+    else:
+        events = load_tracking_events(client, TrackingCache.for_database(args.database))
+        if events is None:
+            events = pd.DataFrame(columns=['id', 'user_id', 'event_type', 'event_name', 'timestamp',
+                                           'platform', 'app_version'])
+            events['timestamp'] = pd.to_datetime(events['timestamp'])
+        summary, breakdown = local_feature_aggregates(events[events['event_name'] == args.feature])
+    
+    if args.format != 'json':
+        return breakdown_frame(breakdown)
+    return {'feature': args.feature, 'summary': summary, 'breakdown': breakdown_frame(breakdown).to_dict('records')}
+
+
+def error_groups_report(client, args):
+    """Most recently seen error groups"""
+    since = (datetime.now(timezone.utc) - timedelta(days=args.days)).isoformat() if args.days else None
+    try:
+        rows = fetch_error_groups(client, args.error_type, since, args.show_resolved, args.limit)
+    except Exception as e:
+        print(f"Loading error groups failed, grouping reports locally: {e}", file=sys.stderr)
+        rows = group_error_reports(client, args.error_type, since, args.limit)
+    return pd.DataFrame(rows, columns=ERROR_GROUP_COLUMNS)
+
+
+def error_rates_report(client, args):
+    """Error rate per app version over the last days, with suspected regressions flagged"""
+    analyzer = ErrorRateAnalyzer(window=timedelta(days=args.days), z_threshold=args.z_threshold)
+    errors, _ = fetch_new_error_reports(client, since=analyzer.window_start().isoformat())
+    analyzer.add_errors(errors)
+    try:
+        sessions = fetch_sessions_hourly(client, analyzer.window_start())
+    except Exception as e:
+        if not is_missing_function(e):
+            raise
+        print(f"Loading hourly sessions failed, counting them in the tracking events: {e}", file=sys.stderr)
+        events = load_tracking_events(client, TrackingCache.for_database(args.database))
+        if events is None:
+            events = pd.DataFrame(columns=['timestamp', 'session_id', 'app_version'])
+        recent = events[pd.to_datetime(events['timestamp'], utc=True) >= analyzer.window_start()]
+        sessions = ErrorRateAnalyzer.sessions_from_events(recent)
+    analyzer.set_sessions(sessions, analyzer.window_start())
+    return analyzer.regressions(by_error_type=args.by_error_type)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BijbelQuiz admin analytics (headless)")
+    parser.add_argument('--format', choices=['json', 'csv', 'parquet'], default='json', help="Output format")
+    parser.add_argument('--output', '-o', help="Output file (default: stdout; required for parquet)")
+    parser.add_argument('--database', help="Local SQLite database to use instead of Supabase "
+                                           "(default: $ADMIN_DASHBOARD_DATABASE)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    subparsers.add_parser("sync", help="Bring the local tracking cache up to date")
+    
+    parser_seed = subparsers.add_parser("seed", help="Fill the local database with synthetic events and errors")
+    parser_seed.add_argument('--events', type=int, default=100000, help="Number of tracking events")
+    parser_seed.add_argument('--errors', type=int, default=1000, help="Approximate number of error reports")
+    parser_seed.add_argument('--days', type=int, default=30, help="Spread the rows over the last N days")
+    parser_seed.add_argument('--seed', type=int, help="Random seed, for reproducible data")
+    
+    parser_features = subparsers.add_parser("features", help="Usage per feature")
+    parser_features.add_argument('--action', help="Only this event type")
+    parser_features.add_argument('--from', dest='date_from', help="First day (YYYY-MM-DD)")
+    parser_features.add_argument('--to', dest='date_to', help="Last day (YYYY-MM-DD)")
+    parser_features.add_argument('--local', action='store_true', help="Aggregate the local tracking cache instead of in Postgres")
+    
+    parser_feature = subparsers.add_parser("feature", help="Summary and breakdown of one feature")
+    parser_feature.add_argument('feature', help="Feature (event_name)")
+    parser_feature.add_argument('--local', action='store_true', help="Aggregate the local tracking cache instead of in Postgres")
+    
+    parser_groups = subparsers.add_parser("error-groups", help="Most recently seen error groups")
+    parser_groups.add_argument('--error-type', help="Only this error type")
+    parser_groups.add_argument('--days', type=int, help="Only groups seen in the last N days")
+    parser_groups.add_argument('--limit', type=int, default=ERROR_GROUPS_LIMIT, help="Maximum number of groups")
+    parser_groups.add_argument('--show-resolved', action='store_true', help="Include resolved groups")
+    
+    parser_rates = subparsers.add_parser("error-rates", help="Error rate per app version with regressions flagged")
+    parser_rates.add_argument('--days', type=int, default=ERROR_RATE_WINDOW.days, help="Analysis window in days")
+    parser_rates.add_argument('--by-error-type', action='store_true', help="Compare per error type")
+    parser_rates.add_argument('--z-threshold', type=float, default=3.0, help="z-score above which a version is flagged")
+    
+    args = parser.parse_args()
+    
+    if args.command == "seed" and not local_database(args.database):
+        print("Seeding needs a local database (--database)", file=sys.stderr)
+        return 1
+    
+    offline = args.command in ('features', 'feature') and args.local
+    try:
+        client = create_client(args.database)
+    except Exception as e:
+        if not offline:
+            print(f"Failed to connect to Supabase: {e}", file=sys.stderr)
+            return 1
+        client = None
+    
+    if args.command == "seed":
+        report = client.seed(args.events, args.errors, args.days, args.seed)
+        report['database'] = client.path
+    elif args.command == "sync":
+        cache = TrackingCache.for_database(args.database)
+        if not cache.available:
+            print("The tracking cache needs pyarrow", file=sys.stderr)
+            return 1
+        _, new_df, high_water = sync_tracking_events(client, cache, read_cache=False, after=cache.watermark())
+        report = {'new_events': 0 if new_df is None else len(new_df), 'watermark': high_water}
+    else:
+        reports = {'features': features_report, 'feature': feature_report, 'error-groups': error_groups_report,
+                   'error-rates': error_rates_report}
+        try:
+            report = reports[args.command](client, args)
+        except Exception as e:
+            print(f"The {args.command} report failed: {e}", file=sys.stderr)
+            return 1
+    
+    if not isinstance(report, pd.DataFrame) and args.format != 'json':
+        print(f"The {args.command} report is only available as JSON", file=sys.stderr)
+        return 1
+    
+    write_report(report, args.format, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+"""
+Data access for the BijbelQuiz admin tools
+create_client() returns either the Supabase client or LocalClient, a SQLite stand-in with the
+same query builder interface. LocalClient builds its tables from the schemas in database/*.sql
+and can be seeded with synthetic tracking events and error reports, so the dashboard and
+admin_analytics.py run (and can be load tested) without a Supabase project or a network.
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Schemas the local database is built from
+SCHEMA_DIR = Path(__file__).resolve().parent.parent / 'database'
+
+# PostgREST filter operators and their SQL counterparts
+COMPARISON_OPERATORS = {'eq': '=', 'neq': '<>', 'gt': '>', 'gte': '>=', 'lt': '<', 'lte': '<='}
+
+# Error codes of a call to a function that is not installed (PostgREST, Postgres)
+MISSING_FUNCTION_CODES = ('PGRST202', '42883')
+
+
+def create_supabase_client():
+    """Supabase client from SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY (.env is read too)"""
+    load_dotenv()
+    
+    url = os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')  # Should use service role key for admin access
+    if not url or not key:
+        raise ValueError("Supabase credentials not found in environment variables. "
+                         "Please set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in your .env file.")
+    
+    from supabase import create_client
+    return create_client(url, key)
+
+
+def local_database(database=None):
+    """The local database to use instead of Supabase: the given path, else $ADMIN_DASHBOARD_DATABASE"""
+    return database or os.getenv('ADMIN_DASHBOARD_DATABASE')
+
+
+def create_client(database=None):
+    """LocalClient when a local database is configured, else the Supabase client"""
+    database = local_database(database)
+    if database:
+        return LocalClient(database)
+    return create_supabase_client()
+
+
+class LocalBackendError(Exception):
+    """A request the local database cannot serve, e.g. a call to a Postgres function"""
+    
+    def __init__(self, message, code=None):
+        super().__init__(message)
+        self.code = code  # PostgREST error code, when there is a matching one
+
+
+def is_missing_function(error):
+    """Whether an rpc(...) failed because the function is not installed, rather than e.g. a timeout"""
+    return getattr(error, 'code', None) in MISSING_FUNCTION_CODES
+
+
+def now_timestamp():
+    return datetime.now(timezone.utc).isoformat(timespec='microseconds')
+
+
+def normalize_timestamp(value):
+    """A timestamp as UTC ISO text with microseconds, so timestamps compare correctly as text"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return value
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat(timespec='microseconds')
+    return value
+
+
+def split_statements(sql):
+    """The statements of a SQL file, without comments; function bodies ($$ ... $$) are kept intact"""
+    statements = []
+    current = []
+    i = 0
+    while i < len(sql):
+        if sql.startswith('--', i):
+            i = sql.find('\n', i)
+            if i == -1:
+                break
+            continue
+        char = sql[i]
+        if char == "'":
+            end = i + 1
+            while end < len(sql):
+                if sql[end] == "'" and sql.startswith("''", end):
+                    end += 2
+                    continue
+                if sql[end] == "'":
+                    break
+                end += 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        tag = re.match(r'\$\w*\$', sql[i:])
+        if tag:
+            end = sql.find(tag.group(), i + len(tag.group()))
+            end = len(sql) if end == -1 else end + len(tag.group())
+            current.append(sql[i:end])
+            i = end
+            continue
+        if char == ';':
+            statements.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statements.append(''.join(current).strip())
+    return [statement for statement in statements if statement]
+
+
+def split_top_level(text, separator=','):
+    """Split on the separators that are not inside parentheses, quotes or double quotes"""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == '\\' and quote == '"':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in ('"', "'"):
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts]
+
+
+def like_to_glob(pattern):
+    """A PostgREST like pattern (% or * for any text, _ for one character) as a SQLite GLOB pattern"""
+    glob = []
+    characters = iter(pattern)
+    for character in characters:
+        if character in '%*':
+            glob.append('*')
+        elif character == '_':
+            glob.append('?')
+        else:
+            if character == '\\':  # Escaped: the next character is literal
+                character = next(characters, '\\')
+            # GLOB's own wildcards only match themselves inside brackets
+            glob.append(f'[{character}]' if character in '*?[' else character)
+    return ''.join(glob)
+
+
+class LocalSchema:
+    """Postgres DDL from database/*.sql translated to SQLite.
+    
+    Only the tables, their plain indexes and the seed rows are loaded. Functions, triggers,
+    policies and GIN indexes have no SQLite counterpart and are skipped, so the admin tools
+    use their fallbacks for the missing Postgres functions. JSONB and array columns are kept
+    as JSON text, booleans as 0/1 and timestamps as UTC ISO text.
+    """
+    
+    CONSTRAINT_KEYWORDS = ('PRIMARY', 'UNIQUE', 'CHECK', 'CONSTRAINT', 'FOREIGN')
+    TYPE_REPLACEMENTS = [
+        (re.compile(r'\bSERIAL\b', re.I), 'INTEGER'),
+        (re.compile(r'(\w)\[\]'), r'\1'),
+        (re.compile(r'\bgen_random_uuid\(\)', re.I), '(gen_random_uuid())'),
+        (re.compile(r"\btimezone\('utc'::text,\s*now\(\)\)", re.I), '(now())'),
+        (re.compile(r'\bnow\(\)', re.I), '(now())'),
+        (re.compile(r'\s+REFERENCES\s+auth\.\w+\s*\(\w+\)(\s+ON\s+DELETE\s+CASCADE)?', re.I), ''),
+        (re.compile(r'::\w+'), ''),
+        (re.compile(r'\bpublic\.'), ''),
+        (re.compile(r'`'), ''),
+    ]
+    
+    def __init__(self):
+        self.column_kinds = {}  # table -> {column: 'json' | 'bool' | 'timestamp' | None}
+    
+    @staticmethod
+    def column_kind(type_text):
+        type_text = type_text.upper()
+        if 'JSON' in type_text or '[]' in type_text:
+            return 'json'
+        if type_text.startswith('BOOLEAN'):
+            return 'bool'
+        if type_text.startswith('TIMESTAMP'):
+            return 'timestamp'
+        return None
+    
+    def translate(self, sql):
+        for pattern, replacement in self.TYPE_REPLACEMENTS:
+            sql = pattern.sub(replacement, sql)
+        return sql
+    
+    def add_columns(self, table, definitions):
+        kinds = self.column_kinds.setdefault(table, {})
+        for definition in definitions:
+            name, _, type_text = definition.partition(' ')
+            if name.upper() in self.CONSTRAINT_KEYWORDS:
+                continue
+            kinds[name] = self.column_kind(type_text.strip())
+    
+    def load(self, connection, directory=SCHEMA_DIR):
+        """Create the tables of every schema file that are not there yet"""
+        existing = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        created = set()
+        
+        for path in sorted(Path(directory).glob('*.sql')):
+            if path.name.endswith(('-data.sql', '-changes.sql')):
+                continue  # Question banks and their incremental exports, not schema
+            for statement in split_statements(path.read_text(encoding='utf-8')):
+                self.execute(connection, statement, existing, created)
+        connection.commit()
+    
+    def execute(self, connection, statement, existing, created):
+        statement = ' '.join(statement.split())
+        
+        table = re.match(r'CREATE TABLE (?:IF NOT EXISTS )?(?:public\.)?(\w+) \((.*)\)$', statement, re.I)
+        if table:
+            name, body = table.groups()
+            definitions = split_top_level(body.replace('`', ''))
+            self.add_columns(name, definitions)
+            if name not in existing:
+                connection.execute(self.translate(f"CREATE TABLE {name} ({', '.join(definitions)})"))
+                existing.add(name)
+                created.add(name)
+            return
+        
+        column = re.match(r'ALTER TABLE (?:public\.)?(\w+) ADD COLUMN (?:IF NOT EXISTS )?(\w+) (.*)$', statement, re.I)
+        if column:
+            name, column_name, type_text = column.groups()
+            self.add_columns(name, [f"{column_name} {type_text}"])
+            columns = {row[1] for row in connection.execute(f"PRAGMA table_info({name})")}
+            if column_name not in columns:
+                connection.execute(self.translate(f"ALTER TABLE {name} ADD COLUMN {column_name} {type_text}"))
+            return
+        
+        if re.match(r'CREATE (UNIQUE )?INDEX ', statement, re.I) and ' USING ' not in statement.upper():
+            connection.execute(self.translate(re.sub(r'^CREATE (UNIQUE )?INDEX (?!IF NOT EXISTS)',
+                                                     r'CREATE \1INDEX IF NOT EXISTS ', statement)))
+            return
+        
+        insert = re.match(r'INSERT INTO (?:public\.)?(\w+)', statement, re.I)
+        if insert and insert.group(1) in created:
+            try:
+                connection.execute(self.translate(statement))
+            except sqlite3.Error:
+                pass  # Seed rows that need Postgres (e.g. interval arithmetic) are left out
+
+
+class LocalResponse:
+    """Result of a local request, shaped like the Supabase APIResponse"""
+    
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class LocalFunctionCall:
+    """client.rpc(...) on the local database: Postgres functions are not available there"""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def range(self, start, end):
+        return self
+    
+    def execute(self):
+        raise LocalBackendError(f"Could not find the function public.{self.name} in the local database",
+                                code='PGRST202')
+
+
+class LocalQuery:
+    """The subset of the PostgREST query builder used by the admin tools, compiled to SQLite"""
+    
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.kinds = client.schema.column_kinds.get(table, {})
+        self.action = 'select'
+        self.columns = '*'
+        self.count = None
+        self.values = None
+        self.conditions = []
+        self.params = []
+        self.ordering = []
+        self.limit_count = None
+        self.offset = None
+    
+    # Building
+    
+    def select(self, columns='*', count=None):
+        self.columns = columns
+        self.count = count
+        return self
+    
+    def insert(self, values):
+        self.action = 'insert'
+        self.values = values if isinstance(values, list) else [values]
+        return self
+    
+    def update(self, values):
+        self.action = 'update'
+        self.values = values
+        return self
+    
+    def delete(self):
+        self.action = 'delete'
+        return self
+    
+    def filter(self, column, operator, value):
+        sql, params = self.condition(column, operator, value)
+        self.conditions.append(sql)
+        self.params.extend(params)
+        return self
+    
+    def eq(self, column, value):
+        return self.filter(column, 'eq', value)
+    
+    def neq(self, column, value):
+        return self.filter(column, 'neq', value)
+    
+    def gt(self, column, value):
+        return self.filter(column, 'gt', value)
+    
+    def gte(self, column, value):
+        return self.filter(column, 'gte', value)
+    
+    def lt(self, column, value):
+        return self.filter(column, 'lt', value)
+    
+    def lte(self, column, value):
+        return self.filter(column, 'lte', value)
+    
+    def like(self, column, pattern):
+        return self.filter(column, 'like', pattern)
+    
+    def ilike(self, column, pattern):
+        return self.filter(column, 'ilike', pattern)
+    
+    def is_(self, column, value):
+        return self.filter(column, 'is', value)
+    
+    def in_(self, column, values):
+        return self.filter(column, 'in', list(values))
+    
+    def match(self, query):
+        for column, value in query.items():
+            self.eq(column, value)
+        return self
+    
+    def or_(self, filters):
+        sql, params = self.logic('or', split_top_level(filters))
+        self.conditions.append(sql)
+        self.params.extend(params)
+        return self
+    
+    def order(self, column, desc=False, nullsfirst=None):
+        if nullsfirst is None:
+            nullsfirst = desc  # Postgres puts NULLs last in ascending order
+        self.ordering.append(f"{self.quote(column)} {'DESC' if desc else 'ASC'} "
+                             f"NULLS {'FIRST' if nullsfirst else 'LAST'}")
+        return self
+    
+    def limit(self, count):
+        self.limit_count = count
+        return self
+    
+    def range(self, start, end):
+        self.offset = start
+        self.limit_count = end - start + 1
+        return self
+    
+    # Compiling
+    
+    def quote(self, column):
+        if not re.fullmatch(r'\w+', column):
+            raise LocalBackendError(f"Unsupported column: {column}")
+        return f'"{column}"'
+    
+    def encode(self, column, value):
+        """A value as stored in SQLite"""
+        kind = self.kinds.get(column)
+        if value is None:
+            return None
+        if kind == 'json':
+            return json.dumps(value)
+        if kind == 'timestamp':
+            return normalize_timestamp(value)
+        if isinstance(value, bool):
+            return int(value)
+        return value
+    
+    def decode_row(self, row):
+        for column, value in row.items():
+            if value is None:
+                continue
+            kind = self.kinds.get(column)
+            if kind == 'json':
+                row[column] = json.loads(value)
+            elif kind == 'bool':
+                row[column] = bool(value)
+        return row
+    
+    def condition(self, column, operator, value):
+        """SQL and parameters for one PostgREST filter"""
+        negate = operator.startswith('not.')
+        if negate:
+            operator = operator[len('not.'):]
+        
+        column_sql = self.quote(column)
+        if operator in COMPARISON_OPERATORS:
+            sql, params = f"{column_sql} {COMPARISON_OPERATORS[operator]} ?", [self.encode(column, value)]
+        elif operator in ('like', 'ilike'):
+            # SQLite LIKE is case insensitive (for ASCII); GLOB is case sensitive but has its own wildcards
+            if operator == 'ilike':
+                sql, params = f"{column_sql} LIKE ?", [value.replace('*', '%')]
+            else:
+                sql, params = f"{column_sql} GLOB ?", [like_to_glob(value)]
+        elif operator == 'is':
+            keyword = {'null': 'NULL', 'true': '1', 'false': '0'}.get(str(value).lower())
+            if keyword is None:
+                raise LocalBackendError(f"Unsupported is value: {value}")
+            sql, params = f"{column_sql} IS {keyword}", []
+        elif operator == 'in':
+            if isinstance(value, str):
+                value = [item.strip('"') for item in split_top_level(value.strip('()'))]
+            sql = f"{column_sql} IN ({', '.join('?' * len(value))})" if value else '0'
+            params = [self.encode(column, item) for item in value]
+        else:
+            raise LocalBackendError(f"Unsupported filter operator: {operator}")
+        
+        return (f"NOT ({sql})", params) if negate else (sql, params)
+    
+    @staticmethod
+    def parse_filter(text):
+        """(column, operator, value) of a 'column.operator.value' filter; quoted values are unescaped"""
+        column, operator, value = text.split('.', 2)
+        if operator == 'not':
+            negated, value = value.split('.', 1)
+            operator = f'not.{negated}'
+        if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        return column, operator, value
+    
+    def logic(self, operator, items):
+        """SQL for an or(...)/and(...) group of PostgREST filters"""
+        keyset = self.keyset_condition(operator, items)
+        if keyset:
+            return keyset
+        
+        parts = []
+        params = []
+        for item in items:
+            group = re.fullmatch(r'(and|or)\((.*)\)', item, re.S)
+            if group:
+                sql, item_params = self.logic(group.group(1), split_top_level(group.group(2)))
+            else:
+                sql, item_params = self.condition(*self.parse_filter(item))
+            parts.append(f"({sql})")
+            params.extend(item_params)
+        return f" {operator.upper()} ".join(parts), params
+    
+    def keyset_condition(self, operator, items):
+        """A row value comparison for `a.gt.x,and(a.eq.x,b.gt.y)`, so SQLite can seek the (a, b) index"""
+        if operator != 'or' or len(items) != 2:
+            return None
+        second = re.fullmatch(r'and\((.*)\)', items[1], re.S)
+        if not second or items[0].startswith(('and(', 'or(')):
+            return None
+        inner = split_top_level(second.group(1))
+        if len(inner) != 2 or any(item.startswith(('and(', 'or(')) for item in inner):
+            return None
+        
+        first_column, first_operator, first_value = self.parse_filter(items[0])
+        equal_column, equal_operator, equal_value = self.parse_filter(inner[0])
+        next_column, next_operator, next_value = self.parse_filter(inner[1])
+        if (first_operator not in ('gt', 'lt') or next_operator != first_operator or equal_operator != 'eq'
+                or equal_column != first_column or equal_value != first_value):
+            return None
+        columns = f"{self.quote(first_column)}, {self.quote(next_column)}"
+        return (f"({columns}) {COMPARISON_OPERATORS[first_operator]} (?, ?)",
+                [self.encode(first_column, first_value), self.encode(next_column, next_value)])
+    
+    def where(self):
+        return f" WHERE {' AND '.join(f'({condition})' for condition in self.conditions)}" if self.conditions else ''
+    
+    def execute(self):
+        with self.client.lock:
+            connection = self.client.connection
+            try:
+                response = getattr(self, f'execute_{self.action}')(connection)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+        return response
+    
+    def execute_select(self, connection):
+        columns = ', '.join(self.quote(column.strip()) for column in self.columns.split(',')) \
+            if self.columns.strip() != '*' else '*'
+        sql = f"SELECT {columns} FROM {self.quote(self.table)}{self.where()}"
+        if self.ordering:
+            sql += f" ORDER BY {', '.join(self.ordering)}"
+        if self.limit_count is not None or self.offset:
+            sql += f" LIMIT {-1 if self.limit_count is None else int(self.limit_count)} OFFSET {int(self.offset or 0)}"
+        
+        cursor = connection.execute(sql, self.params)
+        names = [description[0] for description in cursor.description]
+        data = [self.decode_row(dict(zip(names, row))) for row in cursor]
+        
+        count = None
+        if self.count:
+            count = connection.execute(f"SELECT COUNT(*) FROM {self.quote(self.table)}{self.where()}",
+                                       self.params).fetchone()[0]
+        return LocalResponse(data, count)
+    
+    def returning(self, connection, sql, params):
+        cursor = connection.execute(sql + ' RETURNING *', params)
+        names = [description[0] for description in cursor.description]
+        return [self.decode_row(dict(zip(names, row))) for row in cursor.fetchall()]
+    
+    def execute_insert(self, connection):
+        data = []
+        for row in self.values:
+            columns = list(row)
+            sql = (f"INSERT INTO {self.quote(self.table)} ({', '.join(self.quote(column) for column in columns)}) "
+                   f"VALUES ({', '.join('?' * len(columns))})")
+            data.extend(self.returning(connection, sql, [self.encode(column, row[column]) for column in columns]))
+        return LocalResponse(data)
+    
+    def execute_update(self, connection):
+        assignments = ', '.join(f"{self.quote(column)} = ?" for column in self.values)
+        params = [self.encode(column, value) for column, value in self.values.items()]
+        sql = f"UPDATE {self.quote(self.table)} SET {assignments}{self.where()}"
+        return LocalResponse(self.returning(connection, sql, params + self.params))
+    
+    def execute_delete(self, connection):
+        sql = f"DELETE FROM {self.quote(self.table)}{self.where()}"
+        return LocalResponse(self.returning(connection, sql, self.params))
+
+
+class LocalClient:
+    """Stand-in for the Supabase client, backed by a SQLite file (or ':memory:').
+    
+    Supports table(...) queries with the filters, ordering and paging the admin tools use.
+    rpc(...) always fails, the way a missing Postgres function fails on Supabase, so callers
+    take their local fallbacks. One connection is shared by all threads, one request at a time.
+    """
+    
+    def __init__(self, path=':memory:', schema_dir=SCHEMA_DIR):
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.create_function('now', 0, now_timestamp)
+        self.connection.create_function('gen_random_uuid', 0, lambda: str(uuid.uuid4()))
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        self.lock = threading.Lock()
+        self.schema = LocalSchema()
+        with self.lock:
+            self.schema.load(self.connection, schema_dir)
+    
+    def table(self, name):
+        return LocalQuery(self, name)
+    
+    def rpc(self, name, params=None):
+        return LocalFunctionCall(name)
+    
+    def insert_rows(self, table, columns, rows):
+        """Bulk insert tuples of already encoded values (for seeding)"""
+        query = LocalQuery(self, table)
+        sql = (f"INSERT INTO {query.quote(table)} ({', '.join(query.quote(column) for column in columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        with self.lock:
+            self.connection.executemany(sql, rows)
+            self.connection.commit()
+    
+    def seed(self, tracking_events=0, error_reports=0, days=30, seed=None, progress=None):
+        """Add synthetic tracking events and about `error_reports` error reports over the last `days` days"""
+        from synthetic_telemetry import InsertWriter, TelemetryProfile, write_telemetry
+        
+        profile = TelemetryProfile(events=tracking_events, errors=error_reports, days=days)
+        return write_telemetry(profile, InsertWriter(self), seed, progress)
+    
+    def rebuild_error_groups(self):
+        """Fingerprint the error reports and rebuild error_groups, like rebuild_error_groups() in Postgres"""
+        import pandas as pd
+        from admin_analytics import ErrorFingerprinter, ERROR_GROUP_COLUMNS
+        
+        with self.lock:
+            reports = pd.read_sql_query("SELECT id, timestamp, error_type, user_id, error_message, stack_trace, "
+                                        "app_version FROM error_reports", self.connection)
+        groups = ErrorFingerprinter.group(reports)
+        texts = reports[['error_type', 'error_message', 'stack_trace']].fillna('')
+        fingerprints = [ErrorFingerprinter.fingerprint(*text) for text in texts.itertuples(index=False, name=None)]
+        users = {(fingerprint, user_id) for fingerprint, user_id in zip(fingerprints, reports['user_id'])
+                 if user_id is not None}
+        
+        with self.lock:
+            connection = self.connection
+            connection.executemany("UPDATE error_reports SET fingerprint = ? WHERE id = ?",
+                                   zip(fingerprints, reports['id']))
+            connection.execute("DELETE FROM error_groups")
+            connection.execute("DELETE FROM error_group_users")
+            connection.executemany(
+                f"INSERT INTO error_groups ({', '.join(ERROR_GROUP_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(ERROR_GROUP_COLUMNS))})",
+                [tuple(json.dumps(list(value)) if column == 'app_versions' else value
+                       for column, value in zip(ERROR_GROUP_COLUMNS, row))
+                 for row in groups[ERROR_GROUP_COLUMNS].itertuples(index=False, name=None)])
+            connection.executemany("INSERT INTO error_group_users (fingerprint, user_id) VALUES (?, ?)", users)
+            connection.commit()
+
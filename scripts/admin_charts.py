@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Charts of the BijbelQuiz admin dashboard
+Rendered with matplotlib's Agg backend into PNG data, so they need no display or Tk: the
+dashboard shows the PNG in a tk.PhotoImage, and benchmark_admin.py renders it headless.
+"""
+import base64
+import io
+import threading
+
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+class FeatureChart:
+    """The four feature usage charts, rendered off the Tk thread into one reused figure.
+    
+    The figure, its axes and the daily trend line are created once. render() is called from a
+    worker thread: it updates the axes in place, draws them with Agg and returns the PNG as
+    base64 text for a tk.PhotoImage. Renders are serialized because the figure is shared.
+    """
+    
+    def __init__(self, figsize=(10, 16)):
+        self.figure = Figure(figsize=figsize)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.subplots(4, 1)
+        self.lock = threading.Lock()
+        
+        trend_axes = self.axes[2]
+        self.trend_line, = trend_axes.plot([], [], marker='o')
+        trend_axes.xaxis.set_major_locator(mdates.AutoDateLocator())
+        trend_axes.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        trend_axes.set_title('Daily Activity Trend')
+        trend_axes.set_xlabel('Date')
+        trend_axes.set_ylabel('Event Count')
+        trend_axes.tick_params(axis='x', rotation=45)
+    
+    @staticmethod
+    def show_empty(axes, title, message):
+        axes.text(0.5, 0.5, message, horizontalalignment='center',
+                  verticalalignment='center', transform=axes.transAxes)
+        axes.set_title(title)
+    
+    def render(self, feature_name, daily_df):
+        """Draw the charts for a feature's daily counts and return them as base64 encoded PNG"""
+        with self.lock:
+            event_axes, platform_axes, trend_axes, version_axes = self.axes
+            for axes in (event_axes, platform_axes, version_axes):
+                axes.clear()
+            self.figure.suptitle(f'Feature Usage Analysis: {feature_name}', fontsize=14)
+            
+            # Plot 1: Event types over time, one group of bars per day
+            event_counts = daily_df.pivot_table(index='day', columns='event_type', values='event_count',
+                                                aggfunc='sum', fill_value=0)
+            if not event_counts.empty:
+                positions = np.arange(len(event_counts))
+                width = 0.8 / len(event_counts.columns)
+                for i, event_type in enumerate(event_counts.columns):
+                    event_axes.bar(positions + i * width - 0.4 + width / 2, event_counts[event_type].values,
+                                   width, label=str(event_type))
+                event_axes.set_xticks(positions, [str(day) for day in event_counts.index], rotation=45)
+                event_axes.legend()
+                event_axes.set_title('Event Types Over Time')
+                event_axes.set_xlabel('Date')
+                event_axes.set_ylabel('Event Count')
+            else:
+                self.show_empty(event_axes, 'Event Types Over Time', 'No data available')
+            
+            # Plot 2: Platform distribution
+            platform_counts = daily_df.groupby('platform')['event_count'].sum().sort_values(ascending=False)
+            if not platform_counts.empty:
+                platform_axes.pie(platform_counts.values, labels=platform_counts.index, autopct='%1.1f%%')
+                platform_axes.set_title('Platform Distribution')
+            else:
+                self.show_empty(platform_axes, 'Platform Distribution', 'No platform data')
+            
+            # Plot 3: Daily activity pattern, updating the existing line
+            daily_counts = daily_df.groupby('day')['event_count'].sum()
+            self.trend_line.set_data(mdates.date2num(pd.to_datetime(daily_counts.index)), daily_counts.values)
+            trend_axes.relim()
+            trend_axes.autoscale_view()
+            
+            # Plot 4: App version distribution
+            version_counts = daily_df.groupby('app_version')['event_count'].sum().sort_values(ascending=False)
+            if not version_counts.empty:
+                version_axes.bar([str(version) for version in version_counts.index], version_counts.values)
+                version_axes.set_title('App Version Distribution')
+                version_axes.set_xlabel('App Version')
+                version_axes.set_ylabel('Event Count')
+                version_axes.tick_params(axis='x', rotation=45)
+            else:
+                self.show_empty(version_axes, 'App Version Distribution', 'No version data')
+            
+            # Adjust layout to prevent overlap
+            self.figure.tight_layout()
+            
+            buffer = io.BytesIO()
+            self.figure.savefig(buffer, format='png')
+        return base64.b64encode(buffer.getvalue()).decode('ascii')
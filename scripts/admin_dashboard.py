@@ -1,72 +1,509 @@
 """
 Modern Admin Dashboard for BijbelQuiz
 Combines tracking data analysis and error reporting in a single modern interface
+The data loading and analysis live in admin_analytics.py; this module is the Tk client over it.
+Run with --profile-startup to print how long startup took and what each import costs.
 """
+import time
+
+STARTUP_STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import subprocess
+import sys
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, simpledialog
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 import json
-import pandas as pd
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from supabase import create_client, Client
-import os
-from dotenv import load_dotenv
-from dateutil import parser
-import re
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from pathlib import Path
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 
-class ModernAdminDashboard:
-    def __init__(self, root):
+class LazyModule:
+    """A module that is only imported when one of its attributes is first used.
+    
+    pandas, numpy, matplotlib, supabase and admin_analytics (which pulls in pandas) take far
+    longer to import than it takes to put the window on screen, so they are loaded on demand.
+    """
+    
+    def __init__(self, name):
+        self.name = name
+        self.module = None
+    
+    def __getattr__(self, attribute):
+        if self.module is None:
+            self.module = importlib.import_module(self.name)
+        return getattr(self.module, attribute)
+
+
+pd = LazyModule('pandas')
+analytics = LazyModule('admin_analytics')
+charts = LazyModule('admin_charts')
+backends = LazyModule('admin_backends')
+
+# Modules imported on first use; --profile-startup reports what each of them costs
+DEFERRED_MODULES = ['numpy', 'pandas', 'matplotlib.figure', 'matplotlib.backends.backend_agg', 'supabase',
+                    'admin_backends', 'admin_analytics', 'admin_charts']
+
+# Number of raw events shown per page in the feature records browser
+FEATURE_RECORDS_PAGE_SIZE = 25
+
+# Columns of error_reports needed for the error list; full reports are fetched per selection
+ERROR_LIST_COLUMNS = ['id', 'timestamp', 'error_type', 'user_id', 'question_id', 'user_message', 'error_message',
+                      'app_version']
+
+# Number of error reports requested per keyset page in the error list
+ERROR_PAGE_SIZE = 200
+
+# Time windows offered by the error list filter; None means no lower bound
+ERROR_TIME_WINDOWS = {
+    'Last hour': timedelta(hours=1),
+    'Last 24 hours': timedelta(days=1),
+    'Last 7 days': timedelta(days=7),
+    'Last 30 days': timedelta(days=30),
+    'All time': None,
+}
+DEFAULT_ERROR_TIME_WINDOW = 'Last 7 days'
+
+# Number of ids per delete request when triage_error_reports() is not installed
+ERROR_TRIAGE_BATCH_SIZE = 100
+
+# Number of full error reports kept for reopening their details without a round trip
+ERROR_DETAILS_CACHE_SIZE = 256
+
+# How often the open error rate window refreshes
+ERROR_RATE_REFRESH_MS = 5 * 60 * 1000
+
+# Seconds a feature chart drawn from the server stays cached; new events reach the server unnoticed
+SERVER_CHART_TTL = 5 * 60
+
+
+class Request:
+    """Handle passed to a background request so it can report progress and notice it went stale"""
+    
+    def __init__(self, executor, key, generation):
+        self.executor = executor
+        self.key = key
+        self.generation = generation
+    
+    @property
+    def cancelled(self):
+        """True once a newer request with the same key was submitted or the key was cancelled"""
+        return self.executor.generations.get(self.key) != self.generation
+    
+    def progress(self, message):
+        """Show a progress message in the status bar (safe to call from the worker thread)"""
+        self.executor.results.put(('progress', self, message))
+
+
+class RequestExecutor:
+    """Runs blocking Supabase requests on a thread pool and delivers the results on the Tk main loop.
+    
+    Every request has a key (e.g. 'error_reports'). Submitting a new request with the same key
+    makes the previous one stale: it is cancelled if it has not started yet, and its result is
+    dropped if it has. Callbacks always run on the Tk thread through root.after.
+    """
+    
+    def __init__(self, root, status_var, max_workers=4, poll_interval=50):
         self.root = root
+        self.status_var = status_var
+        self.poll_interval = poll_interval
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="supabase")
+        self.results = queue.Queue()
+        self.generations = {}  # key -> generation of the latest request
+        self.pending = {}  # key -> Future of the latest request
+        self.lock = threading.Lock()
+        self.closed = False
+        self.root.after(self.poll_interval, self._poll)
+    
+    def submit(self, key, func, on_success, on_error=None, status=None):
+        """Run func(request) on a worker thread and pass its result to on_success on the Tk thread"""
+        with self.lock:
+            generation = self.generations.get(key, 0) + 1
+            self.generations[key] = generation
+            previous = self.pending.get(key)
+            if previous is not None:
+                previous.cancel()
+            
+            request = Request(self, key, generation)
+            future = self.pool.submit(func, request)
+            self.pending[key] = future
+        
+        future.add_done_callback(
+            lambda f: self.results.put(('done', request, (f, on_success, on_error)))
+        )
         
-        # Use ttkbootstrap style
-        self.root = tb.Window(themename="morph")
+        if status:
+            self.status_var.set(status)
+        return request
+    
+    def cancel(self, key):
+        """Mark the request with the given key as stale"""
+        with self.lock:
+            self.generations[key] = self.generations.get(key, 0) + 1
+            future = self.pending.pop(key, None)
+        if future is not None:
+            future.cancel()
+    
+    def busy_count(self):
+        """Number of requests that are still running or queued"""
+        return sum(1 for future in self.pending.values() if not future.done())
+    
+    def shutdown(self):
+        """Stop polling and drop all queued requests"""
+        self.closed = True
+        self.pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _poll(self):
+        """Deliver finished requests and progress messages on the Tk thread"""
+        if self.closed:
+            return
+        
+        try:
+            while True:
+                kind, request, payload = self.results.get_nowait()
+                
+                # Drop anything coming from a request that was superseded
+                if request.cancelled:
+                    continue
+                
+                if kind == 'progress':
+                    self.status_var.set(payload)
+                    continue
+                
+                future, on_success, on_error = payload
+                with self.lock:
+                    if self.pending.get(request.key) is future:
+                        del self.pending[request.key]
+                if future.cancelled():
+                    continue
+                
+                error = future.exception()
+                try:
+                    if error is None:
+                        on_success(future.result())
+                    elif on_error is not None:
+                        on_error(error)
+                    else:
+                        print(f"Background request '{request.key}' failed: {error}")
+                except Exception as e:
+                    print(f"Error handling result of '{request.key}': {e}")
+        except queue.Empty:
+            pass
+        
+        try:
+            self.root.after(self.poll_interval, self._poll)
+        except tk.TclError:
+            # Window was destroyed
+            self.closed = True
+
+
+class VirtualTreeview:
+    """Treeview that only materializes the rows currently in view.
+    
+    The rows live in a DataFrame; the widget holds just enough items to fill the visible
+    area and rewrites their values while scrolling, so a list of 100k rows costs the same
+    as a list of 20. Clicking a column heading sorts the underlying data. Selection is
+    tracked by the value of key_column, so it survives scrolling and sorting.
+    """
+    
+    def __init__(self, parent, columns, key_column='id', height=20, row_values=None,
+                 on_select=None, on_end_reached=None, **tree_options):
+        # columns: list of (column name, heading text, width)
+        self.frame = tb.Frame(parent)
+        self.columns = [name for name, _, _ in columns]
+        self.key_column = key_column
+        self.row_values = row_values or self.default_row_values
+        self.on_select = on_select
+        self.on_end_reached = on_end_reached  # Called when scrolled to the last row, e.g. to page in more rows
+        
+        self.tree = tb.Treeview(self.frame, columns=self.columns, show='headings', height=height, **tree_options)
+        for name, heading, width in columns:
+            self.tree.heading(name, text=heading, command=lambda column=name: self.sort_by(column))
+            self.tree.column(name, width=width)
+        
+        self.scrollbar = tb.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.yview, bootstyle="round")
+        
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+        
+        self.data = self.empty_data()
+        self.offset = 0
+        self.visible_rows = max(height, 1)
+        self.visible_keys = []
+        self.selected_keys = set()
+        self.rendered_selection = ()
+        self.sort_column = None
+        self.sort_ascending = True
+        
+        self.tree.bind('<<TreeviewSelect>>', self._on_select)
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll(3))
+        self.tree.bind('<Down>', lambda e: self._on_arrow(1))
+        self.tree.bind('<Up>', lambda e: self._on_arrow(-1))
+        self.tree.bind('<Next>', lambda e: self.scroll(self.visible_rows) or 'break')
+        self.tree.bind('<Prior>', lambda e: self.scroll(-self.visible_rows) or 'break')
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def empty_data(self):
+        return pd.DataFrame(columns=list(dict.fromkeys([self.key_column] + self.columns)))
+    
+    def default_row_values(self, rows):
+        """Display values for a window of rows: the configured columns, with missing values blank"""
+        window = rows[self.columns].astype(object)
+        return window.where(window.notna(), '').itertuples(index=False, name=None)
+    
+    def bind(self, sequence, func):
+        self.tree.bind(sequence, func)
+    
+    def set_data(self, data):
+        """Replace the rows shown in the table"""
+        if self.key_column not in data.columns:
+            data = self.empty_data()
+        self.data = self._sorted(data.reset_index(drop=True))
+        self.offset = 0
+        if self.selected_keys:
+            self.selected_keys &= set(self.data[self.key_column])
+        self.render()
+    
+    def append_data(self, data):
+        """Add rows to the table without moving the scroll position"""
+        if data.empty:
+            return
+        self.data = self._sorted(pd.concat([self.data, data], ignore_index=True))
+        self.render()
+    
+    def remove_keys(self, keys):
+        """Drop rows by key without reloading the table"""
+        keys = set(keys)
+        self.data = self.data[~self.data[self.key_column].isin(keys)].reset_index(drop=True)
+        self.selected_keys -= keys
+        self.render()
+    
+    def selected_rows(self):
+        """The selected rows, in display order"""
+        if not self.selected_keys:
+            return self.data.iloc[0:0]
+        return self.data[self.data[self.key_column].isin(self.selected_keys)]
+    
+    def record_at(self, y):
+        """The row under the given y coordinate, or None"""
+        iid = self.tree.identify_row(y)
+        if not iid:
+            return None
+        position = self.offset + self.tree.index(iid)
+        return self.data.iloc[position] if position < len(self.data) else None
+    
+    def sort_by(self, column):
+        """Sort the underlying data by a column, toggling the direction on repeated clicks"""
+        if self.sort_column == column:
+            self.sort_ascending = not self.sort_ascending
+        else:
+            self.sort_column = column
+            self.sort_ascending = True
+        
+        self.data = self._sorted(self.data)
+        self.offset = 0
+        self.render()
+    
+    def _sorted(self, data):
+        if self.sort_column is None or self.sort_column not in data.columns:
+            return data
+        try:
+            data = data.sort_values(self.sort_column, ascending=self.sort_ascending,
+                                    kind='stable', na_position='last')
+        except TypeError:
+            # Mixed types in the column: fall back to comparing the text
+            data = data.sort_values(self.sort_column, ascending=self.sort_ascending,
+                                    kind='stable', na_position='last', key=lambda values: values.astype(str))
+        return data.reset_index(drop=True)
+    
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', count, 'units'|'pages')"""
+        if not args:
+            return
+        if args[0] == 'moveto':
+            self.offset = int(float(args[1]) * len(self.data))
+            self.render()
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            self.scroll(count * self.visible_rows if args[2] == 'pages' else count)
+    
+    def scroll(self, rows):
+        self.offset += rows
+        self.render()
+    
+    def render(self):
+        """Write the rows of the current window into the item slots"""
+        total = len(self.data)
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        window = self.data.iloc[self.offset:self.offset + self.visible_rows]
+        values = list(self.row_values(window))
+        
+        # Create or drop slot items so there is exactly one per visible row
+        slots = self.tree.get_children()
+        for index in range(len(slots), len(values)):
+            self.tree.insert('', 'end', iid=f'slot{index}')
+        for iid in slots[len(values):]:
+            self.tree.delete(iid)
+        for index, row in enumerate(values):
+            self.tree.item(f'slot{index}', values=row)
+        
+        # Restore the selection of the rows that are now visible
+        self.visible_keys = window[self.key_column].tolist()
+        self.rendered_selection = tuple(
+            f'slot{index}' for index, key in enumerate(self.visible_keys) if key in self.selected_keys
+        )
+        self.tree.selection_set(self.rendered_selection)
+        
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + len(values)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        
+        if self.on_end_reached and total and self.offset + len(values) >= total:
+            self.on_end_reached()
+    
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection == self.rendered_selection:
+            return  # Selection restored by render, not changed by the user
+        
+        keys = {self.visible_keys[self.tree.index(iid)] for iid in selection
+                if self.tree.index(iid) < len(self.visible_keys)}
+        self.rendered_selection = selection
+        if keys != self.selected_keys:
+            self.selected_keys = keys
+            if self.on_select:
+                self.on_select(event)
+    
+    def _on_configure(self, event):
+        rowheight = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        visible_rows = max(1, (event.height - 25) // rowheight)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.render()
+    
+    def _on_mousewheel(self, event):
+        step = -1 if event.delta > 0 else 1
+        self.scroll(step * max(1, abs(event.delta) // 120) * 3)
+        return 'break'
+    
+    def _on_arrow(self, step):
+        """Scroll the window when moving the keyboard focus past the first or last visible row"""
+        slots = self.tree.get_children()
+        if not slots:
+            return None
+        edge = slots[-1] if step > 0 else slots[0]
+        if self.tree.focus() != edge:
+            return None
+        
+        position = self.offset + self.tree.index(edge) + step
+        if not 0 <= position < len(self.data):
+            return 'break'
+        
+        self.selected_keys = {self.data.iloc[position][self.key_column]}
+        self.scroll(step)
+        self.tree.focus(edge)
+        if self.on_select:
+            self.on_select(None)
+        return 'break'
+
+
+class ModernAdminDashboard:
+    def __init__(self, root, database=None):
+        self.root = root
         self.root.title("BijbelQuiz Modern Admin Dashboard")
         self.root.geometry("1400x900")
         
-        # Initialize Supabase client
+        # Supabase client (or the local stand-in), set once the background connection check succeeds
+        self.database = database  # Local SQLite database to use instead of Supabase
         self.supabase_client = None
-        self.initialize_supabase()
         
         # Data
         self.df = None
+        self.filter_engine = None  # Indexes over self.df, rebuilt whenever it changes
+        self.feature_records_name = None  # Feature shown in the paged records browser
+        self.feature_records_total = 0
+        self.feature_records_offset = 0
+        self.chart_cache = OrderedDict()  # (feature, filters, data version, source) -> rendered chart image
+        self.chart_image_label = None
+        self.tracking_high_water = None  # (timestamp, id) of the newest loaded tracking event
+        self.server_aggregation = True  # Use the Postgres aggregation functions until they turn out to be missing
         self.current_error_id = None
+        self.current_error_group = None  # Fingerprint of the group whose reports are listed
+        self.server_error_groups = True  # Read error_groups until it turns out to be missing
+        self.server_sessions = True  # Count sessions with tracking_sessions_hourly() until it turns out to be missing
+        self.error_details_cache = OrderedDict()  # error id -> full error report
+        self.error_reports_filters = None  # Filters of the loaded error list, used to fetch further pages
+        self.error_reports_cursor = None  # (timestamp, id) to continue the error list after; None when complete
+        self.error_reports_loading = False
+        self.error_reports_total = None  # Estimated number of reports matching the filters
+        self.error_rate_window = None  # Toplevel showing the error rates, while open
+        self.error_rate_job = None  # Pending root.after refresh of the error rates
+        self.unbuilt_tabs = {}  # notebook tab id -> (frame, setup method) of tabs not shown yet
         
         self.setup_ui()
+        
+        # Background worker pool for Supabase requests
+        self.executor = RequestExecutor(self.root, self.status_var)
     
-    def initialize_supabase(self):
-        """Initialize Supabase client using environment variables"""
-        try:
-            # Load environment variables
-            load_dotenv()
-            
-            url = os.getenv('SUPABASE_URL')
-            key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')  # Should use service role key for admin access
-            
-            if not url or not key:
-                messagebox.showerror("Error", "Supabase credentials not found in environment variables.\n\nPlease set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in your .env file.")
-                return
-            
-            self.supabase_client = create_client(url, key)
-            # Test connection
-            self.test_connection()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to connect to Supabase: {str(e)}")
-            self.supabase_client = None
+    @cached_property
+    def feature_chart(self):
+        return charts.FeatureChart()
     
-    def test_connection(self):
-        """Test the Supabase connection"""
-        try:
+    @cached_property
+    def tracking_cache(self):
+        return analytics.TrackingCache.for_database(self.database)
+    
+    @cached_property
+    def error_rate_analyzer(self):
+        return analytics.ErrorRateAnalyzer()
+    
+    def start(self):
+        """Build the selected tab and connect to Supabase; called once the window is on screen"""
+        self.build_selected_tab()
+        self.initialize_supabase()
+    
+    def initialize_supabase(self):
+        """Create the Supabase client (or open the local database) and test the connection in the background"""
+        def connect(request):
+            client = backends.create_client(self.database)
             # Try to fetch a small sample to test connection
-            response = self.supabase_client.table('tracking_events').select('id').limit(1).execute()
+            client.table('tracking_events').select('id').limit(1).execute()
+            return client
+        
+        self.executor.submit('connection', connect, self.on_supabase_connected, self.on_supabase_connection_failed,
+                             status="Connecting to Supabase...")
+    
+    def on_supabase_connected(self, client):
+        self.supabase_client = client
+        if isinstance(client, backends.LocalClient):
+            self.status_var.set(f"Using local database {client.path}")
+        else:
             print("Supabase connection successful")
-        except Exception as e:
-            messagebox.showerror("Connection Error", f"Could not connect to Supabase: {str(e)}")
-            self.supabase_client = None
+            self.status_var.set("Connected to Supabase")
+    
+    def on_supabase_connection_failed(self, error):
+        self.supabase_client = None
+        self.status_var.set("Not connected to Supabase")
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error", str(error))
+        else:
+            messagebox.showerror("Connection Error", f"Could not connect to Supabase: {str(error)}")
     
     def setup_ui(self):
         """Set up the user interface with modern design"""
@@ -93,14 +530,18 @@ class ModernAdminDashboard:
         self.notebook = tb.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Add tabs
-        self.setup_tracking_tab()
-        self.setup_errors_tab()
-        self.setup_store_tab()
-        self.setup_messages_tab()
+        # Add empty tabs; each one is filled in the first time it is selected
+        for text, setup in (("Tracking Data", self.setup_tracking_tab),
+                            ("Error Reports", self.setup_errors_tab),
+                            ("Store Management", self.setup_store_tab),
+                            ("Message Management", self.setup_messages_tab)):
+            frame = tb.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self.unbuilt_tabs[str(frame)] = (frame, setup)
         
         # Initially show tracking tab
         self.notebook.select(0)
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self.build_selected_tab())
         
         # Create status bar
         self.status_var = tk.StringVar()
@@ -108,12 +549,14 @@ class ModernAdminDashboard:
         status_bar = tb.Label(main_frame, textvariable=self.status_var, bootstyle=INFO)
         status_bar.pack(fill=tk.X, pady=(0, 0))
     
-    def setup_tracking_tab(self):
+    def build_selected_tab(self):
+        """Create the widgets of the selected tab if this is the first time it is shown"""
+        frame, setup = self.unbuilt_tabs.pop(str(self.notebook.select()), (None, None))
+        if setup is not None:
+            setup(frame)
+    
+    def setup_tracking_tab(self, tracking_frame):
         """Setup the tracking data analysis tab"""
-        # Main tracking frame
-        tracking_frame = tb.Frame(self.notebook)
-        self.notebook.add(tracking_frame, text="Tracking Data")
-        
         # Controls frame
         controls_frame = tb.Labelframe(tracking_frame, text="Data Controls", padding=10)
         controls_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -122,6 +565,12 @@ class ModernAdminDashboard:
         tb.Button(controls_frame, text="Load Tracking Data", 
                  command=self.load_tracking_data, bootstyle=SUCCESS).pack(side=tk.LEFT, padx=5)
         
+        tb.Button(controls_frame, text="Clear Cache", 
+                 command=self.clear_tracking_cache, bootstyle=SECONDARY).pack(side=tk.LEFT, padx=5)
+        
+        tb.Button(controls_frame, text="Refresh Rollup", 
+                 command=self.refresh_daily_rollup, bootstyle=SECONDARY).pack(side=tk.LEFT, padx=5)
+        
         # Filter options
         tb.Label(controls_frame, text="Feature:").pack(side=tk.LEFT, padx=(20, 5))
         self.feature_var = tk.StringVar()
@@ -145,6 +594,12 @@ class ModernAdminDashboard:
         date_to_entry = tb.Entry(controls_frame, textvariable=self.date_to_var, width=12, bootstyle="secondary")
         date_to_entry.pack(side=tk.LEFT, padx=5)
         
+        tb.Label(controls_frame, text="Property:").pack(side=tk.LEFT, padx=(10, 5))
+        self.property_filter_var = tk.StringVar()
+        property_entry = tb.Entry(controls_frame, textvariable=self.property_filter_var, width=15, bootstyle="secondary")
+        property_entry.pack(side=tk.LEFT, padx=5)
+        property_entry.bind('<Return>', lambda e: self.apply_tracking_filters())
+        
         tb.Button(controls_frame, text="Apply Filters", 
                  command=self.apply_tracking_filters, bootstyle=INFO).pack(side=tk.LEFT, padx=(20, 5))
         
@@ -196,14 +651,17 @@ class ModernAdminDashboard:
         # Bind selection event for features
         self.features_tree.bind("<<TreeviewSelect>>", self.on_feature_select)
         
-        # Create the old treeview (for backward compatibility with some methods)
-        # This will be hidden but still available for methods that reference it
-        old_tree_frame = tb.Frame(features_frame)
-        old_tree_frame.pack(fill=tk.BOTH, expand=False)  # Don't expand to make it invisible
-        
-        self.tree = tb.Treeview(old_tree_frame,
-                               columns=("ID", "UserID", "EventType", "EventName", "Properties", "Timestamp"),
-                               show="headings", height=0, bootstyle="primary")  # Height of 0 makes it invisible
+        # Individual tracking records; only the rows in view are materialized
+        records_frame = tb.Labelframe(left_frame, text="Tracking Records", padding=10)
+        records_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        self.tree = VirtualTreeview(records_frame,
+                                    columns=[('id', 'ID', 120), ('user_id', 'User ID', 120),
+                                             ('event_type', 'Event Type', 100), ('event_name', 'Event Name', 150),
+                                             ('properties', 'Properties', 200), ('timestamp', 'Timestamp', 150)],
+                                    height=10, row_values=self.tracking_row_values,
+                                    on_select=self.on_tracking_record_select, bootstyle="primary")
+        self.tree.frame.pack(fill=tk.BOTH, expand=True)
 
         # Right side: Analysis and details
         right_frame = tb.Frame(data_frame)
@@ -231,6 +689,27 @@ class ModernAdminDashboard:
         self.stats_text = scrolledtext.ScrolledText(analysis_frame, height=8)
         self.stats_text.pack(fill=tk.BOTH, expand=True)
         
+        # Raw events of the selected feature, one page at a time
+        records_frame = tb.Labelframe(right_frame, text="Feature Records", padding=10)
+        records_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
+        
+        records_controls = tb.Frame(records_frame)
+        records_controls.pack(fill=tk.X, pady=(0, 5))
+        
+        self.records_prev_button = tb.Button(records_controls, text="◀ Previous", state=tk.DISABLED,
+                                             command=self.previous_feature_records_page, bootstyle=SECONDARY)
+        self.records_prev_button.pack(side=tk.LEFT, padx=5)
+        
+        self.records_next_button = tb.Button(records_controls, text="Next ▶", state=tk.DISABLED,
+                                             command=self.next_feature_records_page, bootstyle=SECONDARY)
+        self.records_next_button.pack(side=tk.LEFT, padx=5)
+        
+        self.records_page_var = tk.StringVar(value="No feature selected")
+        tb.Label(records_controls, textvariable=self.records_page_var).pack(side=tk.LEFT, padx=10)
+        
+        self.records_text = scrolledtext.ScrolledText(records_frame, height=8)
+        self.records_text.pack(fill=tk.BOTH, expand=True)
+        
         # Frame for visualization (graphs) - initially hidden
         # Create a main container for the visualization with scrolling capability
         viz_container = tb.Frame(right_frame)
@@ -259,12 +738,8 @@ class ModernAdminDashboard:
         
         self.viz_canvas.bind("<MouseWheel>", _on_mousewheel)
     
-    def setup_errors_tab(self):
+    def setup_errors_tab(self, error_frame):
         """Setup the error reporting tab"""
-        # Main error frame
-        error_frame = tb.Frame(self.notebook)
-        self.notebook.add(error_frame, text="Error Reports")
-        
         # Controls and filters frame
         controls_frame = tb.Labelframe(error_frame, text="Error Controls & Filters", padding=10)
         controls_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -276,9 +751,36 @@ class ModernAdminDashboard:
         tb.Button(controls_frame, text="Clear Filters", 
                  command=self.clear_error_filters, bootstyle=SECONDARY).pack(side=tk.LEFT, padx=5)
         
-        # Delete button
-        tb.Button(controls_frame, text="Delete Selected Error", 
-                 command=self.delete_selected_error, bootstyle=DANGER).pack(side=tk.LEFT, padx=5)
+        # Triage buttons; the error list allows selecting many reports
+        tb.Button(controls_frame, text="Resolve Selected", 
+                 command=lambda: self.triage_selected_errors('resolve'), bootstyle=WARNING).pack(side=tk.LEFT, padx=5)
+        
+        tb.Button(controls_frame, text="Delete Selected", 
+                 command=lambda: self.triage_selected_errors('delete'), bootstyle=DANGER).pack(side=tk.LEFT, padx=5)
+        
+        bulk_button = tb.Menubutton(controls_frame, text="Bulk Actions", bootstyle=DANGER)
+        bulk_menu = tk.Menu(bulk_button, tearoff=0)
+        bulk_menu.add_command(label="Resolve Selected Group", command=lambda: self.triage_error_group('resolve'))
+        bulk_menu.add_command(label="Delete Selected Group", command=lambda: self.triage_error_group('delete'))
+        bulk_menu.add_separator()
+        bulk_menu.add_command(label="Resolve App Version...", command=lambda: self.triage_error_version('resolve'))
+        bulk_menu.add_command(label="Delete App Version...", command=lambda: self.triage_error_version('delete'))
+        bulk_menu.add_separator()
+        bulk_menu.add_command(label="Resolve Older Than...", command=lambda: self.triage_old_errors('resolve'))
+        bulk_menu.add_command(label="Delete Older Than...", command=lambda: self.triage_old_errors('delete'))
+        bulk_button['menu'] = bulk_menu
+        bulk_button.pack(side=tk.LEFT, padx=5)
+        
+        tb.Button(controls_frame, text="Error Rates", 
+                 command=self.show_error_rates, bootstyle=INFO).pack(side=tk.LEFT, padx=5)
+        
+        self.group_errors_var = tk.BooleanVar(value=True)
+        tb.Checkbutton(controls_frame, text="Group Similar Errors", variable=self.group_errors_var,
+                       command=self.load_error_reports, bootstyle="round-toggle").pack(side=tk.LEFT, padx=5)
+        
+        self.show_resolved_var = tk.BooleanVar(value=False)
+        tb.Checkbutton(controls_frame, text="Show Resolved", variable=self.show_resolved_var,
+                       command=self.load_error_reports, bootstyle="round-toggle").pack(side=tk.LEFT, padx=5)
         
         # Filters
         tb.Label(controls_frame, text="Error Type:").pack(side=tk.LEFT, padx=(20, 5))
@@ -294,12 +796,25 @@ class ModernAdminDashboard:
         tb.Label(controls_frame, text="User ID:").pack(side=tk.LEFT, padx=(10, 5))
         self.user_filter = tb.Entry(controls_frame, width=15, bootstyle="secondary")
         self.user_filter.pack(side=tk.LEFT, padx=5)
-        self.user_filter.bind('<KeyRelease>', lambda e: self.load_error_reports())
+        self.user_filter.bind('<KeyRelease>', lambda e: self.load_error_report_list())
         
         tb.Label(controls_frame, text="Question ID:").pack(side=tk.LEFT, padx=(10, 5))
         self.question_filter = tb.Entry(controls_frame, width=15, bootstyle="secondary")
         self.question_filter.pack(side=tk.LEFT, padx=5)
-        self.question_filter.bind('<KeyRelease>', lambda e: self.load_error_reports())
+        self.question_filter.bind('<KeyRelease>', lambda e: self.load_error_report_list())
+        
+        tb.Label(controls_frame, text="Search:").pack(side=tk.LEFT, padx=(10, 5))
+        self.error_search_var = tk.StringVar()
+        search_entry = tb.Entry(controls_frame, textvariable=self.error_search_var, width=20, bootstyle="secondary")
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind('<KeyRelease>', lambda e: self.load_error_report_list())
+        
+        tb.Label(controls_frame, text="Period:").pack(side=tk.LEFT, padx=(10, 5))
+        self.error_window_var = tk.StringVar(value=DEFAULT_ERROR_TIME_WINDOW)
+        window_combo = tb.Combobox(controls_frame, textvariable=self.error_window_var, width=13, state="readonly",
+                                   values=list(ERROR_TIME_WINDOWS), bootstyle="secondary")
+        window_combo.pack(side=tk.LEFT, padx=5)
+        window_combo.bind('<<ComboboxSelected>>', lambda e: self.load_error_reports())
         
         # Split error frame into two main sections
         error_data_frame = tb.Frame(error_frame)
@@ -309,56 +824,40 @@ class ModernAdminDashboard:
         left_error_frame = tb.Frame(error_data_frame)
         left_error_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # Error list frame
-        error_list_frame = tb.Labelframe(left_error_frame, text="Error Reports", padding=10)
-        error_list_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Treeview for errors
-        error_tree_frame = tb.Frame(error_list_frame)
-        error_tree_frame.pack(fill=tk.BOTH, expand=True)
-        
-        self.error_tree = tb.Treeview(error_tree_frame, 
-                                    columns=('timestamp', 'type', 'user_id', 'question_id', 'error_msg'), 
-                                    show='headings', height=20, bootstyle="primary")
+        # Error groups frame; selecting a group lists its reports below
+        self.error_groups_frame = tb.Labelframe(left_error_frame, text="Error Groups", padding=10)
+        self.error_groups_frame.pack(fill=tk.X, pady=(0, 5))
         
-        # Configure the row height to show more text
-        self.error_tree.configure(height=20)  # Increase the number of visible rows
+        # Error list frame
+        self.error_list_frame = tb.Labelframe(left_error_frame, text="Error Reports", padding=10)
+        self.error_list_frame.pack(fill=tk.BOTH, expand=True)
+        error_list_frame = self.error_list_frame
         
         # Configure row height to accommodate more text
-        self.error_tree.column("#0", width=0, stretch=False)  # Hide the first column
         style = ttk.Style()
         style.configure("Treeview", rowheight=60)  # Set row height to accommodate more text
         
-        # Define headings
-        self.error_tree.heading('timestamp', text='Timestamp')
-        self.error_tree.heading('type', text='Type')
-        self.error_tree.heading('user_id', text='User ID')
-        self.error_tree.heading('question_id', text='Question ID')
-        self.error_tree.heading('error_msg', text='Error Message')
-        
-        # Define column widths
-        self.error_tree.column('timestamp', width=150)
-        self.error_tree.column('type', width=120)
-        self.error_tree.column('user_id', width=100)
-        self.error_tree.column('question_id', width=80)
-        self.error_tree.column('error_msg', width=500)
-        
-        # Add scrollbar
-        error_v_scrollbar = tb.Scrollbar(error_tree_frame, orient=tk.VERTICAL, 
-                                       command=self.error_tree.yview, bootstyle="round")
-        self.error_tree.configure(yscrollcommand=error_v_scrollbar.set)
-        
-        self.error_tree.grid(row=0, column=0, sticky="nsew")
-        error_v_scrollbar.grid(row=0, column=1, sticky="ns")
-        
-        error_tree_frame.grid_rowconfigure(0, weight=1)
-        error_tree_frame.grid_columnconfigure(0, weight=1)
-        
-        # Bind selection event
-        self.error_tree.bind('<<TreeviewSelect>>', self.on_error_select)
+        self.error_groups_tree = VirtualTreeview(self.error_groups_frame,
+                                                 columns=[('last_seen', 'Last Seen', 150), ('error_type', 'Type', 120),
+                                                          ('report_count', 'Reports', 70), ('affected_users', 'Users', 60),
+                                                          ('versions', 'Versions', 120), ('error_msg', 'Error Message', 400)],
+                                                 key_column='fingerprint', height=4,
+                                                 on_select=self.on_error_group_select, bootstyle="primary")
+        self.error_groups_tree.frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Treeview for errors; only the rows in view are materialized
+        self.error_tree = VirtualTreeview(error_list_frame,
+                                          columns=[('timestamp', 'Timestamp', 150), ('type', 'Type', 120),
+                                                   ('user_id', 'User ID', 100), ('question_id', 'Question ID', 80),
+                                                   ('error_msg', 'Error Message', 500)],
+                                          height=20, on_select=self.on_error_select,
+                                          on_end_reached=self.load_more_error_reports, bootstyle="primary")
+        self.error_tree.frame.pack(fill=tk.BOTH, expand=True)
         
         # Bind mouse hover event to show full error message
         self.error_tree.bind('<Motion>', self.on_error_hover)
+        self.error_tree.bind('<Leave>', self.hide_error_tooltip)
+        self.error_tooltip = None
         
         # Right: Error details
         right_error_frame = tb.Frame(error_data_frame)
@@ -372,92 +871,354 @@ class ModernAdminDashboard:
         self.error_details_text.pack(fill=tk.BOTH, expand=True)
     
     def load_tracking_data(self):
-        """Load tracking data from Supabase"""
+        """Load tracking data, starting from the local cache and only fetching events newer than the last load"""
+        cache = self.tracking_cache
+        if not self.supabase_client and cache.watermark() is None:
+            messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
+            return
+        
+        client = self.supabase_client
+        start_after = self.tracking_high_water
+        read_cache = self.df is None
+        
+        self.executor.submit(
+            'tracking_data',
+            lambda request: analytics.sync_tracking_events(client, cache, start_after, read_cache,
+                                                 progress=request.progress, cancelled=lambda: request.cancelled),
+            self.on_tracking_data_loaded,
+            on_error=lambda e: self.show_request_error("Failed to load data from Supabase", e),
+            status="Loading tracking data...",
+        )
+    
+    def on_tracking_data_loaded(self, result):
+        """Merge newly fetched tracking events into the loaded data and refresh the views"""
+        cached_df, new_df, high_water = result
+        self.tracking_high_water = high_water
+        fetched = 0 if new_df is None else len(new_df)
+        
+        if cached_df is not None or new_df is not None:
+            # Merge with previously loaded data, newest first
+            self.df = analytics.merge_tracking_events([self.df, cached_df, new_df])
+            self.filter_engine = analytics.TrackingFilterEngine(self.df)
+        
+        if self.df is None or self.df.empty:
+            self.status_var.set("No tracking data found")
+            messagebox.showinfo("Info", "No tracking data found in Supabase")
+            return
+        
+        # Update filter options
+        self.update_tracking_filter_options()
+        
+        # Display records - this will update both the old records view and the new features overview
+        self.display_tracking_records()
+        self.display_features_overview()
+        
+        source = "Supabase" if self.supabase_client else "local cache (offline)"
+        self.status_var.set(f"Loaded {len(self.df)} tracking records from {source} ({fetched} new)")
+    
+    def refresh_daily_rollup(self):
+        """Bring the tracking_events_daily rollup up to date on the server"""
         if not self.supabase_client:
             messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
             return
         
+        client = self.supabase_client
+        self.executor.submit(
+            'refresh_rollup',
+            lambda request: client.rpc('refresh_tracking_events_daily', {}).execute().data,
+            self.on_daily_rollup_refreshed,
+            on_error=lambda e: self.show_request_error("Failed to refresh daily rollup", e),
+            status="Refreshing daily rollup...",
+        )
+    
+    def on_daily_rollup_refreshed(self, rows):
+        """Charts drawn from the old rollup are stale now"""
+        self.chart_cache.clear()
+        self.status_var.set(f"Daily rollup refreshed ({rows} rows written)")
+    
+    def clear_tracking_cache(self):
+        """Delete the local tracking cache so the next load downloads everything again"""
+        if not messagebox.askyesno("Clear Cache", "Delete the local tracking data cache?\n\nThe next load will download all events again."):
+            return
+        
+        self.executor.cancel('tracking_data')
         try:
-            # Load data from Supabase
-            response = self.supabase_client.table('tracking_events').select('*').order('timestamp', desc=True).execute()
-            
-            # Convert to DataFrame
-            self.df = pd.DataFrame(response.data)
-            
-            if self.df.empty:
-                messagebox.showinfo("Info", "No tracking data found in Supabase")
-                return
-            
-            # Format timestamp
-            self.df['timestamp'] = pd.to_datetime(self.df['timestamp'])
-            
-            # Update filter options
-            self.update_tracking_filter_options()
-            
-            # Display records - this will update both the old records view and the new features overview
-            self.display_tracking_records()
-            self.display_features_overview()
-            
-            self.status_var.set(f"Loaded {len(self.df)} tracking records from Supabase")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data from Supabase: {str(e)}")
+            self.tracking_cache.clear()
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to clear tracking cache: {str(e)}")
+            return
+        
+        self.df = None
+        self.filter_engine = None
+        self.tracking_high_water = None
+        self.status_var.set("Tracking cache cleared")
+    
+    def show_request_error(self, message, error):
+        """Report a failed background request"""
+        messagebox.showerror("Error", f"{message}: {str(error)}")
+        self.status_var.set(message)
     
     def load_error_reports(self, event=None):
-        """Load error reports from Supabase with optional filtering"""
+        """Load the error groups (when grouping) and the error report list"""
         if not self.supabase_client:
             messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
             return
         
-        try:
-            # Build query with filters
-            query = self.supabase_client.table('error_reports').select('*').order('timestamp', desc=True)
-            
-            # Apply filters
-            error_type = self.error_type_filter.get()
-            if error_type:
-                query = query.eq('error_type', error_type)
-            
-            user_id = self.user_filter.get().strip()
-            if user_id:
-                query = query.eq('user_id', user_id)
-            
-            question_id = self.question_filter.get().strip()
-            if question_id:
-                query = query.eq('question_id', question_id)
-            
-            # Execute query
-            response = query.execute()
-            
-            # Clear existing items
-            for item in self.error_tree.get_children():
-                self.error_tree.delete(item)
-            
-            # Add new items
-            for error in response.data:
-                timestamp = error.get('timestamp', '')[:19]  # Get only the datetime part
-                error_type = error.get('error_type', '')
-                user_id = error.get('user_id', '')
-                question_id = error.get('question_id', '')
-                error_msg = error.get('user_message', '') or error.get('error_message', '')
-                
-                # Truncate error message if too long
-                if len(error_msg) > 150:
-                    error_msg = error_msg[:150] + "..."
-                
-                self.error_tree.insert('', tk.END, values=(
-                    timestamp,
-                    error_type,
-                    user_id,
-                    question_id,
-                    error_msg
-                ), tags=(error['id'],))  # Store error ID as tag
-            
-            self.status_var.set(f"Loaded {len(response.data)} error reports")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load error reports: {str(e)}")
-            self.status_var.set("Error loading error reports")
+        if self.group_errors_var.get():
+            self.error_groups_frame.pack(fill=tk.X, pady=(0, 5), before=self.error_list_frame)
+            self.load_error_groups()
+        else:
+            self.error_groups_frame.pack_forget()
+            self.executor.cancel('error_groups')
+        
+        # An explicit reload also refreshes the cached report details
+        self.error_details_cache.clear()
+        self.load_error_report_list()
+    
+    def load_error_groups(self):
+        """Load the most recently seen error groups, optionally filtered by error type"""
+        client = self.supabase_client
+        error_type = self.error_type_filter.get()
+        since = self.get_error_window_start()
+        
+        if self.server_error_groups:
+            show_resolved = self.show_resolved_var.get()
+            self.executor.submit(
+                'error_groups', lambda request: analytics.fetch_error_groups(client, error_type, since, show_resolved),
+                self.display_error_groups,
+                on_error=self.on_error_groups_unavailable,
+                status="Loading error groups...",
+            )
+            return
+        
+        # Without the error_groups table, fingerprint the reports here
+        self.executor.submit(
+            'error_groups', lambda request: analytics.group_error_reports(client, error_type, since),
+            self.display_error_groups,
+            on_error=lambda e: self.show_request_error("Failed to load error groups", e),
+            status="Grouping error reports...",
+        )
+    
+    def on_error_groups_unavailable(self, error):
+        """Fall back to grouping reports locally when the error_groups table is not installed"""
+        print(f"Loading error groups failed, grouping reports locally: {error}")
+        self.server_error_groups = False
+        self.status_var.set("Error groups table unavailable, grouping reports locally")
+        self.load_error_groups()
+    
+    def display_error_groups(self, rows):
+        """Fill the error groups treeview"""
+        groups = pd.DataFrame(rows, columns=analytics.ERROR_GROUP_COLUMNS)
+        groups['last_seen'] = groups['last_seen'].fillna('').astype(str).str[:19]
+        groups['first_seen'] = groups['first_seen'].fillna('').astype(str).str[:19]
+        groups['versions'] = groups['app_versions'].map(lambda versions: ', '.join(versions or []))
+        messages = groups['error_message'].fillna('')
+        groups['error_msg'] = messages.where(messages.str.len() <= 150, messages.str[:150] + "...")
+        
+        self.error_groups_tree.set_data(groups)
+        self.status_var.set(f"Loaded {len(groups)} error groups")
+        
+        if self.current_error_group is not None and self.current_error_group not in set(groups['fingerprint']):
+            # The selected group is filtered out now
+            self.current_error_group = None
+            self.load_error_report_list()
+    
+    def on_error_group_select(self, event):
+        """List the reports of the selected error group"""
+        selection = self.error_groups_tree.selected_rows()
+        if selection.empty:
+            self.current_error_group = None
+        else:
+            group = selection.iloc[0]
+            self.current_error_group = group['fingerprint']
+            self.display_error_group_details(group)
+        self.load_error_report_list()
+    
+    def display_error_group_details(self, group):
+        """Summarize an error group in the details panel"""
+        details = f"""ERROR GROUP
+
+Fingerprint: {group['fingerprint']}
+Error Type: {group['error_type']}
+Reports: {group['report_count']}
+Affected Users: {group['affected_users']}
+App Versions: {group['versions'] or 'N/A'}
+First Seen: {group['first_seen']}
+Last Seen: {group['last_seen']}
+
+LATEST MESSAGE
+{group['error_message']}
+"""
+        self.error_details_text.delete(1.0, tk.END)
+        self.error_details_text.tag_configure("header", font=("TkDefaultFont", 11, "bold"))
+        self.error_details_text.tag_configure("section", font=("TkDefaultFont", 10, "bold"), foreground="blue")
+        self.error_details_text.insert(tk.END, details)
+        self.error_details_text.tag_add("header", "1.0", "1.11")  # ERROR GROUP header
+        self.error_details_text.tag_add("section", "11.0", "11.14")  # LATEST MESSAGE
+    
+    def get_error_window_start(self):
+        """ISO timestamp where the selected error time window starts, or None for all time"""
+        window = ERROR_TIME_WINDOWS.get(self.error_window_var.get())
+        if window is None:
+            return None
+        return (datetime.now(timezone.utc) - window).isoformat()
+    
+    def load_error_report_list(self):
+        """Load the first page of error reports matching the filters, plus an estimated total"""
+        if not self.supabase_client:
+            return
+        
+        grouping = self.group_errors_var.get()
+        search = self.error_search_var.get().strip()
+        filters = {
+            'error_type': self.error_type_filter.get(),
+            'user_id': self.user_filter.get().strip(),
+            'question_id': self.question_filter.get().strip(),
+            'since': self.get_error_window_start(),
+            # Shorter terms cannot use the trigram indexes
+            'search': search if len(search) >= 3 else '',
+            'fingerprint': self.current_error_group if grouping else None,
+            'server_groups': self.server_error_groups,
+            'show_resolved': self.show_resolved_var.get(),
+        }
+        
+        if grouping and not any(filters[key] for key in ('fingerprint', 'user_id', 'question_id', 'search')):
+            # Pick a group (or search for a user, question or message) to see individual reports
+            self.executor.cancel('error_reports')
+            self.executor.cancel('error_count')
+            self.error_reports_cursor = None
+            self.error_reports_loading = False
+            self.error_tree.set_data(self.error_tree.empty_data())
+            return
+        
+        self.error_reports_filters = filters
+        self.error_reports_cursor = None
+        self.error_reports_loading = True
+        self.error_reports_total = None
+        
+        # Execute queries in the background; changing a filter again supersedes them
+        self.executor.submit(
+            'error_reports', lambda request: self.fetch_error_page(filters), self.display_error_reports,
+            on_error=self.on_error_reports_failed,
+            status="Loading error reports...",
+        )
+        self.executor.submit(
+            'error_count',
+            lambda request: self.error_reports_query('id', filters, count='estimated').limit(1).execute().count,
+            self.on_error_count_loaded,
+            on_error=lambda e: print(f"Counting error reports failed: {e}"),
+        )
+    
+    def load_more_error_reports(self):
+        """Fetch the next page when the error list is scrolled to its end"""
+        if self.error_reports_cursor is None or self.error_reports_loading:
+            return
+        
+        filters, after = self.error_reports_filters, self.error_reports_cursor
+        self.error_reports_loading = True
+        self.executor.submit(
+            'error_reports', lambda request: self.fetch_error_page(filters, after),
+            lambda page: self.display_error_reports(page, append=True),
+            on_error=self.on_error_reports_failed,
+            status="Loading more error reports...",
+        )
+    
+    def error_reports_query(self, columns, filters, after=None, **select_options):
+        """error_reports query with the list filters applied, optionally continuing after a (timestamp, id) key"""
+        query = self.supabase_client.table('error_reports').select(columns, **select_options)
+        
+        if filters['error_type']:
+            query = query.eq('error_type', filters['error_type'])
+        if filters['user_id']:
+            query = query.eq('user_id', filters['user_id'])
+        if filters['question_id']:
+            query = query.eq('question_id', filters['question_id'])
+        if filters['since']:
+            query = query.gte('timestamp', filters['since'])
+        if filters['fingerprint'] is not None and filters['server_groups']:
+            query = query.eq('fingerprint', filters['fingerprint'])
+        if filters['server_groups'] and not filters['show_resolved']:
+            # resolved_at comes with the error grouping schema
+            query = query.is_('resolved_at', 'null')
+        
+        conditions = []
+        if filters['search']:
+            # Substring match on both messages, served by the trigram indexes
+            term = filters['search'].replace('\\', '\\\\').replace('"', '\\"')
+            conditions.append(f'error_message.ilike."*{term}*",user_message.ilike."*{term}*"')
+        if after:
+            # Keyset condition: (timestamp, id) < (last_timestamp, last_id)
+            last_timestamp, last_id = after
+            conditions.append(
+                f'timestamp.lt."{last_timestamp}",'
+                f'and(timestamp.eq."{last_timestamp}",id.lt."{last_id}")'
+            )
+        
+        if len(conditions) == 1:
+            query = query.or_(conditions[0])
+        elif conditions:
+            query = query.or_('and(' + ','.join(f'or({condition})' for condition in conditions) + ')')
+        return query
+    
+    def fetch_error_page(self, filters, after=None):
+        """Fetch one page of error reports, newest first; returns the reports and the key of the next page"""
+        columns = ERROR_LIST_COLUMNS
+        local_fingerprint = filters['fingerprint'] is not None and not filters['server_groups']
+        if local_fingerprint:
+            columns = columns + ['stack_trace']  # Needed to fingerprint the reports here
+        
+        # Only select the columns the list shows
+        errors = (self.error_reports_query(', '.join(columns), filters, after)
+                  .order('timestamp', desc=True).order('id', desc=True)
+                  .limit(ERROR_PAGE_SIZE).execute().data)
+        next_after = (errors[-1]['timestamp'], errors[-1]['id']) if len(errors) == ERROR_PAGE_SIZE else None
+        
+        if local_fingerprint:
+            errors = [error for error in errors if analytics.ErrorFingerprinter.fingerprint(
+                error.get('error_type'), error.get('error_message'), error.get('stack_trace')) == filters['fingerprint']]
+        return errors, next_after
+    
+    def on_error_reports_failed(self, error):
+        self.error_reports_loading = False
+        self.show_request_error("Failed to load error reports", error)
+    
+    def on_error_count_loaded(self, count):
+        self.error_reports_total = count
+        self.show_error_list_status()
+    
+    def show_error_list_status(self):
+        """Loaded and estimated total number of error reports in the status bar"""
+        status = f"Loaded {len(self.error_tree)} error reports"
+        if self.error_reports_total is not None:
+            status += f" of ~{self.error_reports_total}"
+        if self.error_reports_cursor is not None:
+            status += " (scroll down for more)"
+        self.status_var.set(status)
+    
+    def display_error_reports(self, page, append=False):
+        """Fill the error treeview with a loaded page of error reports"""
+        errors, self.error_reports_cursor = page
+        self.error_reports_loading = False
+        reports = pd.DataFrame(errors, columns=ERROR_LIST_COLUMNS)
+        
+        reports['timestamp'] = reports['timestamp'].fillna('').str[:19]  # Get only the datetime part
+        reports['type'] = reports['error_type']
+        reports['full_msg'] = reports['user_message'].where(
+            reports['user_message'].fillna('') != '', reports['error_message']).fillna('')
+        
+        # Truncate error message if too long
+        reports['error_msg'] = reports['full_msg'].where(
+            reports['full_msg'].str.len() <= 150, reports['full_msg'].str[:150] + "...")
+        
+        if append:
+            self.error_tree.append_data(reports)
+        else:
+            self.error_tree.set_data(reports)
+        self.show_error_list_status()
+        
+        if reports.empty and self.error_reports_cursor is not None:
+            # Every report of this page was filtered out locally; keep going
+            self.load_more_error_reports()
     
     def update_tracking_filter_options(self):
         """Update filter options based on loaded data"""
@@ -476,99 +1237,105 @@ class ModernAdminDashboard:
     
     def display_features_overview(self):
         """Display features overview in the treeview"""
-        # Clear existing records
-        for item in self.features_tree.get_children():
-            self.features_tree.delete(item)
+        if self.supabase_client and self.server_aggregation and not self.property_filter_var.get().strip():
+            # Let Postgres group the events and only fetch one row per feature
+            # (property filters are answered from the loaded events)
+            client = self.supabase_client
+            params = self.get_feature_overview_params()
+            self.executor.submit(
+                'features_overview',
+                lambda request: client.rpc('tracking_feature_overview', params).execute().data,
+                self.display_feature_stats,
+                on_error=lambda e: self.on_server_aggregation_error(e, self.display_features_overview),
+                status="Loading feature overview...",
+            )
+            return
         
         if self.df is None or self.df.empty:
+            self.display_feature_stats([])
             return
         
-        # Get filtered data for overview
-        filtered_df = self.get_filtered_tracking_data()
+        # Group the filtered data by feature
+        self.display_feature_stats(analytics.local_feature_overview(self.get_filtered_tracking_data()))
+    
+    def get_feature_overview_params(self):
+        """Current action and date filters as parameters for tracking_feature_overview"""
+        return analytics.feature_overview_params(self.action_var.get(), self.date_from_var.get(), self.date_to_var.get())
+    
+    def on_server_aggregation_error(self, error, retry):
+        """Fall back to aggregating locally when the aggregation functions are not installed.
+        
+        Other failures (timeouts, server errors) are reported and leave server-side aggregation on.
+        """
+        if not backends.is_missing_function(error):
+            self.show_request_error("Failed to load feature statistics", error)
+            return
+        
+        print(f"Server-side aggregation unavailable, falling back to local data: {error}")
+        self.server_aggregation = False
+        self.status_var.set("Server-side aggregation unavailable, using locally loaded data")
+        retry()
+    
+    def display_feature_stats(self, feature_stats):
+        """Fill the features treeview with one row of statistics per feature"""
+        # Clear existing records
+        for item in self.features_tree.get_children():
+            self.features_tree.delete(item)
         
-        # Group by features and calculate statistics
-        feature_stats = filtered_df.groupby('event_name').agg({
-            'id': 'count',  # Total usage count
-            'user_id': 'nunique',  # Unique users
-            'timestamp': 'max'  # Last used
-        }).reset_index()
+        # Without locally loaded data the overview is the only source of feature names
+        if self.df is None and feature_stats:
+            self.feature_combo['values'] = ['All'] + sorted(row['event_name'] for row in feature_stats)
         
-        # Rename columns for clarity
-        feature_stats.columns = ['Feature', 'UsageCount', 'UniqueUsers', 'LastUsed']
+        feature = self.feature_var.get()
+        if feature and feature != 'All':
+            feature_stats = [row for row in feature_stats if row['event_name'] == feature]
         
         # Insert records into features tree
-        for _, row in feature_stats.iterrows():
+        for row in feature_stats:
+            last_used = pd.to_datetime(row['last_used']) if row['last_used'] is not None else None
             values = [
-                row['Feature'],
-                row['UsageCount'],
-                row['UniqueUsers'],
-                row['LastUsed'].strftime('%Y-%m-%d %H:%M:%S') if pd.notna(row['LastUsed']) else 'N/A'
+                row['event_name'],
+                row['usage_count'],
+                row['unique_users'],
+                last_used.strftime('%Y-%m-%d %H:%M:%S') if pd.notna(last_used) else 'N/A'
             ]
             
             self.features_tree.insert('', 'end', values=values)
     
     def display_tracking_records(self):
-        """Display detailed tracking records in the old records treeview"""
-        # Clear existing records in the old treeview (for backwards compatibility)
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get filtered data
-        filtered_df = self.get_filtered_tracking_data()
-        
-        # Insert records
-        for _, row in filtered_df.iterrows():
-            # Format properties for display (truncate if too long)
-            props_str = str(row.get('properties', ''))
-            if len(props_str) > 100:
-                props_str = props_str[:100] + "..."
-                
-            values = [
-                row.get('id', ''),
-                row.get('user_id', ''),
-                row.get('event_type', ''),
-                row.get('event_name', ''),
-                props_str,
-                row.get('timestamp', '')
-            ]
-            
-            self.tree.insert('', 'end', values=values)
+        """Display detailed tracking records in the records treeview"""
+        # Only the visible window of rows is turned into treeview items
+        self.tree.set_data(self.get_filtered_tracking_data())
+    
+    def tracking_row_values(self, rows):
+        """Display values for the visible window of tracking records"""
+        window = pd.DataFrame(index=rows.index)
+        for column in ('id', 'user_id', 'event_type', 'event_name', 'properties', 'timestamp'):
+            window[column] = rows[column].astype(object) if column in rows else ''
+        window = window.where(window.notna(), '')
+        
+        # Format properties for display (truncate if too long)
+        props = window['properties'].map(str)
+        window['properties'] = props.where(props.str.len() <= 100, props.str[:100] + "...")
+        
+        return window.itertuples(index=False, name=None)
     
     def get_filtered_tracking_data(self):
         """Get tracking data based on current filters"""
-        if self.df is None or self.df.empty:
+        if self.df is None or self.df.empty or self.filter_engine is None:
             return pd.DataFrame()
         
-        filtered_df = self.df.copy()
-        
-        # Apply feature filter
-        feature = self.feature_var.get()
-        if feature and feature != 'All':
-            filtered_df = filtered_df[filtered_df['event_name'] == feature]
-        
-        # Apply action filter
-        action = self.action_var.get()
-        if action and action != 'All':
-            filtered_df = filtered_df[filtered_df['event_type'] == action]
-        
-        # Apply date filter
-        date_from = self.date_from_var.get()
-        if date_from:
-            try:
-                date_from_dt = datetime.strptime(date_from, '%Y-%m-%d')
-                filtered_df = filtered_df[filtered_df['timestamp'] >= date_from_dt]
-            except ValueError:
-                pass
-        
-        date_to = self.date_to_var.get()
-        if date_to:
-            try:
-                date_to_dt = datetime.strptime(date_to, '%Y-%m-%d')
-                filtered_df = filtered_df[filtered_df['timestamp'] <= date_to_dt]
-            except ValueError:
-                pass
-        
-        return filtered_df
+        filters = dict(
+            feature=self.feature_var.get(),
+            action=self.action_var.get(),
+            date_from=self.date_from_var.get(),
+            date_to=self.date_to_var.get(),
+        )
+        try:
+            return self.filter_engine.filter(properties=self.property_filter_var.get().strip(), **filters)
+        except ValueError as e:
+            self.status_var.set(f"Property filter ignored: {str(e)}")
+            return self.filter_engine.filter(**filters)
     
     def apply_tracking_filters(self):
         """Apply filters to tracking data"""
@@ -584,142 +1351,194 @@ class ModernAdminDashboard:
         item = self.features_tree.item(selection[0])
         feature_name = item['values'][0]  # Feature name is in the first column
         
+        self.request_feature_aggregates(feature_name, self.show_feature_details)
+    
+    def request_feature_aggregates(self, feature_name, on_ready, key='feature_details'):
+        """Compute summary and breakdowns for a feature, in Postgres when possible, and pass them to on_ready"""
+        if self.supabase_client and self.server_aggregation:
+            client = self.supabase_client
+            
+            self.executor.submit(
+                key, lambda request: analytics.fetch_feature_aggregates(client, feature_name),
+                lambda result: on_ready(feature_name, *result),
+                on_error=lambda e: self.on_server_aggregation_error(
+                    e, lambda: self.request_feature_aggregates(feature_name, on_ready, key)),
+                status=f"Loading statistics for {feature_name}...",
+            )
+            return
+        
         if self.df is None or self.df.empty:
             return
         
         # Filter for the selected feature
-        feature_df = self.df[self.df['event_name'] == feature_name]
-        
-        if feature_df.empty:
+        feature_df = self.filter_engine.filter(feature=feature_name)
+        on_ready(feature_name, *analytics.local_feature_aggregates(feature_df))
+    
+    def show_feature_details(self, feature_name, summary, breakdown):
+        """Show details, statistics, exact records and charts for the selected feature"""
+        if not summary['total_events']:
             self.details_text.delete(1.0, tk.END)
             self.details_text.insert(tk.END, f"No detailed data found for feature: {feature_name}")
             return
         
         # Display simplified detailed information about this feature
         details = f"Feature: {feature_name}\n"
-        details += f"Total Usage: {len(feature_df)} events\n"
-        details += f"Unique Users: {feature_df['user_id'].nunique()}\n"
-        details += f"Date Range: {feature_df['timestamp'].min()} to {feature_df['timestamp'].max()}\n"
-        details += f"First Used: {feature_df['timestamp'].min()}\n"
-        details += f"Last Used: {feature_df['timestamp'].max()}\n"
+        details += f"Total Usage: {summary['total_events']} events\n"
+        details += f"Unique Users: {summary['unique_users']}\n"
+        details += f"Date Range: {summary['first_used']} to {summary['last_used']}\n"
+        details += f"First Used: {summary['first_used']}\n"
+        details += f"Last Used: {summary['last_used']}\n"
         
         self.details_text.delete(1.0, tk.END)
         self.details_text.insert(tk.END, details)
         
         # Update the stats text with breakdown and detailed records
-        stats = []
-        stats.append(f"Feature: {feature_name}")
-        stats.append(f"Total Events: {len(feature_df)}")
-        stats.append(f"Unique Users: {feature_df['user_id'].nunique()}")
-        stats.append(f"Date Range: {feature_df['timestamp'].min()} to {feature_df['timestamp'].max()}")
-        
-        # Actions breakdown
-        action_counts = feature_df['event_type'].value_counts()
-        stats.append("\nEvent Type Breakdown:")
-        for action, count in action_counts.items():
-            stats.append(f"  {action}: {count}")
-        
-        # Daily usage pattern
-        daily_usage = feature_df.groupby(feature_df['timestamp'].dt.date).size()
-        if len(daily_usage) > 1:
-            stats.append(f"\nDaily Average: {daily_usage.mean():.2f} events per day")
-            stats.append(f"Peak Day: {daily_usage.idxmax()} with {daily_usage.max()} events")
-        
-        # Platform breakdown
-        platform_counts = feature_df['platform'].value_counts()
-        stats.append("\nPlatform Breakdown:")
-        for platform, count in platform_counts.items():
-            if pd.notna(platform):  # Skip NaN values
-                stats.append(f"  {platform}: {count}")
-        
-        # App version breakdown
-        version_counts = feature_df['app_version'].value_counts()
-        stats.append("\nApp Version Breakdown:")
-        for version, count in version_counts.items():
-            if pd.notna(version):  # Skip NaN values
-                stats.append(f"  {version}: {count}")
-        
-        # Add exact records to the breakdown
-        stats.append(f"\nExact Records ({len(feature_df)} total):")
-        stats.append("-" * 30)
-        
-        # Add all records with their details
-        for idx, (_, row) in enumerate(feature_df.iterrows()):
-            stats.append(f"Record #{idx + 1}:")
-            stats.append(f"  ID: {row.get('id', 'N/A')}")
-            stats.append(f"  User ID: {row.get('user_id', 'N/A')}")
-            stats.append(f"  Event Type: {row.get('event_type', 'N/A')}")
-            stats.append(f"  Properties: {json.dumps(json.loads(row.get('properties', '{}')), indent=2) if row.get('properties') else '{}'}")
-            stats.append(f"  Timestamp: {row.get('timestamp', 'N/A')}")
-            stats.append(f"  Screen Name: {row.get('screen_name', 'N/A')}")
-            stats.append(f"  Session ID: {row.get('session_id', 'N/A')}")
-            stats.append(f"  Device Info: {row.get('device_info', 'N/A')}")
-            stats.append(f"  App Version: {row.get('app_version', 'N/A')}")
-            stats.append(f"  Build Number: {row.get('build_number', 'N/A')}")
-            stats.append(f"  Platform: {row.get('platform', 'N/A')}")
-            stats.append("")
-        
-        # Display statistics and exact records
+        stats = analytics.format_feature_stats(feature_name, summary, breakdown)
+        
+        if self.df is not None and not self.df.empty:
+            # Summarize the properties sent with this feature's events
+            property_summary = self.filter_engine.properties.describe(
+                self.filter_engine.positions(feature=feature_name))
+            if property_summary:
+                stats.append("\nProperties:")
+                for key, count, summary_line in property_summary:
+                    stats.append(f"  {key} ({count} events): {summary_line}")
+        
+        # Display statistics
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(tk.END, "\n".join(stats))
+        self.status_var.set(f"Showing statistics for {feature_name}")
+        
+        # Exact records are fetched one page at a time
+        self.feature_records_name = feature_name
+        self.feature_records_total = summary['total_events']
+        self.load_feature_records(0)
         
         # Automatically generate and show visualization for the selected feature
         self.visualize_feature_usage_for_feature(feature_name)
     
+    def show_feature_stats(self, feature_name, summary, breakdown):
+        """Show only the statistics of a feature in the stats panel"""
+        self.stats_text.delete(1.0, tk.END)
+        if not summary['total_events']:
+            self.stats_text.insert(tk.END, f"No data found for feature: {feature_name}")
+            return
+        
+        self.stats_text.insert(tk.END, "\n".join(analytics.format_feature_stats(feature_name, summary, breakdown)))
+    
     def on_tracking_record_select(self, event):
         """Handle tracking record selection"""
-        selection = self.tree.selection()
-        if not selection:
+        selection = self.tree.selected_rows()
+        if selection.empty:
             return
         
-        item = self.tree.item(selection[0])
-        values = item['values']
-        
-        # Find the corresponding record in the dataframe
-        if self.df is not None and not self.df.empty:
-            # Get the index based on the selected record
-            try:
-                record_id = values[0]  # Assuming first column is ID
-                record = self.df[self.df['id'] == record_id].iloc[0]
-                
-                # Display detailed information
-                details = f"ID: {record.get('id', 'N/A')}\n"
-                details += f"User ID: {record.get('user_id', 'N/A')}\n"
-                details += f"Event Type: {record.get('event_type', 'N/A')}\n"
-                details += f"Event Name: {record.get('event_name', 'N/A')}\n"
-                details += f"Properties: {json.dumps(json.loads(record.get('properties', '{}')), indent=2) if record.get('properties') else '{}'}\n"
-                details += f"Timestamp: {record.get('timestamp', 'N/A')}\n"
-                details += f"Screen Name: {record.get('screen_name', 'N/A')}\n"
-                details += f"Session ID: {record.get('session_id', 'N/A')}\n"
-                details += f"Device Info: {record.get('device_info', 'N/A')}\n"
-                details += f"App Version: {record.get('app_version', 'N/A')}\n"
-                details += f"Build Number: {record.get('build_number', 'N/A')}\n"
-                details += f"Platform: {record.get('platform', 'N/A')}\n"
-                
-                self.details_text.delete(1.0, tk.END)
-                self.details_text.insert(tk.END, details)
-            except Exception as e:
-                print(f"Error showing record details: {e}")
-                pass  # Handle case where record isn't found
+        try:
+            # Display detailed information
+            details = self.format_tracking_record(selection.iloc[0])
+            
+            self.details_text.delete(1.0, tk.END)
+            self.details_text.insert(tk.END, details)
+        except Exception as e:
+            print(f"Error showing record details: {e}")
     
-    def analyze_feature_usage(self):
-        """Analyze usage of selected feature"""
+    def format_tracking_record(self, record):
+        """Format a single tracking event as text"""
+        details = f"ID: {record.get('id', 'N/A')}\n"
+        details += f"User ID: {record.get('user_id', 'N/A')}\n"
+        details += f"Event Type: {record.get('event_type', 'N/A')}\n"
+        details += f"Event Name: {record.get('event_name', 'N/A')}\n"
+        details += f"Properties: {json.dumps(analytics.PropertiesStore.decode(record.get('properties')), indent=2)}\n"
+        details += f"Timestamp: {record.get('timestamp', 'N/A')}\n"
+        details += f"Screen Name: {record.get('screen_name', 'N/A')}\n"
+        details += f"Session ID: {record.get('session_id', 'N/A')}\n"
+        details += f"Device Info: {record.get('device_info', 'N/A')}\n"
+        details += f"App Version: {record.get('app_version', 'N/A')}\n"
+        details += f"Build Number: {record.get('build_number', 'N/A')}\n"
+        details += f"Platform: {record.get('platform', 'N/A')}\n"
+        return details
+    
+    def load_feature_records(self, offset):
+        """Fetch one page of the selected feature's raw events, newest first"""
+        feature_name = self.feature_records_name
+        if feature_name is None:
+            return
+        
+        self.records_prev_button.configure(state=tk.DISABLED)
+        self.records_next_button.configure(state=tk.DISABLED)
+        
+        if self.supabase_client:
+            client = self.supabase_client
+            
+            def fetch(request):
+                return (client.table('tracking_events').select('*')
+                        .eq('event_name', feature_name)
+                        .order('timestamp', desc=True)
+                        .order('id', desc=True)
+                        .range(offset, offset + FEATURE_RECORDS_PAGE_SIZE - 1)
+                        .execute().data)
+            
+            self.executor.submit(
+                'feature_records',
+                fetch,
+                lambda rows: self.display_feature_records(feature_name, offset, rows),
+                on_error=lambda e: self.show_request_error("Failed to load feature records", e),
+                status=f"Loading records for {feature_name}...",
+            )
+            return
+        
         if self.df is None or self.df.empty:
             return
         
+        feature_df = self.filter_engine.filter(feature=feature_name)
+        page = feature_df.iloc[offset:offset + FEATURE_RECORDS_PAGE_SIZE]
+        self.display_feature_records(feature_name, offset, page.to_dict('records'))
+    
+    def display_feature_records(self, feature_name, offset, rows):
+        """Show a page of raw events in the feature records browser"""
+        if feature_name != self.feature_records_name:
+            return
+        
+        self.feature_records_offset = offset
+        total = self.feature_records_total
+        
+        self.records_text.delete(1.0, tk.END)
+        lines = []
+        for idx, record in enumerate(rows):
+            lines.append(f"Record #{offset + idx + 1}:")
+            lines.append(self.format_tracking_record(record))
+        self.records_text.insert(tk.END, "\n".join(lines) if lines else f"No records found for feature: {feature_name}")
+        
+        if rows:
+            self.records_page_var.set(f"Records {offset + 1}-{offset + len(rows)} of {total}")
+        else:
+            self.records_page_var.set(f"No records ({total} total)")
+        
+        self.records_prev_button.configure(state=tk.NORMAL if offset > 0 else tk.DISABLED)
+        has_next = offset + len(rows) < total and len(rows) == FEATURE_RECORDS_PAGE_SIZE
+        self.records_next_button.configure(state=tk.NORMAL if has_next else tk.DISABLED)
+    
+    def next_feature_records_page(self):
+        """Show the next page of the selected feature's raw events"""
+        self.load_feature_records(self.feature_records_offset + FEATURE_RECORDS_PAGE_SIZE)
+    
+    def previous_feature_records_page(self):
+        """Show the previous page of the selected feature's raw events"""
+        self.load_feature_records(max(0, self.feature_records_offset - FEATURE_RECORDS_PAGE_SIZE))
+    
+    def analyze_feature_usage(self):
+        """Analyze usage of selected feature"""
         # First try to get the feature from features_tree (new interface)
         selected_feature_item = self.features_tree.selection()
         
-        # If no selection in features_tree, try the old tree
+        # If no selection in features_tree, try the tracking records
         if not selected_feature_item:
-            selected_item = self.tree.selection()
-            if not selected_item:
+            selected_records = self.tree.selected_rows()
+            if selected_records.empty:
                 messagebox.showwarning("Warning", "Please select a feature from the overview or a tracking record to analyze")
                 return
         
-            # Get the feature name from the selected record in old tree
-            item = self.tree.item(selected_item[0])
-            feature_name = item['values'][3]  # Event name is in the 4th column
+            # Get the feature name from the selected tracking record
+            feature_name = selected_records.iloc[0]['event_name']
         else:
             # Get the feature name from the selected item in features tree
             item = self.features_tree.item(selected_feature_item[0])
@@ -729,50 +1548,7 @@ class ModernAdminDashboard:
             messagebox.showwarning("Warning", "No feature selected for analysis")
             return
         
-        # Filter for the selected feature
-        feature_df = self.df[self.df['event_name'] == feature_name]
-        
-        if feature_df.empty:
-            self.stats_text.delete(1.0, tk.END)
-            self.stats_text.insert(tk.END, f"No data found for feature: {feature_name}")
-            return
-        
-        # Calculate statistics
-        stats = []
-        stats.append(f"Feature: {feature_name}")
-        stats.append(f"Total Events: {len(feature_df)}")
-        stats.append(f"Unique Users: {feature_df['user_id'].nunique()}")
-        stats.append(f"Date Range: {feature_df['timestamp'].min()} to {feature_df['timestamp'].max()}")
-        
-        # Actions breakdown
-        action_counts = feature_df['event_type'].value_counts()
-        stats.append("\nEvent Type Breakdown:")
-        for action, count in action_counts.items():
-            stats.append(f"  {action}: {count}")
-        
-        # Daily usage pattern
-        daily_usage = feature_df.groupby(feature_df['timestamp'].dt.date).size()
-        if len(daily_usage) > 1:
-            stats.append(f"\nDaily Average: {daily_usage.mean():.2f} events per day")
-            stats.append(f"Peak Day: {daily_usage.idxmax()} with {daily_usage.max()} events")
-        
-        # Platform breakdown
-        platform_counts = feature_df['platform'].value_counts()
-        stats.append("\nPlatform Breakdown:")
-        for platform, count in platform_counts.items():
-            if pd.notna(platform):  # Skip NaN values
-                stats.append(f"  {platform}: {count}")
-        
-        # App version breakdown
-        version_counts = feature_df['app_version'].value_counts()
-        stats.append("\nApp Version Breakdown:")
-        for version, count in version_counts.items():
-            if pd.notna(version):  # Skip NaN values
-                stats.append(f"  {version}: {count}")
-        
-        # Display statistics
-        self.stats_text.delete(1.0, tk.END)
-        self.stats_text.insert(tk.END, "\n".join(stats))
+        self.request_feature_aggregates(feature_name, self.show_feature_stats, key='feature_stats')
     
     def visualize_feature_usage(self):
         """Visualize feature usage with matplotlib"""
@@ -782,16 +1558,15 @@ class ModernAdminDashboard:
         # First try to get the feature from features_tree (new interface)
         selected_feature_item = self.features_tree.selection()
         
-        # If no selection in features_tree, try the old tree
+        # If no selection in features_tree, try the tracking records
         if not selected_feature_item:
-            selected_item = self.tree.selection()
-            if not selected_item:
+            selected_records = self.tree.selected_rows()
+            if selected_records.empty:
                 messagebox.showwarning("Warning", "Please select a feature from the overview or a tracking record to visualize")
                 return
         
-            # Get the feature name from the selected record in old tree
-            item = self.tree.item(selected_item[0])
-            feature_name = item['values'][3]  # Event name is in the 4th column
+            # Get the feature name from the selected tracking record
+            feature_name = selected_records.iloc[0]['event_name']
         else:
             # Get the feature name from the selected item in features tree
             item = self.features_tree.item(selected_feature_item[0])
@@ -805,88 +1580,82 @@ class ModernAdminDashboard:
         self.visualize_feature_usage_for_feature(feature_name)
 
     def visualize_feature_usage_for_feature(self, feature_name):
-        """Visualize feature usage for a specific feature"""
+        """Visualize feature usage for a specific feature from its daily event counts"""
+        cache_key = self.chart_cache_key(feature_name)
+        if cache_key in self.chart_cache:
+            self.chart_cache.move_to_end(cache_key)
+            self.show_chart_image(self.chart_cache[cache_key])
+            return
+        
+        if self.supabase_client and self.server_aggregation:
+            # Read the daily rollup instead of the raw events
+            client = self.supabase_client
+            
+            def fetch(request):
+                daily_df = analytics.fetch_feature_daily(client, feature_name, cancelled=lambda: request.cancelled)
+                return self.render_feature_chart(feature_name, daily_df)
+            
+            self.executor.submit(
+                'feature_chart', fetch,
+                lambda png_data: self.draw_feature_charts(feature_name, png_data, cache_key),
+                on_error=lambda e: self.on_server_aggregation_error(
+                    e, lambda: self.visualize_feature_usage_for_feature(feature_name)),
+            )
+            return
+        
         if self.df is None or self.df.empty:
             return
 
         # Filter for the selected feature
-        feature_df = self.df[self.df['event_name'] == feature_name]
+        feature_df = self.filter_engine.filter(feature=feature_name)
         
         if feature_df.empty:
             return  # Don't show visualization if there's no data
         
-        # Clear any existing visualization
-        for widget in self.viz_frame.winfo_children():
-            widget.destroy()
-        
-        # Calculate the number of subplots to determine figure size
-        n_plots = 4
-        fig, axes = plt.subplots(n_plots, 1, figsize=(10, 4*n_plots))
-        fig.suptitle(f'Feature Usage Analysis: {feature_name}', fontsize=14)
-        
-        # Make sure axes is always a list, even if there's only one subplot
-        if n_plots == 1:
-            axes = [axes]
-        
-        # Plot 1: Event types over time
-        event_counts = feature_df.groupby([feature_df['timestamp'].dt.date, 'event_type']).size().unstack(fill_value=0)
-        if not event_counts.empty:
-            event_counts.plot(kind='bar', ax=axes[0], width=0.8)
-            axes[0].set_title('Event Types Over Time')
-            axes[0].set_xlabel('Date')
-            axes[0].set_ylabel('Event Count')
-            axes[0].tick_params(axis='x', rotation=45)
-        else:
-            axes[0].text(0.5, 0.5, 'No data available', horizontalalignment='center', 
-                          verticalalignment='center', transform=axes[0].transAxes)
-            axes[0].set_title('Event Types Over Time')
-        
-        # Plot 2: Platform distribution
-        platform_counts = feature_df['platform'].value_counts()
-        if not platform_counts.empty and len(platform_counts) > 0:
-            axes[1].pie(platform_counts.values, labels=platform_counts.index, autopct='%1.1f%%')
-            axes[1].set_title('Platform Distribution')
-        else:
-            axes[1].text(0.5, 0.5, 'No platform data', horizontalalignment='center', 
-                          verticalalignment='center', transform=axes[1].transAxes)
-            axes[1].set_title('Platform Distribution')
-        
-        # Plot 3: Daily activity pattern
-        daily_counts = feature_df.groupby(feature_df['timestamp'].dt.date).size()
-        if not daily_counts.empty:
-            axes[2].plot(daily_counts.index, daily_counts.values, marker='o')
-            axes[2].set_title('Daily Activity Trend')
-            axes[2].set_xlabel('Date')
-            axes[2].set_ylabel('Event Count')
-            axes[2].tick_params(axis='x', rotation=45)
-        else:
-            axes[2].text(0.5, 0.5, 'No daily data', horizontalalignment='center', 
-                          verticalalignment='center', transform=axes[2].transAxes)
-            axes[2].set_title('Daily Activity Trend')
-        
-        # Plot 4: App version distribution
-        version_counts = feature_df['app_version'].value_counts()
-        if not version_counts.empty and len(version_counts) > 0:
-            axes[3].bar(version_counts.index, version_counts.values)
-            axes[3].set_title('App Version Distribution')
-            axes[3].set_xlabel('App Version')
-            axes[3].set_ylabel('Event Count')
-            axes[3].tick_params(axis='x', rotation=45)
-        else:
-            axes[3].text(0.5, 0.5, 'No version data', horizontalalignment='center', 
-                          verticalalignment='center', transform=axes[3].transAxes)
-            axes[3].set_title('App Version Distribution')
-        
-        # Adjust layout to prevent overlap
-        plt.tight_layout()
-        
-        # Embed the plot in the dashboard frame
-        figure_canvas = FigureCanvasTkAgg(fig, master=self.viz_frame)
-        figure_canvas.draw()
-        figure_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.executor.submit(
+            'feature_chart', lambda request: self.render_feature_chart(feature_name, analytics.local_feature_daily(feature_df)),
+            lambda png_data: self.draw_feature_charts(feature_name, png_data, cache_key),
+            on_error=lambda e: self.show_request_error("Failed to draw feature charts", e),
+        )
+    
+    def chart_cache_key(self, feature_name):
+        """Charts stay valid until newer events are loaded, the filters or the data source change.
+        
+        Charts drawn from the server expire after SERVER_CHART_TTL instead, as the dashboard does not
+        see new events arrive there (refreshing the daily rollup clears the cache as well).
+        """
+        server = bool(self.supabase_client and self.server_aggregation)
+        filters = (self.action_var.get(), self.date_from_var.get(), self.date_to_var.get(),
+                   self.property_filter_var.get().strip())
+        version = int(time.time() // SERVER_CHART_TTL) if server else self.tracking_high_water
+        return (feature_name, filters, version, server)
+    
+    def render_feature_chart(self, feature_name, daily_df):
+        """Render the charts of a feature (called on a worker thread); None when there is no data"""
+        if daily_df.empty:
+            return None  # Don't show visualization if there's no data
+        return self.feature_chart.render(feature_name, daily_df)
+    
+    def draw_feature_charts(self, feature_name, png_data, cache_key=None):
+        """Show the rendered usage charts of a feature and remember them for the next selection"""
+        if png_data is None:
+            return
         
-        # Store reference to canvas to prevent garbage collection
-        self.canvas = figure_canvas
+        image = tk.PhotoImage(data=png_data)
+        if cache_key is not None:
+            self.chart_cache[cache_key] = image
+            while len(self.chart_cache) > 16:
+                self.chart_cache.popitem(last=False)
+        self.show_chart_image(image)
+    
+    def show_chart_image(self, image):
+        """Put a rendered chart image in the visualization panel"""
+        # The same label is reused for every chart; keep a reference to the image
+        if self.chart_image_label is None:
+            self.chart_image_label = tb.Label(self.viz_frame)
+            self.chart_image_label.pack(fill=tk.BOTH, expand=True)
+        self.chart_image_label.configure(image=image)
+        self.chart_image = image
         
         # Update the scroll region to include all content
         self.viz_frame.update_idletasks()
@@ -900,29 +1669,56 @@ class ModernAdminDashboard:
     
     def on_error_select(self, event):
         """Handle error selection in the treeview"""
-        selection = self.error_tree.selection()
-        if not selection:
+        selection = self.error_tree.selected_rows()
+        if selection.empty:
             return
         
-        item = self.error_tree.item(selection[0])
-        error_id = item['tags'][0]  # Get error ID from tags
+        error_id = selection.iloc[0]['id']
         
         self.current_error_id = error_id
         self.show_error_details(error_id)
     
     def show_error_details(self, error_id):
-        """Show detailed information for a selected error"""
+        """Show detailed information for a selected error, fetching the full report only once"""
+        if error_id in self.error_details_cache:
+            self.error_details_cache.move_to_end(error_id)
+            self.executor.cancel('error_details')
+            self.display_error_details([self.error_details_cache[error_id]])
+            return
+        
         if not self.supabase_client:
             return
         
+        query = self.supabase_client.table('error_reports').select('*').eq('id', error_id)
+        self.executor.submit(
+            'error_details', lambda request: query.execute().data, self.on_error_details_loaded,
+            on_error=self.display_error_details_failure,
+            status="Loading error details...",
+        )
+    
+    def on_error_details_loaded(self, rows):
+        """Remember a fetched error report and show it"""
+        for error in rows:
+            self.error_details_cache[error['id']] = error
+        while len(self.error_details_cache) > ERROR_DETAILS_CACHE_SIZE:
+            self.error_details_cache.popitem(last=False)
+        self.display_error_details(rows)
+    
+    def display_error_details_failure(self, error):
+        """Show why the error details could not be loaded"""
+        self.error_details_text.delete(1.0, tk.END)
+        self.error_details_text.insert(tk.END, f"Error loading details: {str(error)}")
+    
+    def display_error_details(self, rows):
+        """Render a loaded error report in the details panel"""
         try:
-            response = self.supabase_client.table('error_reports').select('*').eq('id', error_id).execute()
-            if not response.data:
+            if not rows:
                 self.error_details_text.delete(1.0, tk.END)
                 self.error_details_text.insert(tk.END, "Error not found")
                 return
             
-            error = response.data[0]
+            error = rows[0]
+            self.status_var.set(f"Loaded error report {error.get('id', '')}")
             
             # Clear text widget
             self.error_details_text.delete(1.0, tk.END)
@@ -969,92 +1765,315 @@ Build Number: {error.get('build_number', 'N/A')}
             self.error_details_text.insert(tk.END, details)
             
         except Exception as e:
-            self.error_details_text.delete(1.0, tk.END)
-            self.error_details_text.insert(tk.END, f"Error loading details: {str(e)}")
+            self.display_error_details_failure(e)
     
     def on_error_hover(self, event):
         """Show full error message when hovering over error message column"""
-        # Get the item at the current mouse position
-        item_id = self.error_tree.identify_row(event.y)
-        column = self.error_tree.identify_column(event.x)
-        
-        # Check if the hover is over the error message column (index 4)
-        if item_id and column == "#4":  # error_msg column (0-indexed as 4, but 1-indexed as #5)
-            # Get the full error message from the treeview item
-            item_values = self.error_tree.item(item_id, 'values')
-            
-            # Only show if we're over the error message column
-            if len(item_values) > 4:  # Ensure the error message exists
-                error_msg = item_values[4]  # The error message
-                
-                # Get the actual full error message from the original data
-                # This requires us to store the full message when loading errors
-                # For now, we can only show the truncated message in the tooltip
-                tw = tk.Toplevel()
-                tw.wm_overrideredirect(True)
-                tw.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
-                label = tk.Label(tw, text=error_msg, justify='left',
-                                background="#ffffe0", relief='solid', borderwidth=1,
-                                font=("TkDefaultFont", 10))
-                label.pack(ipadx=1)
-                
-                def hide_tooltip(event):
-                    tw.destroy()
-                
-                # Hide tooltip when mouse leaves the error_tree
-                self.error_tree.bind('<Leave>', hide_tooltip)
+        # Get the record at the current mouse position
+        record = self.error_tree.record_at(event.y)
+        column = self.error_tree.tree.identify_column(event.x)
+        
+        # Only show if we're over the error message column (the 5th column)
+        if record is None or column != "#5" or not record['full_msg']:
+            self.hide_error_tooltip()
+            return
+        
+        if self.error_tooltip is not None and self.error_tooltip.error_id == record['id']:
+            self.error_tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+            return
+        
+        self.hide_error_tooltip()
+        tw = tk.Toplevel()
+        tw.wm_overrideredirect(True)
+        tw.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+        label = tk.Label(tw, text=record['full_msg'], justify='left', wraplength=600,
+                        background="#ffffe0", relief='solid', borderwidth=1,
+                        font=("TkDefaultFont", 10))
+        label.pack(ipadx=1)
+        tw.error_id = record['id']
+        self.error_tooltip = tw
+    
+    def hide_error_tooltip(self, event=None):
+        """Remove the error message tooltip"""
+        if self.error_tooltip is not None:
+            self.error_tooltip.destroy()
+            self.error_tooltip = None
                 
     def clear_error_filters(self):
         """Clear all error filters and reload all errors"""
         self.error_type_filter.set('')
         self.user_filter.delete(0, tk.END)
         self.question_filter.delete(0, tk.END)
+        self.error_search_var.set('')
+        self.error_window_var.set(DEFAULT_ERROR_TIME_WINDOW)
         self.load_error_reports()
     
-    def delete_selected_error(self):
-        """Delete the currently selected error report from the database"""
+    def show_error_rates(self):
+        """Open the error rates per release window, or bring it to the front"""
+        if self.error_rate_window is not None:
+            self.error_rate_window.lift()
+            self.refresh_error_rates()
+            return
+        
+        window = tb.Toplevel(self.root)
+        window.title("Error Rates by Release")
+        window.geometry("900x500")
+        window.protocol("WM_DELETE_WINDOW", self.close_error_rates)
+        self.error_rate_window = window
+        
+        controls_frame = tb.Frame(window, padding=10)
+        controls_frame.pack(fill=tk.X)
+        
+        tb.Button(controls_frame, text="Refresh", command=self.refresh_error_rates,
+                 bootstyle=SUCCESS).pack(side=tk.LEFT, padx=5)
+        
+        self.error_rate_by_type_var = tk.BooleanVar(value=False)
+        tb.Checkbutton(controls_frame, text="Per Error Type", variable=self.error_rate_by_type_var,
+                       command=self.display_error_rates, bootstyle="round-toggle").pack(side=tk.LEFT, padx=5)
+        
+        self.error_rate_info_var = tk.StringVar()
+        tb.Label(controls_frame, textvariable=self.error_rate_info_var).pack(side=tk.LEFT, padx=10)
+        
+        columns = [('app_version', 'App Version', 100), ('error_type', 'Error Type', 180), ('errors', 'Errors', 70),
+                   ('sessions', 'Session-Hours', 90), ('rate', 'Errors / 1000 Session-Hours', 170),
+                   ('baseline_rate', 'Other Versions', 110), ('z_score', 'z', 60), ('status', 'Status', 100)]
+        self.error_rate_tree = tb.Treeview(window, columns=[name for name, _, _ in columns], show='headings',
+                                           bootstyle="primary")
+        for name, heading, width in columns:
+            self.error_rate_tree.heading(name, text=heading)
+            self.error_rate_tree.column(name, width=width)
+        self.error_rate_tree.tag_configure('regression', foreground='red')
+        self.error_rate_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        
+        self.refresh_error_rates()
+    
+    def close_error_rates(self):
+        """Close the error rate window and stop refreshing it"""
+        if self.error_rate_job is not None:
+            self.root.after_cancel(self.error_rate_job)
+            self.error_rate_job = None
+        self.executor.cancel('error_rates')
+        self.error_rate_window.destroy()
+        self.error_rate_window = None
+    
+    def refresh_error_rates(self):
+        """Fetch the error reports and session counts since the last refresh and update the rates"""
+        if self.error_rate_job is not None:
+            self.root.after_cancel(self.error_rate_job)
+            self.error_rate_job = None
+        
         if not self.supabase_client:
             messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
             return
         
-        # Check if an error is selected
-        selection = self.error_tree.selection()
-        if not selection:
-            messagebox.showwarning("Warning", "Please select an error report to delete.")
+        client = self.supabase_client
+        analyzer = self.error_rate_analyzer
+        error_after = analyzer.error_high_water
+        window_start = analyzer.window_start().isoformat()
+        sessions_since = analyzer.sessions_refresh_start()
+        sessions_through = pd.Timestamp.now(tz='UTC').floor('h')
+        server_sessions = self.server_sessions
+        
+        def fetch(request):
+            cancelled = lambda: request.cancelled
+            # Only error reports after the last counted one
+            errors, high_water = analytics.fetch_new_error_reports(client, error_after, window_start,
+                                                         progress=request.progress, cancelled=cancelled)
+            
+            sessions = None
+            sessions_missing = False
+            if server_sessions:
+                try:
+                    sessions = analytics.fetch_sessions_hourly(client, sessions_since, cancelled)
+                except Exception as e:
+                    # Only a missing function switches to local counting for good; otherwise just this refresh
+                    sessions_missing = backends.is_missing_function(e)
+                    print(f"Server-side session counts failed, falling back to local data: {e}")
+            
+            return errors, high_water, sessions, sessions_missing
+        
+        self.executor.submit(
+            'error_rates', fetch,
+            lambda result: self.on_error_rates_loaded(result, sessions_since, sessions_through),
+            on_error=lambda e: self.show_request_error("Failed to load error rates", e),
+            status="Updating error rates...",
+        )
+    
+    def on_error_rates_loaded(self, result, sessions_since, sessions_through):
+        """Fold the newly fetched data into the analyzer and schedule the next refresh"""
+        errors, high_water, sessions, sessions_missing = result
+        analyzer = self.error_rate_analyzer
+        analyzer.add_errors(errors)
+        analyzer.error_high_water = high_water
+        
+        if sessions is None:
+            # Without tracking_sessions_hourly(), count sessions in the loaded tracking events
+            if sessions_missing:
+                self.server_sessions = False
+            if self.df is not None and 'session_id' in self.df:
+                sessions_since = analyzer.window_start()
+                recent = self.df[pd.to_datetime(self.df['timestamp'], utc=True) >= sessions_since]
+                sessions = analytics.ErrorRateAnalyzer.sessions_from_events(recent)
+        if sessions is not None:
+            analyzer.set_sessions(sessions, sessions_since)
+            analyzer.sessions_high_water = sessions_through
+        
+        self.display_error_rates()
+        self.status_var.set(f"Error rates updated ({len(errors)} new error reports)")
+        
+        if self.error_rate_window is not None:
+            self.error_rate_job = self.root.after(ERROR_RATE_REFRESH_MS, self.refresh_error_rates)
+    
+    def display_error_rates(self):
+        """Fill the error rate table, suspected regressions first"""
+        if self.error_rate_window is None:
             return
         
-        # Get the error ID from the selected item
-        item = self.error_tree.item(selection[0])
-        error_id = item['tags'][0]  # Get error ID from tags
+        analyzer = self.error_rate_analyzer
+        by_error_type = self.error_rate_by_type_var.get()
+        rates = analyzer.regressions(by_error_type=by_error_type)
         
-        # Confirm deletion with the user
-        result = messagebox.askyesno("Confirm Deletion", 
-                                  f"Are you sure you want to delete error report with ID: {error_id}?\n\nThis action cannot be undone.")
+        for item in self.error_rate_tree.get_children():
+            self.error_rate_tree.delete(item)
         
-        if result:
-            try:
-                # Delete the error from the database
-                response = self.supabase_client.table('error_reports').delete().eq('id', error_id).execute()
-                
-                if response:
-                    # Show success message
-                    messagebox.showinfo("Success", f"Error report with ID {error_id} has been deleted successfully.")
-                    
-                    # Update status
-                    self.status_var.set(f"Deleted error report with ID: {error_id}")
-                    
-                    # Reload the error reports to reflect the deletion
-                    self.load_error_reports()
-                    
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete error report: {str(e)}")
+        def number(value, digits=1):
+            return '' if pd.isna(value) else f"{value:.{digits}f}"
+        
+        for row in rates.itertuples(index=False):
+            values = [
+                row.app_version,
+                row.error_type if by_error_type else 'All',
+                int(row.errors),
+                int(row.sessions),
+                number(row.rate),
+                number(row.baseline_rate),
+                number(row.z_score),
+                'Regression' if row.regression else ('No sessions' if row.sessions == 0 else ''),
+            ]
+            self.error_rate_tree.insert('', 'end', values=values, tags=('regression',) if row.regression else ())
+        
+        flagged = int(rates['regression'].sum())
+        self.error_rate_info_var.set(
+            f"Last {analyzer.window.days} days, {int(analyzer.errors.sum())} errors; "
+            f"{flagged} flagged (z > {analyzer.z_threshold:g}); refreshes every {ERROR_RATE_REFRESH_MS // 60000} minutes"
+        )
+    
+    def triage_selected_errors(self, action):
+        """Delete or resolve the selected error reports"""
+        selection = self.error_tree.selected_rows()
+        if selection.empty:
+            messagebox.showwarning("Warning", f"Please select the error reports to {action}.")
+            return
+        
+        ids = selection['id'].tolist()
+        self.run_error_triage(action, {'p_ids': ids}, f"{len(ids)} selected error report(s)",
+                              lambda: self.error_tree.remove_keys(ids))
+    
+    def triage_error_group(self, action):
+        """Delete or resolve every report of the selected error group"""
+        fingerprint = self.current_error_group
+        if fingerprint is None:
+            messagebox.showwarning("Warning", "Please select an error group first.")
+            return
+        
+        def update_view():
+            self.error_groups_tree.remove_keys([fingerprint])
+            self.current_error_group = None
+            self.error_tree.set_data(self.error_tree.empty_data())
+        
+        self.run_error_triage(action, {'p_fingerprint': fingerprint},
+                              "all error reports of the selected group", update_view)
+    
+    def triage_error_version(self, action):
+        """Delete or resolve every report of an app version"""
+        version = simpledialog.askstring("App Version", f"App version whose error reports to {action}:",
+                                         parent=self.root)
+        if not version or not version.strip():
+            return
+        
+        version = version.strip()
+        self.run_error_triage(
+            action, {'p_app_version': version}, f"all error reports of app version {version}",
+            lambda: self.error_tree.remove_keys(
+                self.error_tree.data.loc[self.error_tree.data['app_version'] == version, 'id']),
+        )
+    
+    def triage_old_errors(self, action):
+        """Delete or resolve every report older than a number of days"""
+        days = simpledialog.askinteger("Older Than", f"{action.capitalize()} error reports older than how many days?",
+                                       minvalue=1, parent=self.root)
+        if not days:
+            return
+        
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff_text = cutoff.strftime('%Y-%m-%dT%H:%M:%S')  # Same form as the listed (UTC) timestamps
+        self.run_error_triage(
+            action, {'p_before': cutoff.isoformat()}, f"all error reports older than {days} days",
+            lambda: self.error_tree.remove_keys(
+                self.error_tree.data.loc[self.error_tree.data['timestamp'] < cutoff_text, 'id']),
+        )
+    
+    def run_error_triage(self, action, params, description, update_view):
+        """Delete or resolve error reports in one server request, then update the lists in place"""
+        if not self.supabase_client:
+            messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
+            return
+        
+        server_triage = self.server_error_groups
+        if not server_triage and (action != 'delete' or 'p_ids' not in params):
+            messagebox.showerror("Error", "This action needs the error grouping and triage functions "
+                                          "from database/error_reports.sql.")
+            return
+        
+        title = {'delete': "Deletion", 'resolve': "Resolve"}[action]
+        warning = "\n\nThis action cannot be undone." if action == 'delete' else ""
+        if not messagebox.askyesno(f"Confirm {title}", f"Are you sure you want to {action} {description}?{warning}"):
+            return
+        
+        client = self.supabase_client
+        
+        def triage(request):
+            if server_triage:
+                return client.rpc('triage_error_reports', {'p_action': action, **params}).execute().data
+            
+            # Without the triage function, delete the selected reports in batches
+            ids = params['p_ids']
+            for start in range(0, len(ids), ERROR_TRIAGE_BATCH_SIZE):
+                client.table('error_reports').delete().in_('id', ids[start:start + ERROR_TRIAGE_BATCH_SIZE]).execute()
+            return len(ids)
+        
+        self.executor.submit(
+            'error_triage', triage,
+            lambda count: self.on_error_triage_done(action, count, params.get('p_ids'), update_view),
+            on_error=lambda e: self.show_request_error(f"Failed to {action} error reports", e),
+            status={'delete': "Deleting error reports...", 'resolve': "Resolving error reports..."}[action],
+        )
+    
+    def on_error_triage_done(self, action, count, ids, update_view):
+        """Reflect a finished triage in the lists without reloading the reports"""
+        if ids is None:
+            self.error_details_cache.clear()
+        else:
+            for error_id in ids:
+                self.error_details_cache.pop(error_id, None)
+        
+        if self.current_error_id is not None and (ids is None or self.current_error_id in ids):
+            self.current_error_id = None
+            self.error_details_text.delete(1.0, tk.END)
+        
+        if action == 'resolve' and self.show_resolved_var.get():
+            self.load_error_report_list()  # Resolved reports stay in the list
+        else:
+            update_view()
+        
+        if self.group_errors_var.get():
+            # Group counts changed; the group list is small enough to refetch
+            self.load_error_groups()
+        
+        self.status_var.set(f"{'Deleted' if action == 'delete' else 'Resolved'} {count} error reports")
 
-    def setup_store_tab(self):
+    def setup_store_tab(self, store_frame):
         """Setup the store items management tab"""
-        # Main store frame
-        store_frame = tb.Frame(self.notebook)
-        self.notebook.add(store_frame, text="Store Management")
-        
         # Controls and filters frame
         controls_frame = tb.Labelframe(store_frame, text="Store Controls & Filters", padding=10)
         controls_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -1270,52 +2289,53 @@ Build Number: {error.get('build_number', 'N/A')}
             messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
             return
         
-        try:
-            # Build query with filters
-            query = self.supabase_client.table('store_items').select('*').order('item_name')
-            
-            # Apply filters
-            item_type = self.item_type_filter.get()
-            if item_type:
-                query = query.eq('item_type', item_type)
-            
-            search_text = self.store_search.get().strip()
-            if search_text:
-                query = query.ilike('item_name', f'%{search_text}%')
-            
-            # Execute query
-            response = query.execute()
-            
-            # Clear existing items
-            for item in self.store_tree.get_children():
-                self.store_tree.delete(item)
-            
-            # Add new items
-            for item in response.data:
-                item_key = item.get('item_key', '')
-                item_name = item.get('item_name', '')
-                item_type = item.get('item_type', '')
-                base_price = item.get('base_price', 0)
-                current_price = item.get('current_price', 0)
-                is_discounted = item.get('is_discounted', False)
-                
-                # Format discounted indicator
-                discount_status = "Yes" if is_discounted else "No"
-                
-                self.store_tree.insert('', tk.END, values=(
-                    item_key,
-                    item_name,
-                    item_type,
-                    base_price,
-                    current_price,
-                    discount_status
-                ), tags=(item['id'],))  # Store item ID as tag
-            
-            self.status_var.set(f"Loaded {len(response.data)} store items")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load store items: {str(e)}")
-            self.status_var.set("Error loading store items")
+        # Build query with filters
+        query = self.supabase_client.table('store_items').select('*').order('item_name')
+        
+        # Apply filters
+        item_type = self.item_type_filter.get()
+        if item_type:
+            query = query.eq('item_type', item_type)
+        
+        search_text = self.store_search.get().strip()
+        if search_text:
+            query = query.ilike('item_name', f'%{search_text}%')
+        
+        # Execute query in the background
+        self.executor.submit(
+            'store_items', lambda request: query.execute().data, self.display_store_items,
+            on_error=lambda e: self.show_request_error("Failed to load store items", e),
+            status="Loading store items...",
+        )
+    
+    def display_store_items(self, items):
+        """Fill the store treeview with the loaded store items"""
+        # Clear existing items
+        for item in self.store_tree.get_children():
+            self.store_tree.delete(item)
+        
+        # Add new items
+        for item in items:
+            item_key = item.get('item_key', '')
+            item_name = item.get('item_name', '')
+            item_type = item.get('item_type', '')
+            base_price = item.get('base_price', 0)
+            current_price = item.get('current_price', 0)
+            is_discounted = item.get('is_discounted', False)
+            
+            # Format discounted indicator
+            discount_status = "Yes" if is_discounted else "No"
+            
+            self.store_tree.insert('', tk.END, values=(
+                item_key,
+                item_name,
+                item_type,
+                base_price,
+                current_price,
+                discount_status
+            ), tags=(item['id'],))  # Store item ID as tag
+        
+        self.status_var.set(f"Loaded {len(items)} store items")
     
     def on_store_item_select(self, event):
         """Handle store item selection in the treeview"""
@@ -1345,15 +2365,22 @@ Build Number: {error.get('build_number', 'N/A')}
             print("No Supabase client available")
             return
         
+        query = self.supabase_client.table('store_items').select('*').eq('id', item_id)
+        self.executor.submit(
+            'store_item_details', lambda request: query.execute().data, self.display_store_item_details,
+            on_error=lambda e: self.show_request_error("Failed to load store item details", e),
+        )
+    
+    def display_store_item_details(self, rows):
+        """Fill the store item form with a loaded store item"""
         try:
-            response = self.supabase_client.table('store_items').select('*').eq('id', item_id).execute()
-            print(f"Response data: {response.data}")
+            print(f"Response data: {rows}")
             
-            if not response.data:
-                print(f"No data found for item ID: {item_id}")
+            if not rows:
+                print("No data found for selected item")
                 return
             
-            store_item = response.data[0]
+            store_item = rows[0]
             print(f"Store item loaded: {store_item}")
             
             # Update form fields with item details
@@ -1389,7 +2416,7 @@ Build Number: {error.get('build_number', 'N/A')}
             self.root.update_idletasks()
                 
         except Exception as e:
-            print(f"Exception in load_store_item_details: {e}")
+            print(f"Exception in display_store_item_details: {e}")
             messagebox.showerror("Error", f"Failed to load store item details: {str(e)}")
     
     def on_discount_change(self):
@@ -1613,12 +2640,8 @@ Build Number: {error.get('build_number', 'N/A')}
         tb.Button(button_frame, text="Save", command=save_new_item, bootstyle=SUCCESS).pack(side=tk.LEFT, padx=(0, 10))
         tb.Button(button_frame, text="Cancel", command=add_window.destroy, bootstyle=SECONDARY).pack(side=tk.LEFT)
 
-    def setup_messages_tab(self):
+    def setup_messages_tab(self, message_frame):
         """Setup the messages management tab"""
-        # Main message frame
-        message_frame = tb.Frame(self.notebook)
-        self.notebook.add(message_frame, text="Message Management")
-        
         # Controls and filters frame
         controls_frame = tb.Labelframe(message_frame, text="Message Controls & Filters", padding=10)
         controls_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -1772,46 +2795,47 @@ Build Number: {error.get('build_number', 'N/A')}
             messagebox.showerror("Error", "Not connected to Supabase. Please check your credentials.")
             return
         
-        try:
-            # Build query with filters
-            query = self.supabase_client.table('messages').select('*').order('created_at', desc=True)
-            
-            search_text = self.message_search.get().strip()
-            if search_text:
-                query = query.ilike('title', f'%{search_text}%').or_(query.ilike('content', f'%{search_text}%'))
-            
-            # Execute query
-            response = query.execute()
-            
-            # Clear existing messages
-            for item in self.message_tree.get_children():
-                self.message_tree.delete(item)
-            
-            # Add new messages
-            for message in response.data:
-                message_id = message.get('id', '')
-                title = message.get('title', '')
-                content = message.get('content', '')
-                expiration_date = message.get('expiration_date', '')
-                created_at = message.get('created_at', '')
-                
-                # Truncate content if too long
-                if len(content) > 50:
-                    content = content[:50] + "..."
-                
-                self.message_tree.insert('', tk.END, values=(
-                    message_id,
-                    title,
-                    content,
-                    expiration_date,
-                    created_at
-                ), tags=(message['id'],))  # Store message ID as tag
+        # Build query with filters
+        query = self.supabase_client.table('messages').select('*').order('created_at', desc=True)
+        
+        search_text = self.message_search.get().strip()
+        if search_text:
+            query = query.or_(f'title.ilike.*{search_text}*,content.ilike.*{search_text}*')
+        
+        # Execute query in the background
+        self.executor.submit(
+            'messages', lambda request: query.execute().data, self.display_messages,
+            on_error=lambda e: self.show_request_error("Failed to load messages", e),
+            status="Loading messages...",
+        )
+    
+    def display_messages(self, messages):
+        """Fill the message treeview with the loaded messages"""
+        # Clear existing messages
+        for item in self.message_tree.get_children():
+            self.message_tree.delete(item)
+        
+        # Add new messages
+        for message in messages:
+            message_id = message.get('id', '')
+            title = message.get('title', '')
+            content = message.get('content', '')
+            expiration_date = message.get('expiration_date', '')
+            created_at = message.get('created_at', '')
             
-            self.status_var.set(f"Loaded {len(response.data)} messages")
+            # Truncate content if too long
+            if len(content) > 50:
+                content = content[:50] + "..."
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load messages: {str(e)}")
-            self.status_var.set("Error loading messages")
+            self.message_tree.insert('', tk.END, values=(
+                message_id,
+                title,
+                content,
+                expiration_date,
+                created_at
+            ), tags=(message['id'],))  # Store message ID as tag
+        
+        self.status_var.set(f"Loaded {len(messages)} messages")
     
     def on_message_select(self, event):
         """Handle message selection in the treeview"""
@@ -1829,13 +2853,20 @@ Build Number: {error.get('build_number', 'N/A')}
         if not self.supabase_client:
             return
         
+        query = self.supabase_client.table('messages').select('*').eq('id', message_id)
+        self.executor.submit(
+            'message_details', lambda request: query.execute().data, self.display_message_details,
+            on_error=lambda e: self.show_request_error("Failed to load message details", e),
+        )
+    
+    def display_message_details(self, rows):
+        """Fill the message form with a loaded message"""
         try:
-            response = self.supabase_client.table('messages').select('*').eq('id', message_id).execute()
-            if not response.data:
+            if not rows:
                 messagebox.showinfo("Info", "Message not found")
                 return
             
-            message = response.data[0]
+            message = rows[0]
             
             # Update form fields with message details
             self.message_id_var.set(message.get('id', ''))
@@ -2023,11 +3054,90 @@ Build Number: {error.get('build_number', 'N/A')}
 
 
 
+def import_times(modules):
+    """Import cost of modules in a fresh interpreter, from `python -X importtime`.
+    
+    Returns (module, cumulative ms, [(dependency, cumulative ms)]) for each of the given modules,
+    with the dependencies it imported directly. Modules that fail to import (e.g. an optional
+    package that is not installed) are left out.
+    """
+    code = (f"for name in {modules!r}:\n"
+            "    try:\n        __import__(name)\n        print(name)\n    except ImportError:\n        pass")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                            cwd=Path(__file__).resolve().parent)
+    imported = set(result.stdout.split())
+    
+    timings = []
+    dependencies = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        entry = (name.strip(), int(cumulative) / 1000)
+        # -X importtime prints every module after the modules it imported
+        if depth == 0:
+            if entry[0] in imported:
+                timings.append(entry + (sorted(dependencies, key=lambda d: d[1], reverse=True),))
+            dependencies = []
+        elif depth == 1:
+            dependencies.append(entry)
+    return timings
+
+
+def print_startup_profile(phases):
+    """Print how long each startup phase took and what the imports cost, for --profile-startup"""
+    print("Startup phases:")
+    previous = STARTUP_STARTED
+    for phase, timestamp in phases:
+        elapsed = (timestamp - previous) * 1000
+        print(f"  {phase:<28}{elapsed:>9.1f} ms  (at {(timestamp - STARTUP_STARTED) * 1000:.1f} ms)")
+        previous = timestamp
+    
+    timings = {name: (total, dependencies)
+               for name, total, dependencies in import_times(['admin_dashboard'] + DEFERRED_MODULES)}
+    total, dependencies = timings.pop('admin_dashboard', (0, []))
+    print(f"\nImports at startup (admin_dashboard, {total:.1f} ms in a fresh interpreter):")
+    for name, cumulative in dependencies[:15]:
+        print(f"  {name:<40}{cumulative:>9.1f} ms")
+    
+    print("\nDeferred until first use (on top of the startup imports):")
+    for name in DEFERRED_MODULES:
+        if name in timings:
+            print(f"  {name:<40}{timings[name][0]:>9.1f} ms")
+        else:
+            print(f"  {name:<40}{'not installed':>12}")
+
+
 def main():
-    root = tb.Window(themename="superhero")
-    app = ModernAdminDashboard(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="BijbelQuiz admin dashboard")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="print how long startup took, with an import-time breakdown")
+    parser.add_argument('--database', help="local SQLite database to use instead of Supabase "
+                                           "(default: $ADMIN_DASHBOARD_DATABASE)")
+    args = parser.parse_args()
+    phases = [('Module imports', time.perf_counter())]
+    
+    root = tb.Window(themename="morph")
+    app = ModernAdminDashboard(root, args.database)
+    phases.append(('Window and tab bar', time.perf_counter()))
+    
+    # Put the window on screen before building the first tab and connecting
+    root.update()
+    phases.append(('First paint', time.perf_counter()))
+    
+    app.start()
+    phases.append(('First tab', time.perf_counter()))
+    
+    if args.profile_startup:
+        threading.Thread(target=print_startup_profile, args=(phases,), daemon=True).start()
+    
+    try:
+        root.mainloop()
+    finally:
+        app.executor.shutdown()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
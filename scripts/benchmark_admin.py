@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of the admin dashboard data paths
+Times the work behind load_tracking_data, get_filtered_tracking_data, display_features_overview,
+on_feature_select and visualize_feature_usage_for_feature on synthetic datasets of 10k to 10M
+tracking events, and records the wall time and peak memory of each step. The dashboard methods
+only read Tk variables and hand their results to widgets; the work itself is done by
+admin_analytics.py and admin_charts.py, so the benchmarks call them directly and need no display
+(without matplotlib the chart step is reported as skipped). Each dataset is
+generated once with synthetic_telemetry.py into a local SQLite database and measured in its own
+process, so peak memory is not carried over from a smaller run. Results are written as JSON and
+can be compared with an earlier run to catch regressions.
+"""
+import argparse
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak RSS is then not reported
+    resource = None
+
+# Dataset sizes (tracking events) measured by default
+DEFAULT_SIZES = '10k,100k,1M,10M'
+
+# Seed of the generated datasets, so every run measures the same rows
+DATASET_SEED = 20240101
+
+# Generated events end on this day, so the date filters select the same rows however old a cached dataset is
+DATASET_END = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# A step counts as a regression when it is this much slower than in the baseline
+DEFAULT_THRESHOLD = 1.25
+
+
+def parse_size(text):
+    """'10k' -> 10000, '1M' -> 1000000"""
+    text = text.strip()
+    multiplier = {'k': 1000, 'm': 1000000}.get(text[-1:].lower(), 1)
+    return int(float(text[:-1] if multiplier > 1 else text) * multiplier)
+
+
+def format_size(rows):
+    for suffix, unit in (('M', 1000000), ('k', 1000)):
+        if rows >= unit and rows % unit == 0:
+            return f'{rows // unit}{suffix}'
+    return str(rows)
+
+
+def format_bytes(count):
+    if count is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB'):
+        if count < 1024:
+            return f'{count:.0f} {unit}'
+        count /= 1024
+    return f'{count:.1f} GiB'
+
+
+def dataset_path(data_dir, rows):
+    return Path(data_dir) / f'tracking_events_{format_size(rows)}_{DATASET_END:%Y%m%d}.db'
+
+
+def ensure_dataset(data_dir, rows, days):
+    """Generate the local database with `rows` tracking events unless it already exists"""
+    path = dataset_path(data_dir, rows)
+    if path.exists():
+        return path
+    
+    from admin_backends import LocalClient
+    from synthetic_telemetry import InsertWriter, TelemetryProfile, write_telemetry
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.unlink(missing_ok=True)
+    
+    started = time.perf_counter()
+    client = LocalClient(tmp_path)
+    profile = TelemetryProfile(events=rows, errors=0, days=days, end=DATASET_END)
+    write_telemetry(profile, InsertWriter(client), DATASET_SEED, progress=lambda written: print(
+        f"\rGenerating {format_size(rows)} dataset... {written['tracking_events']} events", end='', file=sys.stderr))
+    client.connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    client.connection.close()
+    tmp_path.replace(path)
+    print(f"\rGenerated {format_size(rows)} dataset in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return path
+
+
+class StepTimer:
+    """Runs each benchmark step `repeat` times for the wall time, then once more under tracemalloc.
+    
+    tracemalloc slows down Python-heavy code, so the timed runs go without it. numpy and pandas
+    report their buffers to tracemalloc, so the traced peak includes the DataFrames a step builds.
+    """
+    
+    def __init__(self, rows, repeat=3):
+        self.rows = rows
+        self.repeat = repeat
+        self.results = []
+    
+    def skip(self, step, note):
+        """Record a step that cannot run here; it has no times and is left out of comparisons"""
+        self.results.append({'step': step, 'rows': self.rows, 'best': None, 'median': None, 'peak_memory': None,
+                             'note': note, 'skipped': True})
+        print(f"  {step}: {note}", file=sys.stderr)
+    
+    def measure(self, step, func, setup=None, note=None):
+        """Measure func(*setup()) (setup is not timed); returns the result of the last run"""
+        times = []
+        for _ in range(self.repeat):
+            args = setup() if setup else ()
+            started = time.perf_counter()
+            result = func(*args)
+            times.append(time.perf_counter() - started)
+        
+        args = setup() if setup else ()
+        tracemalloc.start()
+        try:
+            result = func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        self.results.append({
+            'step': step,
+            'rows': self.rows,
+            'best': min(times),
+            'median': statistics.median(times),
+            'peak_memory': peak,
+            'note': note,
+        })
+        print(f"  {step}: {min(times):.3f}s, peak {format_bytes(peak)}", file=sys.stderr)
+        return result
+
+
+def load_feature_chart():
+    """The dashboard's FeatureChart (Agg only, no Tk needed), or (None, reason) without matplotlib"""
+    try:
+        from admin_charts import FeatureChart
+        return FeatureChart(), None
+    except ImportError as e:
+        return None, f"skipped: {e}"
+
+
+def cache_available():
+    """Whether the Parquet tracking cache can be used (it needs pyarrow)"""
+    import admin_analytics as analytics
+    return analytics.pq is not None
+
+
+def run_benchmarks(database, rows, repeat, work_dir):
+    """Measure every dashboard data path against one dataset; returns the result rows"""
+    import admin_analytics as analytics
+    from admin_backends import LocalClient
+    
+    client = LocalClient(database)
+    timer = StepTimer(rows, repeat)
+    
+    def fresh_cache():
+        return analytics.TrackingCache(tempfile.mkdtemp(dir=work_dir)),
+    
+    def load(cache):
+        # load_tracking_data() -> finish_tracking_load()
+        cached_df, new_df, _ = analytics.sync_tracking_events(client, cache)
+        df = analytics.merge_tracking_events([cached_df, new_df])
+        return cache, df, analytics.TrackingFilterEngine(df)
+    
+    cache, df, engine = timer.measure('load_tracking_data', load, fresh_cache,
+                                      note=None if cache_available() else "tracking cache disabled (no pyarrow)")
+    if cache_available():
+        _, df, engine = timer.measure('load_tracking_data (cached)', load, lambda: (cache,))
+    
+    # The filter engine caches results per filter tuple; every run has to start cold
+    def cold_engine():
+        engine.cache.clear()
+        return ()
+    
+    week_ago = (DATASET_END - timedelta(days=7)).strftime('%Y-%m-%d')
+    filters = dict(feature='All', action='used', date_from=week_ago, date_to='')
+    timer.measure('get_filtered_tracking_data', lambda: engine.filter(**filters), cold_engine)
+    # Properties are decoded on first use, so the best time is that of an already decoded store
+    timer.measure('get_filtered_tracking_data (property)',
+                  lambda: engine.filter(properties='platform=ios', **filters), cold_engine)
+    
+    everything = dict(feature='All', action='All', date_from='', date_to='')
+    timer.measure('display_features_overview',
+                  lambda: analytics.local_feature_overview(engine.filter(**everything)), cold_engine)
+    
+    # The most used feature is the worst case for a selection
+    feature_name = df['event_name'].value_counts().index[0]
+    
+    def select_feature():
+        summary, breakdown = analytics.local_feature_aggregates(engine.filter(feature=feature_name))
+        return analytics.format_feature_stats(feature_name, summary, breakdown)
+    
+    timer.measure('on_feature_select', select_feature, cold_engine)
+    
+    chart, note = load_feature_chart()
+    
+    def visualize_feature():
+        daily_df = analytics.local_feature_daily(engine.filter(feature=feature_name))
+        return chart.render(feature_name, daily_df)
+    
+    # Timing only the aggregation would not be comparable with runs that render the chart
+    if chart:
+        timer.measure('visualize_feature_usage_for_feature', visualize_feature, cold_engine)
+    else:
+        timer.skip('visualize_feature_usage_for_feature', note)
+    
+    client.connection.close()
+    return timer.results
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, or None when it cannot be read"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports kilobytes
+
+
+def run_worker(args):
+    """Benchmark one dataset in this process and print the results as JSON"""
+    work_dir = tempfile.mkdtemp(prefix='benchmark_admin_')
+    try:
+        results = run_benchmarks(args.worker, args.rows, args.repeat, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    print(json.dumps({'rows': args.rows, 'peak_rss': peak_rss(), 'results': results}))
+    return 0
+
+
+def measure_size(data_dir, rows, args):
+    """Benchmark one dataset size in a child process, so its memory use starts from scratch"""
+    database = ensure_dataset(data_dir, rows, args.days)
+    print(f"Benchmarking {format_size(rows)} tracking events", file=sys.stderr)
+    process = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), '--worker', str(database), '--rows', str(rows),
+         '--repeat', str(args.repeat)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    if process.returncode != 0:
+        print(f"Benchmark of {format_size(rows)} rows failed with exit code {process.returncode}", file=sys.stderr)
+        return None
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    """Steps whose best time grew by more than `threshold` since the baseline"""
+    previous = {(result['step'], result['rows']): result for result in baseline['results']
+                if not result.get('skipped')}
+    regressions = []
+    for result in results:
+        before = previous.get((result['step'], result['rows']))
+        if result.get('skipped') or not before:
+            continue
+        if before['best'] > 0 and result['best'] / before['best'] > threshold:
+            regressions.append((result, before))
+    return regressions
+
+
+def print_results(results, peak_rss_by_size):
+    print(f"{'step':<40} {'rows':>6} {'best':>9} {'median':>9} {'peak memory':>12}")
+    for result in results:
+        if result.get('skipped'):
+            print(f"{result['step']:<40} {format_size(result['rows']):>6} {'-':>9} {'-':>9} {'-':>12}"
+                  f"  ({result['note']})")
+            continue
+        print(f"{result['step']:<40} {format_size(result['rows']):>6} {result['best']:>8.3f}s "
+              f"{result['median']:>8.3f}s {format_bytes(result['peak_memory']):>12}"
+              + (f"  ({result['note']})" if result['note'] else ''))
+    for rows, peak in peak_rss_by_size.items():
+        print(f"Peak RSS with {format_size(rows)} rows: {format_bytes(peak)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the admin dashboard data paths on synthetic data")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f"Comma separated numbers of tracking events (default: {DEFAULT_SIZES})")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per step; the best and median are kept")
+    parser.add_argument('--days', type=int, default=30, help="Spread the generated events over the last N days")
+    parser.add_argument('--data-dir', default='benchmark_data',
+                        help="Where the generated databases are kept between runs")
+    parser.add_argument('--output', '-o', help="Write the results to this JSON file")
+    parser.add_argument('--compare', help="Earlier results (JSON) to check for regressions")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown factor reported as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--rows', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.worker:
+        return run_worker(args)
+    
+    results = []
+    peak_rss_by_size = {}
+    for rows in sorted(parse_size(size) for size in args.sizes.split(',')):
+        measured = measure_size(args.data_dir, rows, args)
+        if measured:
+            results.extend(measured['results'])
+            peak_rss_by_size[rows] = measured['peak_rss']
+    
+    print_results(results, peak_rss_by_size)
+    
+    if args.output:
+        report = {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'peak_rss': {str(rows): peak for rows, peak in peak_rss_by_size.items()},
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for result in results:
+            if result.get('skipped'):
+                print(f"Not compared: {result['step']} with {format_size(result['rows'])} rows ({result['note']})")
+        for result, before in regressions:
+            print(f"Regression: {result['step']} with {format_size(result['rows'])} rows took "
+                  f"{result['best']:.3f}s, was {before['best']:.3f}s")
+        if regressions:
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compile the question banks into binary question packs
+Writes questions-<language>.qpack to build/question_packs; the app does not ship them yet. A pack
+has a string table, fixed-width records and prebuilt indexes (see questionbank/pack.py), so tools
+can memory-map it with questionbank.QuestionPack and read single questions without parsing the
+whole bank. --check reads every question back and compares it with the JSON.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from questionbank import QUESTION_FILES, QuestionPack, load_bank, write_pack
+
+# Where the packs are written by default; build output, ignored by git
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent.parent / 'build' / 'question_packs'
+
+
+def pack_path(language, output_dir=DEFAULT_OUTPUT_DIR):
+    return Path(output_dir) / f'questions-{language}.qpack'
+
+
+def check_pack(bank, path):
+    """Differences between a bank and its pack, as messages (empty when they match)"""
+    problems = []
+    questions = bank.unique()
+    with QuestionPack(path) as pack:
+        if len(pack) != len(questions):
+            problems.append(f"{len(pack)} questions in the pack, {len(questions)} in the bank")
+        for expected, packed in zip(questions, pack):
+            for attribute in ('id', 'question', 'correct_answer', 'incorrect_answers', 'difficulty', 'type',
+                              'biblical_reference'):
+                if getattr(expected, attribute) != getattr(packed, attribute):
+                    problems.append(f"{expected.id}: {attribute} differs")
+            # The pack keeps categories in table order
+            if sorted(expected.categories or []) != packed.categories:
+                problems.append(f"{expected.id}: categories differ")
+            if pack.get(expected.id) is None:
+                problems.append(f"{expected.id}: not found through the id index")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the question banks into binary question packs")
+    parser.add_argument('languages', nargs='*', default=sorted(QUESTION_FILES),
+                        help=f"Languages to compile (default: {' '.join(sorted(QUESTION_FILES))})")
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR,
+                        help=f"Where to write the packs (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument('--check', action='store_true', help="Read the packs back and compare them with the banks")
+    args = parser.parse_args()
+    
+    unknown = [language for language in args.languages if language not in QUESTION_FILES]
+    if unknown:
+        parser.error(f"unknown language: {', '.join(unknown)} (choose from {', '.join(sorted(QUESTION_FILES))})")
+    
+    failed = False
+    for language in args.languages:
+        bank = load_bank(language)
+        path = pack_path(language, args.output_dir)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = write_pack(bank, path)
+        json_size = QUESTION_FILES[language].stat().st_size
+        print(f"{language}: {len(bank.unique())} questions, {json_size} bytes of JSON -> {size} bytes in {path} "
+              f"({size / json_size:.0%})")
+        
+        if args.check:
+            problems = check_pack(bank, path)
+            for problem in problems[:20]:
+                print(f"  {problem}", file=sys.stderr)
+            if problems:
+                print(f"{language}: the pack does not match the bank ({len(problems)} differences)", file=sys.stderr)
+                failed = True
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
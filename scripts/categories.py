@@ -4,6 +4,8 @@ import sys
 import os
 import argparse
 
+from questionbank import QuestionBank
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 QUESTIONS_FILE = os.path.join(SCRIPT_DIR, "..", "app", "assets", "questions-nl-sv.json")
 QUESTIONS_FILE_WITH_CATEGORIES = os.path.join(SCRIPT_DIR, "..", "app", "assets", "questions-nl-sv_with_categories.json")
@@ -70,8 +72,7 @@ of [\"none\"] als geen enkele categorie past.
 def categoriseer_cli(model_naam):
     print("[DEBUG] Starting categorization...", file=sys.stderr)
     try:
-        with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
-            vragen = json.load(f)
+        vragen = QuestionBank.from_file(QUESTIONS_FILE, "nl")
         with open(CATEGORIES_FILE, "r", encoding="utf-8") as f:
             categorieen = json.load(f)
     except Exception as e:
@@ -83,13 +84,12 @@ def categoriseer_cli(model_naam):
 
     changed = False
     for idx, v in enumerate(vragen):
-        if not v.get("categories"):
-            print(f"[INFO] Categorizing question {idx+1}/{len(vragen)}: {v.get('vraag', '')[:60]}...", file=sys.stderr)
-            v["categories"] = vraag_ollama(v.get("vraag", ""), categorieen, model_naam)
+        if not v.categories:
+            print(f"[INFO] Categorizing question {idx+1}/{len(vragen)}: {v.question[:60]}...", file=sys.stderr)
+            v.categories = vraag_ollama(v.question, categorieen, model_naam)
             changed = True
             try:
-                with open(temp_file, "w", encoding="utf-8") as f:
-                    json.dump(vragen, f, ensure_ascii=False, indent=2)
+                vragen.save(temp_file)
                 print(f"[DEBUG] Progress saved to {temp_file} after question {idx+1}", file=sys.stderr)
             except Exception as e:
                 print(f"[ERROR] Could not save progress: {e}", file=sys.stderr)
@@ -98,8 +98,7 @@ def categoriseer_cli(model_naam):
 
     if changed:
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(vragen, f, ensure_ascii=False, indent=2)
+            vragen.save(output_file)
             print(f"[INFO] Geslaagd! Resultaat opgeslagen in '{output_file}'.", file=sys.stderr)
             if os.path.exists(temp_file):
                 os.remove(temp_file)
@@ -112,22 +111,20 @@ def categoriseer_cli(model_naam):
 def check_and_clean_categories():
     with open(CATEGORIES_FILE, "r", encoding="utf-8") as f:
         valid_categories = set(json.load(f))
-    with open(QUESTIONS_FILE_WITH_CATEGORIES, "r", encoding="utf-8") as f:
-        questions = json.load(f)
+    questions = QuestionBank.from_file(QUESTIONS_FILE_WITH_CATEGORIES, "nl")
     changes = []
     for idx, q in enumerate(questions):
-        q_cats = q.get("categories", [])
+        q_cats = q.categories or []
         invalid = [cat for cat in q_cats if cat not in valid_categories]
         if invalid:
             new_cats = [cat for cat in q_cats if cat in valid_categories]
-            questions[idx]["categories"] = new_cats
-            changes.append((idx, q.get("vraag", "<geen vraag>"), invalid))
+            q.categories = new_cats
+            changes.append((idx, q.question or "<geen vraag>", invalid))
     if changes:
         print("Ongeldige categorieën verwijderd:")
         for idx, vraag, cats in changes:
             print(f"Vraag #{idx+1}: '{vraag}' -> Verwijderd: {cats}")
-        with open(QUESTIONS_FILE_WITH_CATEGORIES, "w", encoding="utf-8") as f:
-            json.dump(questions, f, ensure_ascii=False, indent=2)
+        questions.save(QUESTIONS_FILE_WITH_CATEGORIES)
         print(f"Totaal: {len(changes)} vragen aangepast. Bestand bijgewerkt.")
     else:
         print("Alle categorieën zijn geldig. Geen wijzigingen nodig.")
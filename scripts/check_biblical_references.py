@@ -7,13 +7,14 @@ This script validates that all biblical book names used in the questions
 can be properly mapped by the Dart BibleBookMapper class.
 """
 
-import json
 import re
 import sys
 import argparse
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Optional
 
+from questionbank import QuestionBank
+
 
 class BiblicalReferenceChecker:
     """Check biblical references against BibleBookMapper compatibility"""
@@ -226,16 +227,15 @@ class BiblicalReferenceChecker:
 
     def check_questions_file(self, json_file_path: str) -> Dict:
         """Check all questions in the JSON file"""
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
+        questions = QuestionBank.from_file(json_file_path, 'nl')
         
         valid_count = 0
         invalid_count = 0
         no_ref_count = 0
         
         for question in questions:
-            question_id = question.get('id', 'unknown')
-            reference = question.get('biblicalReference')
+            question_id = question.id or 'unknown'
+            reference = question.biblical_reference
             
             is_valid, valid_books, invalid_books = self.check_reference(question_id, reference)
             
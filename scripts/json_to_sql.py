@@ -6,14 +6,57 @@ to populate the questions table.
 
 The script outputs SQL to a file and uses ON CONFLICT to handle:
 - Adding new records if ID doesn't exist
-- Updating existing records if ID already exists
+- Updating existing records if ID already exists (rows whose values did not change are left alone)
+
+Output modes (--mode):
+- statements: one INSERT ... ON CONFLICT statement per question (the default)
+- batch: multi-row INSERT ... VALUES upserts of --batch-size questions, in one transaction
+- copy: COPY FROM STDIN into a temporary staging table, merged with one INSERT ... SELECT;
+  the fastest to load, but COPY FROM STDIN needs psql (psql -f file.sql), not the SQL editor
+
+Every export records a content hash per question in database/questions-<language>-manifest.pending.json.
+After running the SQL, --mark-applied makes that the manifest of what the database holds
+(database/questions-<language>-manifest.json). With --incremental only the questions added, changed
+or removed since the last applied export are written, as upserts and a DELETE in one transaction,
+to database/questions-<language>-changes.sql; until it is marked as applied, exporting again
+writes the same changes (plus any new ones) instead of losing them.
 """
 
 import json
 import sys
 import argparse
+import hashlib
 from pathlib import Path
 
+from questionbank import DEFAULTS, QUESTION_FILES, QuestionBank
+
+# Default number of questions per multi-row INSERT in batch mode
+DEFAULT_BATCH_SIZE = 500
+
+# Table and (column, Question attribute) per language; the first column is the primary key
+TABLES = {
+    'en': ('questions_en', [
+        ('id', 'id'),
+        ('question', 'question'),
+        ('correct_answer', 'correct_answer'),
+        ('incorrect_answers', 'incorrect_answers'),
+        ('difficulty', 'difficulty'),
+        ('type', 'type'),
+        ('categories', 'categories'),
+        ('biblical_reference', 'biblical_reference'),
+    ]),
+    'nl': ('questions', [
+        ('id', 'id'),
+        ('vraag', 'question'),
+        ('juiste_antwoord', 'correct_answer'),
+        ('foute_antwoorden', 'incorrect_answers'),
+        ('moeilijkheidsgraad', 'difficulty'),
+        ('type', 'type'),
+        ('categories', 'categories'),
+        ('biblical_reference', 'biblical_reference'),
+    ]),
+}
+
 def escape_sql_string(s):
     """Escape single quotes for SQL"""
     if s is None:
@@ -27,33 +70,201 @@ def array_to_sql(arr):
     escaped_items = [f"'{item.replace(chr(39), chr(39) + chr(39))}'" for item in arr]
     return f"ARRAY[{','.join(escaped_items)}]"
 
+def value_to_sql(value):
+    """Convert a question field to a SQL literal"""
+    if isinstance(value, list):
+        return array_to_sql(value)
+    if isinstance(value, str) or value is None:
+        return escape_sql_string(value)
+    return str(value)
+
+def copy_escape(s):
+    """Escape backslashes, tabs and line breaks for the COPY text format"""
+    return s.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+def value_to_copy(value):
+    """Convert a question field to a COPY text format field"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, list):
+        items = ['"' + item.replace('\\', '\\\\').replace('"', '\\"') + '"' for item in value]
+        return copy_escape('{' + ','.join(items) + '}')
+    return copy_escape(str(value))
+
+def question_values(question, columns):
+    """The values of a question in column order"""
+    values = []
+    for column, attribute in columns:
+        value = getattr(question, attribute)
+        # An empty or null array is stored as '{}'
+        values.append((value or []) if isinstance(DEFAULTS[attribute], list) else value)
+    return values
+
+def upsert_clause(table_name, columns):
+    """ON CONFLICT clause that overwrites every column but the primary key, only when one of them changed"""
+    names = [column for column, _ in columns[1:]]
+    updates = [f"    {column} = EXCLUDED.{column}," for column in names]
+    # Without the WHERE every upsert would rewrite its row and bump updated_at
+    current = ', '.join(f"{table_name}.{column}" for column in names)
+    excluded = ', '.join(f"EXCLUDED.{column}" for column in names)
+    return '\n'.join(["ON CONFLICT (id) DO UPDATE SET"] + updates + [
+        "    updated_at = NOW()",
+        f"WHERE ({current})",
+        f"    IS DISTINCT FROM ({excluded});",
+    ])
+
+def delete_sql(table_name, question_ids):
+    """DELETE statement for questions that were removed"""
+    return f"DELETE FROM {table_name} WHERE id IN ({', '.join(escape_sql_string(id) for id in question_ids)});"
+
+def question_hash(question, columns):
+    """Content hash of the values a question is stored with"""
+    values = json.dumps(question_values(question, columns), ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(values.encode('utf-8')).hexdigest()
+
+def load_manifest(manifest_path):
+    """Question hashes by id from the last export, or None when there is no (readable) manifest"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)['questions']
+    except (OSError, ValueError, KeyError) as e:
+        if manifest_path.exists():
+            print(f"Warning: ignoring unreadable manifest {manifest_path}: {e}")
+        return None
+
+def pending_manifest_path(manifest_path):
+    """Manifest of the last generated export, until it is marked as applied"""
+    return manifest_path.with_name(manifest_path.name.replace('-manifest.json', '-manifest.pending.json'))
+
+def mark_applied(manifest_path):
+    """Make the manifest of the last generated export the manifest of the database"""
+    pending_path = pending_manifest_path(manifest_path)
+    if not pending_path.exists():
+        print(f"Error: no pending export to mark as applied ({pending_path} not found)")
+        sys.exit(1)
+    pending_path.replace(manifest_path)
+    print(f"Marked the last export as applied: {manifest_path}")
+
+def transaction_sql(sql_lines):
+    """Wrap statements in one transaction"""
+    return ["BEGIN;", ""] + sql_lines + ["COMMIT;", ""]
+
+def write_manifest(manifest_path, table_name, hashes):
+    """Record the exported question hashes (sorted by id, so the file diffs well)"""
+    manifest = {'table': table_name, 'questions': dict(sorted(hashes.items()))}
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+def statements_sql(table_name, columns, questions):
+    """One INSERT statement per question"""
+    names = ', '.join(column for column, _ in columns)
+    sql_lines = []
+    for question in questions:
+        values = ', '.join(value_to_sql(value) for value in question_values(question, columns))
+        sql_lines.append(f"INSERT INTO {table_name} ({names})\nVALUES ({values})\n{upsert_clause(table_name, columns)}")
+        sql_lines.append("")
+    return sql_lines
+
+def batch_sql(table_name, columns, questions, batch_size):
+    """Multi-row INSERT statements of batch_size questions each"""
+    names = ', '.join(column for column, _ in columns)
+    sql_lines = []
+    for start in range(0, len(questions), batch_size):
+        rows = ',\n'.join(f"    ({', '.join(value_to_sql(value) for value in question_values(question, columns))})"
+                          for question in questions[start:start + batch_size])
+        sql_lines.append(f"INSERT INTO {table_name} ({names})\nVALUES\n{rows}\n{upsert_clause(table_name, columns)}")
+        sql_lines.append("")
+    return sql_lines
+
+def copy_sql(table_name, columns, questions):
+    """COPY into a staging table that is merged into the table with one upsert (run it in a transaction)"""
+    names = ', '.join(column for column, _ in columns)
+    staging_table = f"{table_name}_staging"
+    sql_lines = [
+        f"CREATE TEMP TABLE {staging_table} (LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP;",
+        "",
+        f"COPY {staging_table} ({names}) FROM STDIN;",
+    ]
+    for question in questions:
+        sql_lines.append('\t'.join(value_to_copy(value) for value in question_values(question, columns)))
+    sql_lines.append("\\.")
+    sql_lines.append("")
+    sql_lines.append(f"INSERT INTO {table_name} ({names})\nSELECT {names} FROM {staging_table}\n"
+                     f"{upsert_clause(table_name, columns)}")
+    sql_lines.append("")
+    return sql_lines
+
 def main():
     parser = argparse.ArgumentParser(description='Convert questions JSON to SQL statements')
     parser.add_argument('language',
                        choices=['nl', 'en'],
                        help='Language of the questions (nl or en)')
+    parser.add_argument('--mode',
+                       choices=['statements', 'batch', 'copy'],
+                       default='statements',
+                       help='One statement per question, multi-row upserts, or COPY into a staging table')
+    parser.add_argument('--batch-size',
+                       type=int,
+                       default=DEFAULT_BATCH_SIZE,
+                       help=f'Questions per INSERT in batch mode (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--incremental',
+                       action='store_true',
+                       help='Only export the questions added, changed or removed since the last applied export')
+    parser.add_argument('--mark-applied',
+                       action='store_true',
+                       help='Record that the last generated SQL file was run against the database')
     
     args = parser.parse_args()
     
+    if args.batch_size < 1:
+        parser.error('--batch-size must be at least 1')
+    
     # Set output path based on language
-    if args.language == 'en':
-        output_path = Path(__file__).parent.parent / 'database' / 'questions-en-data.sql'
-        json_path = Path(__file__).parent.parent / "app" / "assets" / "questions-en.json"
-    else:
-        output_path = Path(__file__).parent.parent / 'database' / 'questions-nl-data.sql'
-        json_path = Path(__file__).parent.parent / "app" / "assets" / "questions-nl-sv.json"
+    output_path = Path(__file__).parent.parent / 'database' / f'questions-{args.language}-data.sql'
+    json_path = QUESTION_FILES[args.language]
 
     if not json_path.exists():
         print(f"Error: Questions JSON file not found at {json_path}")
         sys.exit(1)
 
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            questions = json.load(f)
+        bank = QuestionBank.from_file(json_path, args.language)
     except Exception as e:
         print(f"Error reading JSON file: {e}")
         sys.exit(1)
 
+    table_name, columns = TABLES[args.language]
+    manifest_path = output_path.parent / f'questions-{args.language}-manifest.json'
+    
+    if args.mark_applied:
+        mark_applied(manifest_path)
+        return
+    
+    # A multi-row upsert fails when it touches the same row twice, so duplicate ids are dropped
+    unique = bank.unique()
+    if len(unique) < len(bank):
+        print(f"Warning: {len(bank) - len(unique)} duplicate question IDs, the last occurrence is used")
+    hashes = {question.id: question_hash(question, columns) for question in unique}
+    
+    deleted_ids = []
+    if args.incremental:
+        previous = load_manifest(manifest_path)
+        if previous is None:
+            print(f"No manifest found at {manifest_path}, exporting every question")
+            previous = {}
+        
+        # Only questions whose hash changed since the last applied export, and the ones that disappeared
+        export = [question for question in unique if previous.get(question.id) != hashes[question.id]]
+        deleted_ids = sorted(set(previous) - set(hashes))
+        added = sum(question.id not in previous for question in export)
+        print(f"{added} new, {len(export) - added} changed and {len(deleted_ids)} removed questions")
+        output_path = output_path.parent / f'questions-{args.language}-changes.sql'
+    elif args.mode == 'statements':
+        export = bank.questions
+    else:
+        export = unique
+
     # Prepare SQL output
     sql_lines = []
     sql_lines.append(f"-- SQL INSERT statements for {args.language} questions table")
@@ -64,67 +275,35 @@ def main():
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    table_name = 'questions_en' if args.language == 'en' else 'questions'
-
-    for question in questions:
-        # Extract fields based on language
-        question_id = escape_sql_string(question.get('id', ''))
-        
-        if args.language == 'en':
-            q_text = escape_sql_string(question.get('question', ''))
-            correct = escape_sql_string(question.get('correctAnswer', ''))
-            incorrect = array_to_sql(question.get('incorrectAnswers', []))
-            difficulty = question.get('difficulty', 3)
-            q_type = escape_sql_string(question.get('type', 'mc'))
-            categories = array_to_sql(question.get('categories', []))
-            bib_ref = escape_sql_string(question.get('biblicalReference'))
-            
-            # Generate INSERT statement for English
-            sql = f"""INSERT INTO {table_name} (id, question, correct_answer, incorrect_answers, difficulty, type, categories, biblical_reference)
-VALUES ({question_id}, {q_text}, {correct}, {incorrect}, {difficulty}, {q_type}, {categories}, {bib_ref})
-ON CONFLICT (id) DO UPDATE SET
-    question = EXCLUDED.question,
-    correct_answer = EXCLUDED.correct_answer,
-    incorrect_answers = EXCLUDED.incorrect_answers,
-    difficulty = EXCLUDED.difficulty,
-    type = EXCLUDED.type,
-    categories = EXCLUDED.categories,
-    biblical_reference = EXCLUDED.biblical_reference,
-    updated_at = NOW();"""
-
-        else: # Dutch
-            q_text = escape_sql_string(question.get('vraag', ''))
-            correct = escape_sql_string(question.get('juisteAntwoord', ''))
-            incorrect = array_to_sql(question.get('fouteAntwoorden', []))
-            difficulty = question.get('moeilijkheidsgraad', 3)
-            q_type = escape_sql_string(question.get('type', 'mc'))
-            categories = array_to_sql(question.get('categories', []))
-            bib_ref = escape_sql_string(question.get('biblicalReference'))
-
-            # Generate INSERT statement for Dutch
-            sql = f"""INSERT INTO {table_name} (id, vraag, juiste_antwoord, foute_antwoorden, moeilijkheidsgraad, type, categories, biblical_reference)
-VALUES ({question_id}, {q_text}, {correct}, {incorrect}, {difficulty}, {q_type}, {categories}, {bib_ref})
-ON CONFLICT (id) DO UPDATE SET
-    vraag = EXCLUDED.vraag,
-    juiste_antwoord = EXCLUDED.juiste_antwoord,
-    foute_antwoorden = EXCLUDED.foute_antwoorden,
-    moeilijkheidsgraad = EXCLUDED.moeilijkheidsgraad,
-    type = EXCLUDED.type,
-    categories = EXCLUDED.categories,
-    biblical_reference = EXCLUDED.biblical_reference,
-    updated_at = NOW();"""
-
-        sql_lines.append(sql)
-        sql_lines.append("")
+    changes = []
+    if deleted_ids:
+        changes.append(delete_sql(table_name, deleted_ids))
+        changes.append("")
+    
+    if export:
+        if args.mode == 'statements':
+            changes.extend(statements_sql(table_name, columns, export))
+        elif args.mode == 'batch':
+            changes.extend(batch_sql(table_name, columns, export, args.batch_size))
+        else:
+            changes.extend(copy_sql(table_name, columns, export))
+    
+    # The deletes and upserts of an incremental export are applied together or not at all
+    if changes and (args.incremental or args.mode != 'statements'):
+        changes = transaction_sql(changes)
+    sql_lines.extend(changes)
 
-    sql_lines.append(f"-- Total questions processed: {len(questions)}")
+    sql_lines.append(f"-- Total questions processed: {len(export)}")
 
-    # Write SQL to file (overwriting if exists)
+    # Write SQL to file (overwriting if exists), then remember what was exported; the manifest itself
+    # only moves on with --mark-applied, once the SQL has been run
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write('\n'.join(sql_lines))
+        write_manifest(pending_manifest_path(manifest_path), table_name, hashes)
         print(f"SQL statements successfully written to: {output_path}")
-        print(f"Total questions processed: {len(questions)}")
+        print(f"Total questions processed: {len(export)}")
+        print(f"After running it, record it with: {Path(__file__).name} {args.language} --mark-applied")
     except Exception as e:
         print(f"Error writing to output file: {e}")
         sys.exit(1)
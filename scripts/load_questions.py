@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load the question banks straight into the database
+Reads app/assets/questions-*.json and upserts the banks into Postgres over a connection pool,
+the languages concurrently, instead of generating a SQL file with json_to_sql.py and running it
+by hand. Each bank is streamed with COPY into a temporary staging table and merged with a single
+upsert that leaves unchanged rows alone, all in one transaction: a failed load never leaves a
+table half updated. With --database the banks go into the local SQLite stand-in of
+admin_backends.py instead. Postgres needs psycopg 3 and its pool: pip install "psycopg[binary,pool]"
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+from admin_backends import LocalClient, local_database
+from json_to_sql import TABLES, question_values, upsert_clause
+from questionbank import DEFAULTS, load_bank
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:  # Only needed for Postgres
+    ConnectionPool = None
+
+
+def column_type(attribute):
+    """Postgres type of a question column, from the default of its attribute"""
+    default = DEFAULTS[attribute]
+    if isinstance(default, list):
+        return 'text[]'
+    if isinstance(default, int):
+        return 'int4'
+    return 'text'
+
+
+def read_bank(language):
+    """The questions of a language as rows in column order, duplicate ids removed"""
+    _, columns = TABLES[language]
+    return [question_values(question, columns) for question in load_bank(language).unique()]
+
+
+class PostgresLoader:
+    """Loads question banks over pooled Postgres connections, one transaction per bank"""
+    
+    def __init__(self, dsn, pool_size=2):
+        if ConnectionPool is None:
+            raise RuntimeError('Loading into Postgres needs psycopg 3: pip install "psycopg[binary,pool]"')
+        self.pool = ConnectionPool(dsn, min_size=1, max_size=pool_size, open=True)
+    
+    def load(self, table_name, columns, rows, prune=False):
+        """Upsert the rows into the table; returns (changed, deleted) row counts"""
+        names = ', '.join(column for column, _ in columns)
+        staging_table = f"{table_name}_staging"
+        
+        # The pool commits when the block succeeds and rolls back when it raises
+        with self.pool.connection() as connection, connection.cursor() as cursor:
+            cursor.execute(f"CREATE TEMP TABLE {staging_table} (LIKE {table_name} INCLUDING DEFAULTS) ON COMMIT DROP")
+            with cursor.copy(f"COPY {staging_table} ({names}) FROM STDIN") as copy:
+                copy.set_types([column_type(attribute) for _, attribute in columns])
+                for row in rows:
+                    copy.write_row(row)
+            
+            cursor.execute(f"INSERT INTO {table_name} ({names})\nSELECT {names} FROM {staging_table}\n"
+                           f"{upsert_clause(table_name, columns)}")
+            changed = cursor.rowcount
+            
+            deleted = 0
+            if prune:
+                cursor.execute(f"DELETE FROM {table_name} WHERE id NOT IN (SELECT id FROM {staging_table})")
+                deleted = cursor.rowcount
+        
+        return changed, deleted
+    
+    def close(self):
+        self.pool.close()
+
+
+class LocalLoader:
+    """Loads question banks into the local SQLite database, one transaction per bank.
+    
+    SQLite has a single writer, so the banks are written one after the other on the client's
+    connection; the prepared upsert is reused for every row.
+    """
+    
+    def __init__(self, path):
+        self.client = LocalClient(path)
+    
+    def load(self, table_name, columns, rows, prune=False):
+        """Upsert the rows into the table; returns (changed, deleted) row counts"""
+        names = [column for column, _ in columns]
+        # Arrays are stored as JSON text, like LocalQuery stores them
+        rows = [tuple(json.dumps(value) if isinstance(value, list) else value for value in row) for row in rows]
+        changed_check = ' OR '.join(f"{table_name}.{column} IS NOT excluded.{column}" for column in names[1:])
+        sql = (f"INSERT INTO {table_name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})\n"
+               f"ON CONFLICT (id) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in names[1:])}, "
+               f"updated_at = now()\nWHERE {changed_check}")
+        
+        with self.client.lock, self.client.connection as connection:  # Commits, or rolls back on an error
+            changed = connection.executemany(sql, rows).rowcount
+            deleted = 0
+            if prune:
+                ids = json.dumps([row[0] for row in rows])
+                deleted = connection.execute(
+                    f"DELETE FROM {table_name} WHERE id NOT IN (SELECT value FROM json_each(?))", (ids,)
+                ).rowcount
+        
+        return changed, deleted
+    
+    def close(self):
+        self.client.connection.close()
+
+
+def load_language(loader, language, prune=False):
+    """Read and load one language; returns its statistics"""
+    started = time.perf_counter()
+    table_name, columns = TABLES[language]
+    rows = read_bank(language)
+    changed, deleted = loader.load(table_name, columns, rows, prune)
+    return {
+        'language': language,
+        'table': table_name,
+        'rows': len(rows),
+        'changed': changed,
+        'deleted': deleted,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the question banks into Postgres or the local database")
+    parser.add_argument('languages', nargs='*', default=sorted(TABLES),
+                        help=f"Languages to load (default: {' '.join(sorted(TABLES))})")
+    parser.add_argument('--dsn', help="Postgres connection string (default: $DATABASE_URL)")
+    parser.add_argument('--database', help="Local SQLite database instead of Postgres")
+    parser.add_argument('--prune', action='store_true', help="Delete questions that are no longer in the bank")
+    args = parser.parse_args()
+    
+    unknown = [language for language in args.languages if language not in TABLES]
+    if unknown:
+        parser.error(f"unknown language: {', '.join(unknown)} (choose from {', '.join(sorted(TABLES))})")
+    
+    load_dotenv()
+    database = local_database(args.database)
+    dsn = args.dsn or os.getenv('DATABASE_URL')
+    if not database and not dsn:
+        parser.error("set --dsn or DATABASE_URL (or --database for the local database)")
+    
+    try:
+        loader = LocalLoader(database) if database else PostgresLoader(dsn, pool_size=len(args.languages))
+    except Exception as e:
+        print(f"Error connecting to the database: {e}", file=sys.stderr)
+        return 1
+    
+    started = time.perf_counter()
+    loaded = 0
+    failed = False
+    try:
+        with ThreadPoolExecutor(max_workers=len(args.languages)) as pool:
+            futures = {language: pool.submit(load_language, loader, language, args.prune)
+                       for language in args.languages}
+        
+        for language, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"{language}: load failed and was rolled back: {e}", file=sys.stderr)
+                failed = True
+                continue
+            loaded += result['rows']
+            print(f"{language}: {result['rows']} questions into {result['table']} in {result['seconds']:.2f}s "
+                  f"({result['rows'] / result['seconds']:.0f} rows/s), {result['changed']} inserted or updated, "
+                  f"{result['deleted']} deleted")
+    finally:
+        loader.close()
+    
+    elapsed = time.perf_counter() - started
+    print(f"Loaded {loaded} questions in {elapsed:.2f}s ({loaded / elapsed:.0f} rows/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
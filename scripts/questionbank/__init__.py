@@ -0,0 +1,13 @@
+"""
+Shared question bank library of the BijbelQuiz scripts
+Question is one compact model for the Dutch and the English bank, whose JSON files use different
+field names (see FIELD_NAMES). QuestionBank reads a bank once and indexes it by id, type,
+difficulty, category and Bible book; load_bank() returns the bank of a language from app/assets.
+QuestionPack offers the same lookups on a compiled binary pack (see pack.py) without parsing it.
+"""
+from .model import DEFAULTS, FIELD_NAMES, Question
+from .store import QUESTION_FILES, QuestionBank, load_bank
+from .pack import QuestionPack, build_pack, write_pack
+
+__all__ = ['DEFAULTS', 'FIELD_NAMES', 'QUESTION_FILES', 'Question', 'QuestionBank', 'QuestionPack', 'build_pack',
+           'load_bank', 'write_pack']
@@ -0,0 +1,139 @@
+"""
+The question model, the same for every language
+"""
+import re
+
+# Attributes of a question and the value used when the JSON leaves them out
+DEFAULTS = {
+    'id': '',
+    'question': '',
+    'correct_answer': '',
+    'incorrect_answers': [],
+    'difficulty': 3,
+    'type': 'mc',
+    'categories': [],
+    'biblical_reference': None,
+}
+
+# JSON field of each attribute, per language
+FIELD_NAMES = {
+    'nl': {
+        'id': 'id',
+        'question': 'vraag',
+        'correct_answer': 'juisteAntwoord',
+        'incorrect_answers': 'fouteAntwoorden',
+        'difficulty': 'moeilijkheidsgraad',
+        'type': 'type',
+        'categories': 'categories',
+        'biblical_reference': 'biblicalReference',
+    },
+    'en': {
+        'id': 'id',
+        'question': 'question',
+        'correct_answer': 'correctAnswer',
+        'incorrect_answers': 'incorrectAnswers',
+        'difficulty': 'difficulty',
+        'type': 'type',
+        'categories': 'categories',
+        'biblical_reference': 'biblicalReference',
+    },
+}
+
+# Bible book at the start of a reference: "1 Samuel 1:20" -> "1 Samuel", "Genesis 2" -> "Genesis"
+BOOK_PATTERN = re.compile(r'^((?:[1-3]\s+)?\D+?)(?:\s+\d.*)?$')
+
+# Separators between the parts of a reference: "Markus, Handelingen", "Genesis 2 en 3", "1 and 2 Samuel"
+REFERENCE_SEPARATOR = re.compile(r'\s*(?:[,;]|\ben\b|\band\b)\s*')
+
+# A chapter written against the book name: "1 Korintiers1:10-13"
+MISSING_SPACE = re.compile(r'(?<=[^\W\d_])(?=\d)')
+
+# Key orders seen so far; questions with the same keys share one tuple
+KEY_ORDERS = {}
+
+
+class Question:
+    """A quiz question with the same attributes in every language.
+    
+    Instances use __slots__, so a bank of questions costs a fraction of the dicts json.load
+    returns. `keys` are the JSON keys the question was read with, in their original order, and
+    `extra` holds the keys the model does not know, so to_json() writes a question back the
+    way it was read.
+    """
+    
+    __slots__ = tuple(DEFAULTS) + ('keys', 'extra')
+    
+    def __init__(self, keys=(), extra=None, **values):
+        for attribute, default in DEFAULTS.items():
+            value = values.pop(attribute, default)
+            # Every question gets its own lists
+            setattr(self, attribute, list(value) if value is default and isinstance(default, list) else value)
+        if values:
+            raise TypeError(f"Unknown question attributes: {', '.join(values)}")
+        self.keys = KEY_ORDERS.setdefault(tuple(keys), tuple(keys))
+        self.extra = extra
+    
+    @classmethod
+    def from_json(cls, data, language):
+        """Question from a JSON object of the bank of `language`"""
+        names = FIELD_NAMES[language]
+        values = {attribute: data[field] for attribute, field in names.items() if field in data}
+        known = set(names.values())
+        extra = {key: value for key, value in data.items() if key not in known} or None
+        return cls(keys=data.keys(), extra=extra, **values)
+    
+    def to_json(self, language):
+        """JSON object for the bank of `language`, with the keys in the order they were read"""
+        fields = {field: attribute for attribute, field in FIELD_NAMES[language].items()}
+        extra = self.extra or {}
+        data = {}
+        for key in self.keys:
+            if key in fields:
+                data[key] = getattr(self, fields[key])
+            elif key in extra:
+                data[key] = extra[key]
+        
+        # Attributes the JSON did not have are written once they are given a value
+        for field, attribute in fields.items():
+            if field not in data and getattr(self, attribute) != DEFAULTS[attribute]:
+                data[field] = getattr(self, attribute)
+        for key, value in extra.items():
+            data.setdefault(key, value)
+        return data
+    
+    @property
+    def books(self):
+        """The Bible books the reference points to, in order, spelled as in the reference.
+        
+        Best effort: "1 and 2 Samuel" gives both books and parts without a book name ("Genesis 2 en 3")
+        belong to the book before them, but misspelled names are kept and a reference that is not a
+        book at all ("In the Gospels") is returned as it is.
+        """
+        reference = (self.biblical_reference or '').strip()
+        if not reference or reference.lower() == 'null':
+            return ()
+        
+        parts = [MISSING_SPACE.sub(' ', part) for part in REFERENCE_SEPARATOR.split(reference) if part]
+        books = []
+        for number, part in enumerate(parts):
+            match = BOOK_PATTERN.match(part)
+            if not match and part in ('1', '2', '3') and number + 1 < len(parts):
+                # "1 and 2 Samuel": the number shares the name of the next book
+                following = BOOK_PATTERN.match(parts[number + 1])
+                if following and following.group(1)[:1] in '123':
+                    match = BOOK_PATTERN.match(f"{part} {following.group(1)[1:].strip()}")
+            if not match:
+                continue  # Chapters or verses of the book before
+            book = ' '.join(match.group(1).split())
+            if book not in books:
+                books.append(book)
+        return tuple(books)
+    
+    @property
+    def book(self):
+        """The first Bible book the reference points to, or None without a reference"""
+        books = self.books
+        return books[0] if books else None
+    
+    def __repr__(self):
+        return f"Question(id={self.id!r}, question={self.question[:40]!r})"
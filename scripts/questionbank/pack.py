@@ -0,0 +1,319 @@
+"""
+Compiled binary question packs
+A pack holds one bank in a form that is memory-mapped and read one question at a time instead of
+parsed in full. All integers are little-endian; the sections follow the header in this order:
+
+    strings      u32 offsets and the UTF-8 data of every distinct text (ids, questions, answers, ...)
+    answers      u32 string numbers of the incorrect answers, one run per question
+    records      one fixed-width record per question: string numbers of its id, question, correct
+                 answer and reference, its run of incorrect answers, difficulty, type number, number
+                 of its first book and a bitmask over the categories table
+    id index     u32 record numbers sorted by id, for binary search
+    tables       types, difficulties, categories and books: per entry its key (a string number,
+                 or the difficulty) and its run of record numbers in the postings
+    postings     u32 record numbers, ascending within each table entry
+
+A question with a duplicate id is packed once, as the last one (see QuestionBank.unique()).
+Categories come back in the order of the categories table rather than the order in the JSON.
+"""
+import mmap
+import struct
+
+from .model import FIELD_NAMES, Question
+from .store import QuestionBank
+
+MAGIC = b'BQPK'
+VERSION = 1
+
+# Markers for a missing reference, book or difficulty
+NO_STRING = 0xFFFFFFFF
+NO_BOOK = 0xFFFF
+NO_DIFFICULTY = 0xFF
+
+# Sections whose offsets are stored in the header, in file order; 'end' is the size of the pack
+SECTIONS = ('string_offsets', 'string_data', 'answers', 'records', 'id_index', 'types', 'difficulties',
+            'categories', 'books', 'postings', 'end')
+
+# magic, version, language, record size, category mask words, number of questions, strings and answers,
+# entries in the type, difficulty, category and book tables, then the offset of every section
+HEADER = struct.Struct('<4sH2sHHIIIHHHH' + 'I' * len(SECTIONS))
+
+# id, question, correct answer, reference, first answer, answer count, difficulty, type, book;
+# followed by the category mask as u64 words
+RECORD = struct.Struct('<IIIIIBBBxH2x')
+
+# key, first posting, posting count
+TABLE_ENTRY = struct.Struct('<III')
+
+U32 = struct.Struct('<I')
+
+
+class StringTable:
+    """Distinct strings, numbered in order of first use"""
+    
+    def __init__(self):
+        self.numbers = {}
+        self.strings = []
+    
+    def add(self, text):
+        if text is None:
+            return NO_STRING
+        text = str(text)
+        number = self.numbers.get(text)
+        if number is None:
+            number = self.numbers[text] = len(self.strings)
+            self.strings.append(text)
+        return number
+    
+    def encode(self):
+        """(offsets, data) sections"""
+        data = [text.encode('utf-8') for text in self.strings]
+        offsets = [0]
+        for item in data:
+            offsets.append(offsets[-1] + len(item))
+        return struct.pack(f'<{len(offsets)}I', *offsets), b''.join(data)
+
+
+def pad(buffer, alignment=4):
+    buffer.extend(b'\0' * (-len(buffer) % alignment))
+
+
+def build_pack(bank):
+    """Compile a QuestionBank into the bytes of a pack"""
+    questions = bank.unique()
+    strings = StringTable()
+    
+    # Table entries, sorted so a pack does not change when the questions are only reordered
+    types = sorted({question.type for question in questions}, key=str)
+    difficulties = sorted({question.difficulty for question in questions
+                           if isinstance(question.difficulty, int) and 0 <= question.difficulty < NO_DIFFICULTY})
+    categories = sorted({category for question in questions for category in question.categories or ()})
+    books = sorted({book for question in questions for book in question.books})
+    if len(types) > 0xFF or len(books) >= NO_BOOK:
+        raise ValueError("Too many question types or books for a pack")
+    type_numbers = {value: number for number, value in enumerate(types)}
+    category_numbers = {value: number for number, value in enumerate(categories)}
+    book_numbers = {value: number for number, value in enumerate(books)}
+    mask_words = max(1, (len(categories) + 63) // 64)
+    
+    postings = {name: [[] for _ in values] for name, values in
+                (('types', types), ('difficulties', difficulties), ('categories', categories), ('books', books))}
+    difficulty_numbers = {value: number for number, value in enumerate(difficulties)}
+    
+    answers = []
+    records = bytearray()
+    for number, question in enumerate(questions):
+        incorrect_answers = question.incorrect_answers or []
+        if len(incorrect_answers) > 0xFF:
+            raise ValueError(f"Question {question.id} has too many incorrect answers for a pack")
+        first_answer = len(answers)
+        answers.extend(strings.add(answer) for answer in incorrect_answers)
+        
+        difficulty = question.difficulty if question.difficulty in difficulty_numbers else NO_DIFFICULTY
+        book = book_numbers.get(question.book, NO_BOOK)
+        mask = 0
+        for category in set(question.categories or ()):
+            mask |= 1 << category_numbers[category]
+            postings['categories'][category_numbers[category]].append(number)
+        
+        records += RECORD.pack(strings.add(question.id), strings.add(question.question),
+                               strings.add(question.correct_answer), strings.add(question.biblical_reference),
+                               first_answer, len(incorrect_answers), difficulty, type_numbers[question.type], book)
+        records += mask.to_bytes(8 * mask_words, 'little')
+        
+        postings['types'][type_numbers[question.type]].append(number)
+        if difficulty != NO_DIFFICULTY:
+            postings['difficulties'][difficulty_numbers[difficulty]].append(number)
+        # A reference can name several books; the question is listed under each
+        for name in question.books:
+            postings['books'][book_numbers[name]].append(number)
+    
+    id_index = sorted(range(len(questions)), key=lambda number: str(questions[number].id).encode('utf-8'))
+    
+    # Table keys are string numbers, except for the difficulties
+    keys = {
+        'types': [strings.add(value) for value in types],
+        'difficulties': difficulties,
+        'categories': [strings.add(value) for value in categories],
+        'books': [strings.add(value) for value in books],
+    }
+    all_postings = []
+    tables = {}
+    for name, runs in postings.items():
+        table = bytearray()
+        for key, run in zip(keys[name], runs):
+            table += TABLE_ENTRY.pack(key, len(all_postings), len(run))
+            all_postings.extend(run)
+        tables[name] = table
+    
+    string_offsets, string_data = strings.encode()
+    sections = {
+        'string_offsets': string_offsets,
+        'string_data': string_data,
+        'answers': struct.pack(f'<{len(answers)}I', *answers),
+        'records': records,
+        'id_index': struct.pack(f'<{len(id_index)}I', *id_index),
+        **tables,
+        'postings': struct.pack(f'<{len(all_postings)}I', *all_postings),
+    }
+    
+    pack = bytearray(HEADER.size)
+    offsets = {}
+    for name in SECTIONS[:-1]:
+        pad(pack)
+        offsets[name] = len(pack)
+        pack += sections[name]
+    offsets['end'] = len(pack)
+    
+    HEADER.pack_into(pack, 0, MAGIC, VERSION, bank.language.encode('ascii'), RECORD.size + 8 * mask_words,
+                     mask_words, len(questions), len(strings.strings), len(answers), len(types), len(difficulties),
+                     len(categories), len(books), *(offsets[name] for name in SECTIONS))
+    return bytes(pack)
+
+
+def write_pack(bank, path):
+    """Compile a bank into a pack file; returns its size in bytes"""
+    data = build_pack(bank)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+class QuestionPack:
+    """A memory-mapped question pack with the lookups of QuestionBank.
+    
+    Opening a pack reads its header and tables only; a question is decoded when it is asked for.
+    Use it as a context manager, or close() it, to release the mapping.
+    """
+    
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.read_header()
+        except (ValueError, struct.error):
+            self.buffer.close()
+            raise
+    
+    def read_header(self):
+        if len(self.buffer) < HEADER.size:
+            raise ValueError("Not a question pack (file too short)")
+        (magic, version, language, self.record_size, self.mask_words, self.question_count, self.string_count,
+         self.answer_count, *counts_and_offsets) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a question pack")
+        if version != VERSION:
+            raise ValueError(f"Unsupported question pack version {version}")
+        self.language = language.decode('ascii')
+        self.offsets = dict(zip(SECTIONS, counts_and_offsets[4:]))
+        if self.offsets['end'] != len(self.buffer):
+            raise ValueError("Truncated question pack")
+        
+        type_count, difficulty_count, category_count, book_count = counts_and_offsets[:4]
+        # The tables are small; they are read whole
+        self.types = self.read_table('types', type_count)
+        self.difficulties = self.read_table('difficulties', difficulty_count, strings=False)
+        self.categories = self.read_table('categories', category_count)
+        self.books = self.read_table('books', book_count)
+        self.type_names = list(self.types)
+        self.category_names = list(self.categories)
+        self.book_names = list(self.books)
+        self.keys = tuple(FIELD_NAMES[self.language].values())
+    
+    def read_table(self, name, count, strings=True):
+        """{key: (first posting, posting count)} of a table, in table order"""
+        start = self.offsets[name]
+        table = {}
+        for key, first, length in TABLE_ENTRY.iter_unpack(self.buffer[start:start + count * TABLE_ENTRY.size]):
+            table[self.string(key) if strings else key] = (first, length)
+        return table
+    
+    def raw_string(self, number):
+        start, end = struct.unpack_from('<II', self.buffer, self.offsets['string_offsets'] + 4 * number)
+        data = self.offsets['string_data']
+        return self.buffer[data + start:data + end]
+    
+    def string(self, number):
+        """A string of the string table, or None for NO_STRING"""
+        return None if number == NO_STRING else self.raw_string(number).decode('utf-8')
+    
+    def u32s(self, section, first, count):
+        start = self.offsets[section] + 4 * first
+        return struct.unpack_from(f'<{count}I', self.buffer, start)
+    
+    def __len__(self):
+        return self.question_count
+    
+    def __iter__(self):
+        return (self.question(number) for number in range(self.question_count))
+    
+    def question(self, number):
+        """Decode the question of a record"""
+        if not 0 <= number < self.question_count:
+            raise IndexError(number)
+        offset = self.offsets['records'] + number * self.record_size
+        (question_id, text, correct_answer, reference, first_answer, answer_count, difficulty, type_number,
+         book) = RECORD.unpack_from(self.buffer, offset)
+        mask = int.from_bytes(self.buffer[offset + RECORD.size:offset + self.record_size], 'little')
+        return Question(
+            keys=self.keys,
+            id=self.string(question_id),
+            question=self.string(text),
+            correct_answer=self.string(correct_answer),
+            incorrect_answers=[self.string(answer) for answer in self.u32s('answers', first_answer, answer_count)],
+            difficulty=None if difficulty == NO_DIFFICULTY else difficulty,
+            type=self.type_names[type_number],
+            categories=[name for bit, name in enumerate(self.category_names) if mask >> bit & 1],
+            biblical_reference=self.string(reference),
+        )
+    
+    def get(self, question_id):
+        """The question with an id, or None; a binary search over the id index"""
+        target = str(question_id).encode('utf-8')
+        low, high = 0, self.question_count
+        while low < high:
+            middle = (low + high) // 2
+            number, = U32.unpack_from(self.buffer, self.offsets['id_index'] + 4 * middle)
+            if self.record_id(number) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.question_count:
+            number, = U32.unpack_from(self.buffer, self.offsets['id_index'] + 4 * low)
+            if self.record_id(number) == target:
+                return self.question(number)
+        return None
+    
+    def record_id(self, number):
+        string_number, = U32.unpack_from(self.buffer, self.offsets['records'] + number * self.record_size)
+        return self.raw_string(string_number)
+    
+    def postings(self, table, key):
+        """Record numbers of a table entry, ascending"""
+        first, count = table.get(key, (0, 0))
+        return self.u32s('postings', first, count)
+    
+    def select(self, type=None, difficulty=None, category=None, book=None):
+        """Questions matching every given criterion, in bank order"""
+        criteria = [(self.types, type), (self.difficulties, difficulty), (self.categories, category),
+                    (self.books, book)]
+        matches = [self.postings(table, value) for table, value in criteria if value is not None]
+        if not matches:
+            return list(self)
+        
+        matches.sort(key=len)
+        others = [set(numbers) for numbers in matches[1:]]
+        return [self.question(number) for number in matches[0] if all(number in other for other in others)]
+    
+    def to_bank(self):
+        """Decode every question into a QuestionBank"""
+        return QuestionBank(self, self.language)
+    
+    def close(self):
+        self.buffer.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
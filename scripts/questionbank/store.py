@@ -0,0 +1,99 @@
+"""
+Loading and indexing of the question banks
+"""
+import json
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+from .model import Question
+
+# Question bank per language
+QUESTION_FILES = {
+    'en': Path(__file__).resolve().parent.parent.parent / "app" / "assets" / "questions-en.json",
+    'nl': Path(__file__).resolve().parent.parent.parent / "app" / "assets" / "questions-nl-sv.json",
+}
+
+
+class QuestionBank:
+    """The questions of one language in file order, indexed by id, type, difficulty, category and book.
+    
+    Ids should be unique. When one is not, get() and unique() return the last question with it,
+    the one that ends up in the database. Call reindex() after changing the questions.
+    """
+    
+    def __init__(self, questions, language='nl'):
+        self.questions = list(questions)
+        self.language = language
+        self.reindex()
+    
+    @classmethod
+    def from_file(cls, path, language='nl'):
+        """Read a bank from a JSON file; raises ValueError when it is not a list of questions"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError(f"Expected a list of questions in {path}")
+        return cls((Question.from_json(item, language) for item in data), language)
+    
+    def reindex(self):
+        """Build the indexes; each one maps a value to its questions in file order"""
+        self.by_id = {}
+        self.by_type = defaultdict(list)
+        self.by_difficulty = defaultdict(list)
+        self.by_category = defaultdict(list)
+        self.by_book = defaultdict(list)
+        for question in self.questions:
+            self.by_id[question.id] = question
+            self.by_type[question.type].append(question)
+            self.by_difficulty[question.difficulty].append(question)
+            for category in question.categories or ():
+                self.by_category[category].append(question)
+            for book in question.books:
+                self.by_book[book].append(question)
+    
+    def __len__(self):
+        return len(self.questions)
+    
+    def __iter__(self):
+        return iter(self.questions)
+    
+    def get(self, question_id):
+        """The question with an id, or None"""
+        return self.by_id.get(question_id)
+    
+    def unique(self):
+        """The questions without duplicate ids: each id at its first position, holding its last question"""
+        return list(self.by_id.values())
+    
+    def duplicate_ids(self):
+        """Ids used by more than one question"""
+        seen = set()
+        return sorted({question.id for question in self.questions if question.id in seen or seen.add(question.id)})
+    
+    def select(self, type=None, difficulty=None, category=None, book=None):
+        """Questions matching every given criterion, in file order"""
+        criteria = [(self.by_type, type), (self.by_difficulty, difficulty), (self.by_category, category),
+                    (self.by_book, book)]
+        matches = [index.get(value, []) for index, value in criteria if value is not None]
+        if not matches:
+            return list(self.questions)
+        
+        # Walk the shortest list and look the questions up in the others
+        matches.sort(key=len)
+        others = [set(map(id, questions)) for questions in matches[1:]]
+        return [question for question in matches[0] if all(id(question) in other for other in others)]
+    
+    def to_json(self):
+        return [question.to_json(self.language) for question in self.questions]
+    
+    def save(self, path):
+        """Write the bank as JSON, formatted like the bank files in app/assets"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, indent=2)
+
+
+@lru_cache(maxsize=None)
+def load_bank(language):
+    """The bank of a language from app/assets, read once per process (use from_file() to edit a bank)"""
+    return QuestionBank.from_file(QUESTION_FILES[language], language)
@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Synthetic telemetry for load testing the admin tools
+Generates tracking_events and error_reports rows shaped like database/tracking_events.sql and
+database/error_reports.sql, the way the app writes them: users with a platform and a heavy
+tailed activity level, sessions spread over the day, features with Zipfian popularity, and
+error reports that occur within sessions at a per-version rate. Rows are produced in chunks
+and streamed to CSV, Parquet, multi-row INSERT statements, or batched inserts into Supabase or
+the local database of admin_backends.py, so the volume is not limited by memory.
+"""
+import argparse
+import json
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from admin_backends import LocalClient, create_client
+
+# Features and actions as tracked by AnalyticsService.trackFeatureUsage in the app, most popular first
+FEATURES = [
+    'quiz_gameplay', 'lesson_system', 'streak_tracking', 'question_categories', 'settings', 'skip_question',
+    'biblical_references', 'power_ups', 'theme_selection', 'progressive_difficulty', 'retry_with_points',
+    'promo_cards', 'social_features', 'theme_purchases', 'onboarding', 'multiplayer_game',
+    'satisfaction_surveys', 'difficulty_feedback', 'language_settings', 'analytics_settings',
+    'ai_theme_generator', 'donation_system',
+]
+ACTIONS = {'accessed': 40, 'used': 25, 'completed': 12, 'attempted': 8, 'dismissed': 6, 'changed': 4,
+           'purchased': 2, 'unlocked': 1, 'enabled': 1, 'disabled': 1}
+PLATFORMS = {'android': 55, 'ios': 28, 'web': 9, 'windows': 4, 'macos': 2, 'linux': 2}
+VERSIONS = {'1.0.0': 5, '1.1.0': 15, '1.2.0': 35, '1.3.0': 45}
+ERROR_TYPES = {'network': 35, 'dataLoading': 20, 'storage': 15, 'sync': 10, 'api': 8, 'ai': 5,
+               'authentication': 4, 'unknown': 3}
+DEVICES = {
+    'android': ['Pixel 7 (Android 14)', 'Galaxy S23 (Android 14)', 'Galaxy A52 (Android 13)'],
+    'ios': ['iPhone 15 (iOS 17.4)', 'iPhone 12 (iOS 16.7)', 'iPad Air (iPadOS 17.3)'],
+    'web': ['Chrome 124', 'Firefox 125', 'Safari 17'],
+    'windows': ['Windows 11'], 'macos': ['macOS 14.4'], 'linux': ['Ubuntu 24.04'],
+}
+
+# Share of sessions per hour of day (UTC), peaking in the evening
+HOURLY_ACTIVITY = np.array([2, 1, 1, 1, 1, 2, 3, 5, 6, 6, 6, 6, 6, 6, 6, 6, 6, 7, 8, 9, 9, 8, 5, 3], dtype=float)
+
+# Error messages and the code they come from, per error type; {n}, {id} and {addr} vary per report
+ERROR_TEMPLATES = {
+    'network': [
+        ("SocketException: Failed host lookup: 'api.bijbelquiz.app' (OS Error: No address associated with "
+         "hostname, errno = {n})", 'services/connection_service.dart', 'ConnectionService.checkConnection'),
+        ("TimeoutException after 0:00:30.000000: request {id} timed out", 'services/sync_service.dart',
+         'SyncService.pushChanges'),
+    ],
+    'dataLoading': [
+        ("FormatException: Unexpected character (at offset {n})", 'services/question_loading_service.dart',
+         'QuestionLoadingService.loadQuestions'),
+        ("Question {id} has no correct answer", 'services/question_cache_service.dart',
+         'QuestionCacheService.getQuestion'),
+    ],
+    'storage': [
+        ("Failed to track event", 'services/analytics_service.dart', 'AnalyticsService.capture'),
+        ("FileSystemException: Cannot open file, path = '/data/user/0/app.bijbelquiz/files/{id}.json'",
+         'services/question_cache_service.dart', 'QuestionCacheService.persist'),
+    ],
+    'sync': [
+        ("Sync conflict on game_stats (local version {n})", 'services/sync_service_v2.dart',
+         'SyncServiceV2.resolveConflict'),
+    ],
+    'api': [
+        ("PostgrestException(message: JWT expired, code: PGRST301, details: Unauthorized)",
+         'services/store_service.dart', 'StoreService.loadItems'),
+    ],
+    'ai': [
+        ("Gemini request {id} failed: 429 Resource has been exhausted", 'services/gemini_service.dart',
+         'GeminiService.generateTheme'),
+    ],
+    'authentication': [
+        ("AuthException: Invalid Refresh Token: Refresh Token Not Found", 'services/sync_service.dart',
+         'SyncService.refreshSession'),
+    ],
+    'unknown': [
+        ("Null check operator used on a null value at 0x{addr}", 'screens/quiz_screen.dart',
+         '_QuizScreenState.build'),
+    ],
+}
+
+TRACKING_COLUMNS = ['id', 'user_id', 'event_type', 'event_name', 'properties', 'timestamp', 'screen_name',
+                    'session_id', 'device_info', 'app_version', 'build_number', 'platform']
+ERROR_COLUMNS = ['id', 'user_id', 'error_type', 'error_message', 'user_message', 'error_code', 'stack_trace',
+                 'context', 'question_id', 'additional_info', 'timestamp', 'device_info', 'app_version',
+                 'build_number']
+
+# Timestamps as written to text outputs: UTC ISO 8601 with microseconds
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f+00:00'
+
+
+def parse_mix(text):
+    """'android=55,ios=28' -> {'android': 55.0, 'ios': 28.0}"""
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.partition('=')
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def probabilities(weights):
+    weights = np.asarray(weights, dtype=float)
+    return weights / weights.sum()
+
+
+class TelemetryProfile:
+    """Scale and distributions of the generated telemetry.
+    
+    `events` tracking events and about `errors` error reports over the last `days` full days.
+    Feature popularity follows a Zipf law with exponent `zipf_exponent`; sessions have on
+    average `events_per_session` events about `seconds_between_events` apart. Error reports
+    of `regressed_version` are `regression_factor` times as frequent as those of other
+    versions, so the error rate regression check has something to find.
+    """
+    
+    def __init__(self, events=100000, errors=1000, days=30, users=None, zipf_exponent=1.1,
+                 events_per_session=12, seconds_between_events=20, platforms=None, versions=None,
+                 error_types=None, regressed_version=None, regression_factor=4.0, end=None):
+        self.events = events
+        self.errors = errors
+        self.days = days
+        self.users = users or max(100, events // 200)
+        self.zipf_exponent = zipf_exponent
+        self.events_per_session = events_per_session
+        self.seconds_between_events = seconds_between_events
+        self.platforms = platforms or PLATFORMS
+        self.versions = versions or VERSIONS
+        self.error_types = error_types or ERROR_TYPES
+        self.regressed_version = regressed_version
+        self.regression_factor = regression_factor
+        # Rows fall in the `days` full UTC days before `end`
+        end = end or datetime.now(timezone.utc)
+        self.start = end.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    
+    def feature_probabilities(self):
+        ranks = np.arange(1, len(FEATURES) + 1)
+        return probabilities(1.0 / ranks ** self.zipf_exponent)
+    
+    def error_rate_factors(self, versions):
+        """Relative error rate per version, scaled so the expected number of errors stays `errors`"""
+        factors = np.array([self.regression_factor if version == self.regressed_version else 1.0
+                            for version in versions])
+        return factors / (factors * probabilities(list(self.versions.values()))).sum()
+
+
+def random_ids(rng, count):
+    """Random version 4 UUIDs as text (formatted from one hex string, uuid.UUID is too slow per row)"""
+    data = rng.integers(0, 256, (count, 16), dtype=np.uint8)
+    data[:, 6] = (data[:, 6] & 0x0f) | 0x40
+    data[:, 8] = (data[:, 8] & 0x3f) | 0x80
+    text = data.tobytes().hex()
+    return [f'{text[i:i + 8]}-{text[i + 8:i + 12]}-{text[i + 12:i + 16]}-{text[i + 16:i + 20]}-{text[i + 20:i + 32]}'
+            for i in range(0, 32 * count, 32)]
+
+
+def generate(profile, seed=None, chunk_sessions=20000):
+    """Yield ('tracking_events' | 'error_reports', DataFrame) chunks until profile.events are generated"""
+    rng = np.random.default_rng(seed)
+    
+    platforms = list(profile.platforms)
+    versions = list(profile.versions)
+    error_types = list(profile.error_types)
+    feature_p = profile.feature_probabilities()
+    action_names = list(ACTIONS)
+    action_p = probabilities(list(ACTIONS.values()))
+    version_p = probabilities(list(profile.versions.values()))
+    error_type_p = probabilities(list(profile.error_types.values()))
+    hour_p = probabilities(HOURLY_ACTIVITY)
+    error_factors = profile.error_rate_factors(versions)
+    errors_per_event = profile.errors / profile.events if profile.events else 0
+    
+    # Users: a platform and device each, and a heavy tailed share of all sessions
+    user_ids = np.array(random_ids(rng, profile.users), dtype=object)
+    user_platform = rng.choice(len(platforms), profile.users, p=probabilities(list(profile.platforms.values())))
+    user_device = np.array([rng.choice(DEVICES.get(platforms[p], ['Unknown device'])) for p in user_platform],
+                           dtype=object)
+    user_p = probabilities(rng.pareto(1.2, profile.users) + 1)
+    
+    start = pd.Timestamp(profile.start).value / 1e9
+    remaining = profile.events
+    while remaining > 0:
+        # Sessions: who, when and how long
+        users = rng.choice(profile.users, chunk_sessions, p=user_p)
+        lengths = rng.geometric(1 / profile.events_per_session, chunk_sessions)
+        ends = np.cumsum(lengths)
+        if ends[-1] >= remaining:
+            count = int(np.searchsorted(ends, remaining)) + 1
+            users, lengths = users[:count], lengths[:count].copy()
+            lengths[-1] -= int(ends[count - 1] - remaining)
+        sessions = len(users)
+        total = int(lengths.sum())
+        
+        session_start = (start + rng.integers(0, profile.days, sessions) * 86400.0
+                         + rng.choice(24, sessions, p=hour_p) * 3600.0 + rng.uniform(0, 3600, sessions))
+        session_version = rng.choice(len(versions), sessions, p=version_p)
+        session_ids = np.array(random_ids(rng, sessions), dtype=object)
+        
+        # Events: offsets within their session from exponential gaps between events
+        session_index = np.repeat(np.arange(sessions), lengths)
+        gaps = rng.exponential(profile.seconds_between_events, total)
+        first = np.cumsum(lengths) - lengths
+        gaps[first] = 0
+        offsets = np.cumsum(gaps)
+        offsets -= np.repeat(offsets[first], lengths)
+        seconds = session_start[session_index] + offsets
+        
+        features = np.array(FEATURES, dtype=object)[rng.choice(len(FEATURES), total, p=feature_p)]
+        actions = np.array(action_names, dtype=object)[rng.choice(len(action_names), total, p=action_p)]
+        event_users = users[session_index]
+        event_platforms = np.array(platforms, dtype=object)[user_platform[event_users]]
+        event_versions = np.array(versions, dtype=object)[session_version[session_index]]
+        timestamps = pd.to_datetime(seconds, unit='s', utc=True)
+        event_sessions = session_ids[session_index]
+        
+        yield 'tracking_events', pd.DataFrame({
+            'id': random_ids(rng, total),
+            'user_id': user_ids[event_users],
+            'event_type': actions,
+            'event_name': features,
+            # The same keys trackFeatureUsage sends; the values need no JSON escaping
+            'properties': [f'{{"feature": "{feature}", "action": "{action}", "session_id": "{session}", '
+                           f'"platform": "{platform}"}}'
+                           for feature, action, session, platform in
+                           zip(features, actions, event_sessions, event_platforms)],
+            'timestamp': timestamps,
+            'screen_name': None,
+            'session_id': event_sessions,
+            'device_info': user_device[event_users],
+            'app_version': event_versions,
+            'build_number': [version.replace('.', '') for version in event_versions],
+            'platform': event_platforms,
+        }, columns=TRACKING_COLUMNS)
+        
+        # Error reports: a Poisson number per session, proportional to its length and version
+        error_counts = rng.poisson(errors_per_event * lengths * error_factors[session_version])
+        if error_counts.sum():
+            yield 'error_reports', error_reports(rng, profile, error_types, error_type_p, error_counts,
+                                                 session_start, lengths, user_ids[users], user_device[users],
+                                                 np.array(versions, dtype=object)[session_version])
+        
+        remaining -= total
+
+
+def error_reports(rng, profile, error_types, error_type_p, counts, session_start, lengths, users, devices,
+                  versions):
+    """Error reports for sessions, `counts[i]` of them at random moments in session i"""
+    total = int(counts.sum())
+    session_index = np.repeat(np.arange(len(counts)), counts)
+    duration = lengths[session_index] * profile.seconds_between_events
+    seconds = session_start[session_index] + rng.uniform(0, 1, total) * duration
+    
+    types = rng.choice(len(error_types), total, p=error_type_p)
+    messages, stacks = [], []
+    for error_type in types:
+        templates = ERROR_TEMPLATES.get(error_types[error_type], ERROR_TEMPLATES['unknown'])
+        message, source, method = templates[rng.integers(len(templates))]
+        messages.append(message.format(n=rng.integers(1, 100000), id=uuid.UUID(bytes=rng.bytes(16), version=4),
+                                       addr=f'{rng.integers(1 << 32):08x}'))
+        line, column = rng.integers(20, 400), rng.integers(5, 40)
+        stacks.append(f"#0      {method} (package:bijbelquiz/{source}:{line}:{column})\n"
+                      f"#1      _rootRunUnary (dart:async/zone.dart:1407:47)\n"
+                      f"#2      _CustomZone.runUnary (dart:async/zone.dart:1308:19)")
+    
+    type_names = np.array(error_types, dtype=object)[types]
+    version_values = versions[session_index]
+    return pd.DataFrame({
+        'id': random_ids(rng, total),
+        'user_id': users[session_index],
+        'error_type': [f'AppErrorType.{error_type}' for error_type in type_names],
+        'error_message': messages,
+        'user_message': 'Er is iets misgegaan. Probeer het later opnieuw.',
+        'error_code': None,
+        'stack_trace': stacks,
+        'context': None,
+        'question_id': [f'{rng.integers(1, 2000):03d}' if error_type == 'dataLoading' else None
+                        for error_type in type_names],
+        'additional_info': None,
+        'timestamp': pd.to_datetime(seconds, unit='s', utc=True),
+        'device_info': devices[session_index],
+        'app_version': version_values,
+        'build_number': [version.replace('.', '') for version in version_values],
+    }, columns=ERROR_COLUMNS)
+
+
+def text_timestamps(frame):
+    """A copy of a chunk with the timestamp as text, for outputs without a timestamp type"""
+    return frame.assign(timestamp=frame['timestamp'].dt.strftime(TIMESTAMP_FORMAT))
+
+
+def sql_literal(value):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return 'NULL'
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class TelemetryWriter:
+    """Streams generated chunks to files in an output directory, one file per table"""
+    
+    extension = None
+    
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.files = {}
+    
+    def path(self, table):
+        return self.directory / f'{table}.{self.extension}'
+    
+    def write(self, table, frame):
+        raise NotImplementedError
+    
+    def close(self):
+        for file in self.files.values():
+            file.close()
+
+
+class CsvWriter(TelemetryWriter):
+    extension = 'csv'
+    
+    def write(self, table, frame):
+        header = table not in self.files
+        if header:
+            self.files[table] = open(self.path(table), 'w', encoding='utf-8', newline='')
+        text_timestamps(frame).to_csv(self.files[table], header=header, index=False)
+
+
+class ParquetWriter(TelemetryWriter):
+    """One row group per chunk; timestamps keep their type"""
+    
+    extension = 'parquet'
+    
+    def write(self, table, frame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        batch = pa.Table.from_pandas(frame, preserve_index=False)
+        if table not in self.files:
+            self.files[table] = pq.ParquetWriter(self.path(table), batch.schema)
+        self.files[table].write_table(batch)
+
+
+class SqlWriter(TelemetryWriter):
+    """Multi-row INSERT statements of `batch_size` rows, for psql or the Supabase SQL editor"""
+    
+    extension = 'sql'
+    
+    def __init__(self, directory, batch_size=1000):
+        super().__init__(directory)
+        self.batch_size = batch_size
+    
+    def write(self, table, frame):
+        if table not in self.files:
+            self.files[table] = open(self.path(table), 'w', encoding='utf-8')
+        file = self.files[table]
+        frame = text_timestamps(frame).astype(object).where(frame.notna(), None)
+        columns = ', '.join(frame.columns)
+        for start in range(0, len(frame), self.batch_size):
+            rows = frame.iloc[start:start + self.batch_size].itertuples(index=False, name=None)
+            values = ',\n'.join('(' + ', '.join(sql_literal(value) for value in row) + ')' for row in rows)
+            file.write(f"INSERT INTO {table} ({columns}) VALUES\n{values}\nON CONFLICT (id) DO NOTHING;\n")
+
+
+class InsertWriter:
+    """Batched inserts through a Supabase client or LocalClient"""
+    
+    def __init__(self, client, batch_size=1000):
+        self.client = client
+        self.batch_size = batch_size
+    
+    def write(self, table, frame):
+        frame = text_timestamps(frame).astype(object).where(frame.notna(), None)
+        if isinstance(self.client, LocalClient):
+            self.client.insert_rows(table, list(frame.columns), frame.itertuples(index=False, name=None))
+            return
+        
+        if 'properties' in frame:
+            frame['properties'] = [json.loads(value) for value in frame['properties']]
+        records = frame.to_dict('records')
+        for start in range(0, len(records), self.batch_size):
+            self.client.table(table).insert(records[start:start + self.batch_size]).execute()
+    
+    def close(self):
+        if isinstance(self.client, LocalClient):
+            # Supabase groups the reports in a trigger; the local database has to be told
+            self.client.rebuild_error_groups()
+
+
+def write_telemetry(profile, writer, seed=None, progress=None):
+    """Generate the profile's telemetry into a writer; returns the number of rows per table"""
+    written = {'tracking_events': 0, 'error_reports': 0}
+    try:
+        for table, frame in generate(profile, seed):
+            writer.write(table, frame)
+            written[table] += len(frame)
+            if progress:
+                progress(written)
+    finally:
+        writer.close()
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic tracking events and error reports")
+    parser.add_argument('--events', type=int, default=100000, help="Number of tracking events")
+    parser.add_argument('--errors', type=int, default=1000, help="Approximate number of error reports")
+    parser.add_argument('--days', type=int, default=30, help="Spread the rows over the last N days")
+    parser.add_argument('--users', type=int, help="Number of users (default: one per 200 events)")
+    parser.add_argument('--zipf', type=float, default=1.1, help="Zipf exponent of feature popularity")
+    parser.add_argument('--events-per-session', type=float, default=12, help="Average session length in events")
+    parser.add_argument('--platforms', type=parse_mix, help="Platform mix of the users, e.g. android=55,ios=30,web=15")
+    parser.add_argument('--versions', type=parse_mix, help="App version mix, e.g. 1.2.0=40,1.3.0=60")
+    parser.add_argument('--error-types', type=parse_mix, help="Error type mix, e.g. network=50,sync=50")
+    parser.add_argument('--regressed-version', help="App version with an elevated error rate")
+    parser.add_argument('--regression-factor', type=float, default=4.0, help="Error rate multiplier of that version")
+    parser.add_argument('--seed', type=int, help="Random seed, for reproducible data")
+    parser.add_argument('--format', choices=['csv', 'parquet', 'sql', 'insert'], default='csv',
+                        help="Files per table, or batched inserts into the database")
+    parser.add_argument('--output', '-o', default='synthetic_telemetry', help="Output directory for files")
+    parser.add_argument('--database', help="With --format insert: local SQLite database instead of Supabase")
+    parser.add_argument('--batch-size', type=int, default=1000, help="Rows per INSERT statement or request")
+    args = parser.parse_args()
+    
+    profile = TelemetryProfile(
+        events=args.events, errors=args.errors, days=args.days, users=args.users, zipf_exponent=args.zipf,
+        events_per_session=args.events_per_session, platforms=args.platforms, versions=args.versions,
+        error_types=args.error_types, regressed_version=args.regressed_version,
+        regression_factor=args.regression_factor,
+    )
+    
+    if args.format == 'insert':
+        writer = InsertWriter(create_client(args.database), args.batch_size)
+    elif args.format == 'sql':
+        writer = SqlWriter(args.output, args.batch_size)
+    else:
+        writer = {'csv': CsvWriter, 'parquet': ParquetWriter}[args.format](args.output)
+    
+    written = write_telemetry(profile, writer, args.seed, progress=lambda written: print(
+        f"\r{written['tracking_events']} events, {written['error_reports']} error reports", end='', file=sys.stderr))
+    print(file=sys.stderr)
+    print(json.dumps(written))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
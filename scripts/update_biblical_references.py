@@ -6,7 +6,9 @@ This script maps old biblical book names to the new normalized versions.
 
 import json
 import re
-from typing import Dict, List, Optional
+from typing import Optional
+
+from questionbank import QuestionBank
 
 class BiblicalReferenceUpdater:
     """Updates biblical references to use normalized book names."""
@@ -72,17 +74,17 @@ class BiblicalReferenceUpdater:
         # Create reverse mapping for faster lookups
         self._reverse_mapping = {v: k for k, v in self.BOOK_NAME_MAPPING.items()}
     
-    def update_biblical_references(self, questions: List[Dict]) -> List[Dict]:
-        """Update all biblical references in the questions list."""
+    def update_biblical_references(self, questions: QuestionBank) -> QuestionBank:
+        """Update all biblical references in the question bank."""
         updated_count = 0
         
         for question in questions:
-            if 'biblicalReference' in question and question['biblicalReference']:
-                old_reference = question['biblicalReference']
+            if question.biblical_reference:
+                old_reference = question.biblical_reference
                 new_reference = self.update_reference_string(old_reference)
                 
                 if new_reference != old_reference:
-                    question['biblicalReference'] = new_reference
+                    question.biblical_reference = new_reference
                     updated_count += 1
                     print(f"Updated: {old_reference} → {new_reference}")
         
@@ -164,14 +166,12 @@ class BiblicalReferenceUpdater:
         
         # Load the JSON file
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                questions = json.load(f)
+            questions = QuestionBank.from_file(file_path, 'nl')
         except FileNotFoundError:
             raise Exception(f"File not found: {file_path}")
         except json.JSONDecodeError as e:
             raise Exception(f"Invalid JSON in {file_path}: {e}")
-        
-        if not isinstance(questions, list):
+        except ValueError:
             raise Exception("Expected questions to be a list")
         
         print(f"Loaded {len(questions)} questions")
@@ -180,8 +180,7 @@ class BiblicalReferenceUpdater:
         if backup:
             backup_path = f"{file_path}.backup"
             print(f"Creating backup: {backup_path}")
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(questions, f, ensure_ascii=False, indent=2)
+            questions.save(backup_path)
         
         # Update references
         updated_questions, updated_count = self.update_biblical_references(questions)
@@ -189,8 +188,7 @@ class BiblicalReferenceUpdater:
         if updated_count > 0:
             # Write updated questions back to file
             print(f"Writing {len(updated_questions)} updated questions to: {file_path}")
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(updated_questions, f, ensure_ascii=False, indent=2)
+            updated_questions.save(file_path)
             
             print(f"✅ Successfully updated {updated_count} biblical references")
         else: